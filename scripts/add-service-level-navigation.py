@@ -4,138 +4,26 @@ Add top-level service groupings to organize API categories.
 Groups 61+ categories into logical service sections for better navigation.
 """
 
-import json
-from pathlib import Path
+import argparse
+from typing import Dict, List
+
+from docs_paths import DOCS_DIR, DOCS_JSON
+from endpoint_classification import OTHER_SERVICE, SERVICE_GROUPS, service_for_group
+from output_writer import write_json_if_changed
+from stage_profiler import PROFILER, add_profile_arguments
 
 # Configuration
-DOCS_JSON = Path("docs/docs.json")
-BACKUP_JSON = Path("docs/docs.json.backup")
-
-# Top-level service groupings
-SERVICE_GROUPS = {
-    "Core Services": [
-        "Access Control",
-        "Camera",
-        "Door",
-        "Door Controller",
-        "Doorbell Camera",
-        "User",
-        "Users",
-        "Badge Reader",
-        "Sensor",
-        "Climate",
-        "Button",
-        "Relay",
-        "Media Device",
-    ],
-    "Events & Monitoring": [
-        "Event",
-        "Events",
-        "Event Search",
-        "Alert Monitoring",
-        "Face Recognition Event",
-        "Face Recognition Matchmaker",
-        "Face Recognition Person",
-        "Proximity",
-        "Occupancy",
-    ],
-    "Integrations": [
-        "Access Control Integrations",
-        "Service Management Integrations",
-        "Incident Management Integrations",
-        "IoT Integrations",
-        "Storage Integrations",
-        "Webhook Integrations",
-        "Org Integrations",
-        "Integrations",
-    ],
-    "Organization & Management": [
-        "Organization",
-        "Org",
-        "Location",
-        "Locations",
-        "Customer",
-        "Partner",
-        "License",
-        "Permission",
-        "User Metadata",
-    ],
-    "Security & Access": [
-        "OAuth",
-        "Alarm Monitoring Keypad",
-        "Guest Management Kiosk",
-        "Lockdown Plan",
-        "RapidSOS",
-    ],
-    "Media & Video": [
-        "Video",
-        "Export",
-        "AudioGateway",
-        "AudioPlayback",
-        "TvOS Config",
-    ],
-    "Automation & Rules": [
-        "Rules",
-        "Rules Records",
-        "Schedule",
-        "Policies",
-        "Policy",
-    ],
-    "Device Management": [
-        "Device Config",
-        "Component",
-        "Components",
-        "BLE",
-    ],
-    "Data & Reporting": [
-        "Report",
-        "Reports",
-        "Search",
-        "Logistics",
-        "Vehicle",
-        "Vehicles",
-    ],
-    "Developer & System": [
-        "Developer",
-        "Feature",
-        "Help",
-        "Upload",
-    ],
-}
+BACKUP_JSON = DOCS_DIR / "docs.json.backup"
 
 def categorize_group(group_name: str) -> str:
     """Determine which service category a group belongs to."""
-    for service, groups in SERVICE_GROUPS.items():
-        if group_name in groups:
-            return service
-    return "Other Services"
-
-def organize_with_service_groups():
-    """Add top-level service groupings to the API reference navigation."""
-    print("🎯 Adding top-level service groupings...\n")
-
-    # Backup existing docs.json
-    with open(DOCS_JSON, 'r') as f:
-        docs_data = json.load(f)
-
-    with open(BACKUP_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
-    print(f"✅ Backed up docs.json to {BACKUP_JSON}")
-
-    # Find the API reference tab
-    api_tab = None
-    for tab in docs_data['navigation']['tabs']:
-        if tab['tab'] == 'API reference':
-            api_tab = tab
-            break
-
-    if not api_tab:
-        print("❌ Could not find 'API reference' tab in docs.json")
-        return
+    return service_for_group(group_name)
 
+def build_service_groups(api_groups: List[Dict]) -> List[Dict]:
+    """Nest API reference categories under their top-level service groups."""
     # Keep the introduction group separate
-    intro_group = api_tab['groups'][0]
-    existing_groups = api_tab['groups'][1:]
+    intro_group = api_groups[0]
+    existing_groups = api_groups[1:]
 
     # Organize groups into service categories
     service_structure = {}
@@ -145,7 +33,7 @@ def organize_with_service_groups():
         group_name = group['group']
         service = categorize_group(group_name)
 
-        if service == "Other Services":
+        if service == OTHER_SERVICE:
             uncategorized.append(group)
         else:
             if service not in service_structure:
@@ -170,21 +58,44 @@ def organize_with_service_groups():
     # Add any uncategorized groups at the end
     if uncategorized:
         other_service_group = {
-            "group": "Other Services",
+            "group": OTHER_SERVICE,
             "pages": uncategorized
         }
         new_groups.append(other_service_group)
 
+    return new_groups
+
+def organize_with_service_groups():
+    """Add top-level service groupings to the API reference navigation."""
+    print("🎯 Adding top-level service groupings...\n")
+
+    docs_data = PROFILER.load_json(DOCS_JSON)
+
+    # Find the API reference tab
+    api_tab = None
+    for tab in docs_data['navigation']['tabs']:
+        if tab['tab'] == 'API reference':
+            api_tab = tab
+            break
+
+    if not api_tab:
+        print("❌ Could not find 'API reference' tab in docs.json")
+        return
+
     # Update the API reference groups
+    new_groups = build_service_groups(api_tab['groups'])
     api_tab['groups'] = new_groups
 
-    # Write updated docs.json
-    with open(DOCS_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
-
-    print(f"✅ Updated navigation with service-level groupings")
+    # Write updated docs.json, backing up the previous version if it changed
+    if write_json_if_changed(DOCS_JSON, docs_data, backup=BACKUP_JSON, indent=2):
+        print(f"✅ Backed up docs.json to {BACKUP_JSON}")
+        print(f"✅ Updated navigation with service-level groupings")
+    else:
+        print(f"✅ Navigation already uses service-level groupings")
+    print_service_summary(new_groups)
 
-    # Show summary
+def print_service_summary(new_groups: List[Dict]):
+    """Print a summary of the service-level navigation structure."""
     print(f"\n📊 Service-level navigation structure:")
     print(f"   Total service groups: {len([g for g in new_groups if g['group'] != 'API documentation'])}")
 
@@ -211,9 +122,14 @@ def organize_with_service_groups():
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_profile_arguments(parser)
+    PROFILER.configure(parser.parse_args(), "add-service-level-navigation")
+
     print("🔨 Adding service-level navigation groupings\n")
 
-    organize_with_service_groups()
+    with PROFILER.stage("service-groups"):
+        organize_with_service_groups()
 
     print("\n🎉 Service-level navigation complete!")
     print("\n💡 Next steps:")
@@ -221,5 +137,7 @@ def main():
     print("   2. Navigation now has 3 levels: Service → Category → Action Type")
     print("   3. If there are issues, restore from docs.json.backup")
 
+    PROFILER.finish()
+
 if __name__ == "__main__":
     main()
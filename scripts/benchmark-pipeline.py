@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark the docs generation pipeline on synthetic OpenAPI specs.
+Builds a throwaway project per spec size, runs every stage in a fresh process and
+records wall time and peak memory, taking the median over repeated runs. Results are
+written as JSON and can be compared against a stored baseline with a regression
+threshold. Runs fully offline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import runpy
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from synthetic_openapi import write_spec
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DOCS_TEMPLATE = SCRIPTS_DIR.parent / "docs.json"
+
+# (stage name, script, arguments) in pipeline order
+STAGES = [
+    ("split", "split-openapi.py", []),
+    ("generate", "generate-endpoint-docs.py", []),
+    ("update-navigation", "update-docs-navigation.py", []),
+    ("improve-navigation", "improve-endpoint-navigation.py", []),
+    ("service-navigation", "add-service-level-navigation.py", []),
+    ("llms", "update-llms-files.py", []),
+]
+
+# Workspace layouts: docs.json at the top of the tree (as in this repository), or in a
+# docs/ directory below the directory the scripts run from
+LAYOUTS = ("flat", "nested")
+
+# Differences below these floors are treated as noise, not regressions; the time floor
+# also scales with the whole pipeline, since sub-second stages jitter by tens of percent
+MIN_SECONDS_DELTA = 0.1
+MIN_TOTAL_SECONDS_FRACTION = 0.05
+MIN_MEMORY_DELTA_KB = 2048
+
+
+def run_stage_in_process(script: str, args: List[str], report_file: str, trace_memory: bool):
+    """Run one pipeline script in this process and write its resource usage."""
+    import resource
+    import tracemalloc
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    sys.argv = [script] + args
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    try:
+        runpy.run_path(str(SCRIPTS_DIR / script), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise
+    seconds = time.perf_counter() - start
+
+    report = {
+        "seconds": round(seconds, 4),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    if trace_memory:
+        report["tracemalloc_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+    with open(report_file, 'w') as f:
+        json.dump(report, f)
+
+
+def build_workspace(root: Path, layout: str, operations: int, tags: int, schemas: int, depth: int,
+                    seed: int) -> Path:
+    """Create a project skeleton with a synthetic spec and return its docs directory."""
+    docs = root / "docs" if layout == "nested" else root
+    (docs / "api-reference").mkdir(parents=True)
+    shutil.copyfile(DOCS_TEMPLATE, docs / "docs.json")
+    with open(docs / "api-reference" / "openapi.json", 'w') as f:
+        write_spec(f, operations, tags, schemas, depth, seed)
+    return docs
+
+
+def run_pipeline(root: Path, trace_memory: bool, verbose: bool = True) -> Dict[str, Dict]:
+    """Run every stage from ``root`` and collect its measurements."""
+    results = {}
+    for name, script, args in STAGES:
+        report_file = root / f".bench-{name}.json"
+        command = [sys.executable, str(Path(__file__).resolve()), "--run-stage", script,
+                   "--report", str(report_file)]
+        if trace_memory:
+            command.append("--trace-memory")
+        start = time.perf_counter()
+        subprocess.run(command + ["--"] + args, cwd=root, check=True,
+                       stdout=subprocess.DEVNULL)
+        wall = time.perf_counter() - start
+
+        with open(report_file, 'r') as f:
+            report = json.load(f)
+        report["wall_seconds"] = round(wall, 4)
+        results[name] = report
+        if verbose:
+            print(f"   {name:<20} {report['seconds']:>8.3f}s  {report['max_rss_kb'] / 1024:>8.1f} MB")
+    return results
+
+
+def median_runs(runs: List[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """Per stage, the median of every metric over ``runs``, plus the individual timings."""
+    stages = {}
+    for name in runs[0]:
+        samples = [run[name] for run in runs]
+        stages[name] = {metric: round(statistics.median(sample[metric] for sample in samples), 4)
+                        for metric in samples[0]}
+        stages[name]["runs"] = [sample["seconds"] for sample in samples]
+    return stages
+
+
+def benchmark(layout: str, size: int, args: argparse.Namespace) -> Dict[str, Dict]:
+    """Run the pipeline ``args.repeat`` times on fresh workspaces and keep the medians."""
+    runs = []
+    spec_size = 0
+    for attempt in range(args.repeat):
+        root = Path(tempfile.mkdtemp(prefix=f"docs-bench-{size}-{layout}-"))
+        try:
+            print(f"📦 {size} operations, {layout} layout, run {attempt + 1}/{args.repeat} ({root})")
+            docs = build_workspace(root, layout, size, args.tags, args.schemas, args.schema_depth, args.seed)
+            spec_size = (docs / "api-reference" / "openapi.json").stat().st_size
+            runs.append(run_pipeline(root, args.trace_memory, verbose=args.repeat == 1))
+        finally:
+            if not args.keep:
+                shutil.rmtree(root, ignore_errors=True)
+
+    stages = median_runs(runs)
+    if args.repeat > 1:
+        for name, report in stages.items():
+            print(f"   {name:<20} {report['seconds']:>8.3f}s  {report['max_rss_kb'] / 1024:>8.1f} MB"
+                  f"  (median of {args.repeat}, {min(report['runs']):.3f}-{max(report['runs']):.3f}s)")
+    stages["_spec"] = {"bytes": spec_size}
+    return stages
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """List every stage whose time or memory regressed beyond ``threshold``."""
+    regressions = []
+    checks = [("max_rss_kb", MIN_MEMORY_DELTA_KB)]
+    # tracemalloc slows every stage down, so timings are only comparable between like runs
+    if results["meta"].get("trace_memory", False) == baseline.get("meta", {}).get("trace_memory", False):
+        checks.append(("seconds", MIN_SECONDS_DELTA))
+    else:
+        print("⚠️  Baseline used a different --trace-memory setting; comparing memory only")
+
+    for size, stages in results["results"].items():
+        previous_stages = baseline.get("results", {}).get(size, {})
+        total = sum(stage.get("seconds", 0) for stage in previous_stages.values())
+        for stage, current in stages.items():
+            previous = previous_stages.get(stage)
+            if not previous:
+                continue
+            for metric, floor in checks:
+                before, after = previous.get(metric), current.get(metric)
+                if before is None or after is None:
+                    continue
+                if metric == "seconds":
+                    floor = max(floor, total * MIN_TOTAL_SECONDS_FRACTION)
+                if after - before > max(before * threshold, floor):
+                    regressions.append(
+                        f"{stage} @ {size} ops: {metric} {before} -> {after} "
+                        f"(+{(after - before) / max(before, 1e-9):.0%})"
+                    )
+    return regressions
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark the docs pipeline on synthetic specs")
+    parser.add_argument('--sizes', default="1000,10000",
+                        help='Comma-separated operation counts (e.g. 1000,10000,100000)')
+    parser.add_argument('--tags', type=int, default=60, help='Number of tags / categories')
+    parser.add_argument('--schemas', type=int, default=500, help='Number of component schemas')
+    parser.add_argument('--schema-depth', type=int, default=4, help='Levels of nested schema references')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--layout', choices=LAYOUTS + ("both",), default="flat",
+                        help='flat: docs.json at the top of the tree, as in this repository; '
+                             'nested: under docs/; both: benchmark each (nested results get a -nested suffix)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per size on fresh workspaces; each stage reports the median')
+    parser.add_argument('--output', type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument('--baseline', type=Path, help='Previous results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative slowdown or memory growth before failing')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Also record tracemalloc peaks (slows every stage down)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated workspaces')
+    parser.add_argument('--run-stage', help=argparse.SUPPRESS)
+    parser.add_argument('--report', help=argparse.SUPPRESS)
+    parser.add_argument('stage_args', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_stage:
+        run_stage_in_process(args.run_stage, args.stage_args, args.report, args.trace_memory)
+        return 0
+
+    print("⏱️  Benchmarking docs pipeline on synthetic specs\n")
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "tags": args.tags,
+            "schemas": args.schemas,
+            "schema_depth": args.schema_depth,
+            "seed": args.seed,
+            "trace_memory": args.trace_memory,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    layouts = LAYOUTS if args.layout == "both" else (args.layout,)
+    for size in [int(s) for s in args.sizes.split(',') if s.strip()]:
+        for layout in layouts:
+            key = str(size) if layout == "flat" else f"{size}-{layout}"
+            results["results"][key] = benchmark(layout, size, args)
+            print()
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Run the docs pipeline as a content-addressed stage graph with a build cache.
+Stages and their input/output file sets come from pipeline_stages.py, and the graph is
+derived from which stage writes what another reads. A stage is skipped when the hash of
+its inputs (file contents plus the pipeline scripts) and of its outputs matches the
+last successful run; independent stages run concurrently. Ends with an execution summary.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from docs_paths import DOCS_DIR
+from output_writer import write_json_if_changed
+from pipeline_stages import (SCRIPTS_DIR, STAGE_NAMES, Stage, dependencies, has_wildcard, path_matches,
+                             run_stage, select_stages)
+
+# Configuration
+CACHE_FILE = DOCS_DIR / ".cache" / "build-cache.json"
+CACHE_VERSION = 1
+# Fetching needs the network and linting fails on pre-existing problems, so both are opt-in
+DEFAULT_STAGES = ["split", "generate", "navigation", "llms", "search", "lookup"]
+SKIP_DIRS = {".git", "node_modules", "__pycache__"}
+FAILURE_TAIL_LINES = 20
+
+
+class BuildCache:
+    """Digests of files (reused while their size and mtime are unchanged) and per-stage records."""
+
+    def __init__(self, path: Path, enabled: bool = True):
+        self.path = path
+        self.files: Dict[str, List] = {}
+        self.stages: Dict[str, Dict] = {}
+        self.hashed_bytes = 0
+        if enabled and path.exists():
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self.files = data.get('files', {})
+                    self.stages = data.get('stages', {})
+            except (OSError, ValueError):
+                pass
+
+    def file_digest(self, relative: str, stat: os.stat_result) -> str:
+        cached = self.files.get(relative)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(DOCS_DIR / relative, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.hashed_bytes += stat.st_size
+        self.files[relative] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+        return self.files[relative][2]
+
+    def digest(self, patterns: Sequence[str], salt: str = "") -> Tuple[str, int]:
+        """Hash of every file under ``patterns`` by path and content, and how many files there were."""
+        digest = hashlib.sha256(salt.encode('utf-8'))
+        count = 0
+        for relative, stat in sorted(iter_files(patterns)):
+            digest.update(f"{relative}\0{self.file_digest(relative, stat)}\n".encode('utf-8'))
+            count += 1
+        return digest.hexdigest(), count
+
+    def save(self):
+        """Persist the cache, dropping digests of files that no longer exist."""
+        self.files = {path: entry for path, entry in self.files.items() if (DOCS_DIR / path).is_file()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_if_changed(self.path, {"version": CACHE_VERSION, "files": self.files, "stages": self.stages},
+                              separators=(',', ':'), sort_keys=True)
+
+
+def iter_files(patterns: Sequence[str]) -> Iterator[Tuple[str, os.stat_result]]:
+    """``(docs-relative path, stat)`` of every file under ``patterns``, each once."""
+    seen = set()
+    for pattern in patterns:
+        if has_wildcard(pattern):
+            roots = [entry.name for entry in os.scandir(DOCS_DIR)
+                     if entry.is_file() and path_matches(entry.name, pattern)]
+        else:
+            roots = [pattern.rstrip('/')]
+        pending = list(roots)
+        while pending:
+            relative = pending.pop()
+            try:
+                stat = os.stat(DOCS_DIR / relative)
+            except OSError:
+                continue
+            if os.path.isdir(DOCS_DIR / relative):
+                # Hidden entries are scratch space (staging directories, temp files)
+                pending.extend(f"{relative}/{name}" for name in os.listdir(DOCS_DIR / relative)
+                               if not name.startswith('.') and name not in SKIP_DIRS)
+            elif relative not in seen:
+                seen.add(relative)
+                yield relative, stat
+
+
+def toolchain_digest() -> str:
+    """Hash of every pipeline script, so editing a script invalidates the cache."""
+    digest = hashlib.sha256()
+    for path in sorted(SCRIPTS_DIR.glob("*.py")):
+        digest.update(path.name.encode('utf-8') + b'\0' + path.read_bytes())
+    return digest.hexdigest()
+
+
+class BuildRunner:
+    """Schedules stages once their upstream stages finish, at most ``jobs`` at a time."""
+
+    def __init__(self, stages: List[Stage], cache: BuildCache, force: bool, jobs: int, verbose: bool):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = [stage.name for stage in stages]
+        self.upstream = dependencies(stages)
+        self.cache = cache
+        self.force = force
+        self.jobs = jobs
+        self.verbose = verbose
+        self.toolchain = toolchain_digest()
+        self.results: Dict[str, Dict] = {}
+
+    def _input_key(self, stage: Stage) -> Tuple[Optional[str], int]:
+        if not stage.inputs:
+            return None, 0
+        salt = f"{self.toolchain}\0{stage.script}\0{' '.join(stage.args)}"
+        return self.cache.digest(stage.inputs, salt)
+
+    def _cached(self, stage: Stage, inputs: Optional[str]) -> bool:
+        record = self.cache.stages.get(stage.name)
+        if self.force or inputs is None or not record or record.get('inputs') != inputs:
+            return False
+        # Outputs edited or deleted since the recorded run are rebuilt
+        return self.cache.digest(stage.outputs)[0] == record.get('outputs')
+
+    def _finish(self, stage: Stage, inputs: Optional[str], ok: bool, seconds: float, output: str):
+        if not ok:
+            self.cache.stages.pop(stage.name, None)
+            self.results[stage.name].update(status="failed", seconds=seconds, output=output)
+            return
+        record = {"outputs": self.cache.digest(stage.outputs)[0], "seconds": round(seconds, 3)}
+        if inputs is not None:
+            # Re-hash the inputs: a stage may rewrite files it also reads (docs.json)
+            record["inputs"] = self._input_key(stage)[0]
+        self.cache.stages[stage.name] = record
+        self.results[stage.name].update(status="ran", seconds=seconds)
+
+    def run(self, dry_run: bool = False) -> Dict[str, Dict]:
+        pending = list(self.order)
+        running: Dict[Future, Tuple[Stage, Optional[str]]] = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    blockers = self.upstream[name] & set(pending) | {
+                        s.name for s, _ in running.values() if s.name in self.upstream[name]}
+                    if blockers or len(running) >= self.jobs:
+                        continue
+                    pending.remove(name)
+                    stage = self.stages[name]
+                    failed = [up for up in self.upstream[name]
+                              if self.results.get(up, {}).get('status') in ("failed", "blocked")]
+                    if failed:
+                        self.results[name] = {"status": "blocked", "seconds": 0.0, "files": 0,
+                                              "reason": f"{', '.join(sorted(failed))} failed"}
+                        continue
+                    inputs, files = self._input_key(stage)
+                    self.results[name] = {"files": files, "seconds": 0.0}
+                    if self._cached(stage, inputs):
+                        self.results[name]["status"] = "cached"
+                        print(f"   💾 {name:<11} up to date ({files} input files)")
+                        continue
+                    if dry_run:
+                        self.results[name]["status"] = "would run"
+                        print(f"   📝 {name:<11} would run")
+                        continue
+                    print(f"   ▶ {name:<11} started")
+                    future = pool.submit(run_stage, stage, (), not self.verbose)
+                    running[future] = (stage, inputs)
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, inputs = running.pop(future)
+                    ok, seconds, output = future.result()
+                    self._finish(stage, inputs, ok, seconds, output)
+                    print(f"   {'✅' if ok else '❌'} {stage.name:<11} {'finished' if ok else 'failed'} in {seconds:.2f}s")
+
+        # Later stages may rewrite earlier outputs (navigation patches endpoint page icons),
+        # so record every output set as the build left it
+        for name, result in self.results.items():
+            if result.get('status') in ("ran", "cached") and name in self.cache.stages:
+                self.cache.stages[name]['outputs'] = self.cache.digest(self.stages[name].outputs)[0]
+        return self.results
+
+
+def print_summary(runner: BuildRunner, elapsed: float):
+    icons = {"ran": "✅ ran", "cached": "💾 cache hit", "failed": "❌ failed",
+             "blocked": "⏭️  blocked", "would run": "📝 would run"}
+    print(f"\n📊 Execution summary\n")
+    print(f"   {'stage':<11} {'status':<14} {'time':>8}  {'inputs':>7}  depends on")
+    for name in runner.order:
+        result = runner.results.get(name, {})
+        upstream = ", ".join(n for n in runner.order if n in runner.upstream[name]) or "-"
+        print(f"   {name:<11} {icons.get(result.get('status'), '?'):<14} {result.get('seconds', 0):>7.2f}s  "
+              f"{result.get('files', 0):>7}  {upstream}")
+    statuses = [result.get('status') for result in runner.results.values()]
+    busy = sum(result.get('seconds', 0) for result in runner.results.values())
+    print(f"\n   {statuses.count('cached')} cache hit(s), {statuses.count('ran')} ran, "
+          f"{statuses.count('failed')} failed, {statuses.count('blocked')} blocked")
+    print(f"   ⏱️  {elapsed:.2f}s wall for {busy:.2f}s of stage time; "
+          f"hashed {runner.cache.hashed_bytes / (1 << 20):.1f} MB of changed files")
+
+    for name in runner.order:
+        result = runner.results.get(name, {})
+        if result.get('status') == "failed" and result.get('output'):
+            print(f"\n❌ {name} output (last {FAILURE_TAIL_LINES} lines):")
+            for line in result['output'].rstrip().splitlines()[-FAILURE_TAIL_LINES:]:
+                print(f"     {line}")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stages', nargs='+', choices=STAGE_NAMES, default=DEFAULT_STAGES,
+                        help=f'Stages to run (default: {" ".join(DEFAULT_STAGES)}); add fetch and links to '
+                             'download the spec and check links')
+    parser.add_argument('--force', action='store_true', help='Run every stage, ignoring the build cache')
+    parser.add_argument('--jobs', '-j', type=int, default=0, help='Stages to run at once (0 = all that are ready)')
+    parser.add_argument('--dry-run', action='store_true', help='Show which stages are up to date without running any')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show the output of every stage')
+    args = parser.parse_args()
+
+    stages = select_stages(args.stages)
+    cache = BuildCache(CACHE_FILE)
+    runner = BuildRunner(stages, cache, args.force, args.jobs or len(stages), args.verbose)
+
+    print(f"🏗️  Building docs: {' → '.join(stage.name for stage in stages)}\n")
+    started = time.perf_counter()
+    results = runner.run(args.dry_run)
+    elapsed = time.perf_counter() - started
+
+    if not args.dry_run:
+        cache.save()
+    print_summary(runner, elapsed)
+
+    failed = any(result.get('status') == "failed" for result in results.values())
+    if not failed and not args.dry_run:
+        print("\n💡 Next steps:")
+        print("   1. Run 'mint dev' to preview the documentation")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Build the memory-mapped endpoint lookup table.
+Indexes every operation in openapi.json by operation, operationId, page slug and page
+path (see endpoint_lookup.py), with the title from its page, and the byte ranges of its
+entries in the search index and the llms shards. Run it after build-search-index.py and
+update-llms-files.py so those ranges point into their current output.
+"""
+
+import argparse
+import re
+from pathlib import Path
+from typing import Dict, Tuple
+
+from docs_paths import DOCS_DIR
+from endpoint_lookup import LOOKUP_FILE, build_lookup
+from endpoint_pages import CategoryFiles, endpoint_page_path, operation_tag, sanitize_filename
+from frontmatter_index import FrontmatterIndex
+from openapi_stream import iter_operations, iter_path_items
+from output_writer import write_if_changed
+from script_loader import load_script
+from search_index import INDEX_FILE, SearchIndex
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Configuration
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+
+_SHARD_ENTRY = re.compile(rb'^- \[.*?\]\(/([^)\s]+)\)', re.MULTILINE)
+
+
+def search_spans(index_file: Path) -> Dict[str, Dict]:
+    """Byte range of each document's metadata in ``index_file``, by page."""
+    spans = {}
+    if not index_file.exists():
+        return spans
+    with SearchIndex(index_file) as index:
+        for doc_id in range(index.doc_count):
+            offset, length = index.document_span(doc_id)
+            spans[index.document(doc_id)['id']] = {"offset": offset, "length": length}
+    return spans
+
+
+def shard_spans() -> Dict[str, Dict]:
+    """Byte range of each page's line in the llms shards, by page."""
+    llms = load_script("update-llms-files")
+    shard_dir = DOCS_DIR / llms.SHARD_DIR
+    spans = {}
+    try:
+        shards = PROFILER.load_json(shard_dir / llms.SHARD_MANIFEST).get('shards', {})
+    except (OSError, ValueError):
+        return spans
+    for shard in shards.values():
+        path = DOCS_DIR / shard['file']
+        try:
+            data = PROFILER.read_bytes(path)
+        except OSError:
+            continue
+        for match in _SHARD_ENTRY.finditer(data):
+            end = data.find(b'\n', match.start())
+            end = len(data) if end == -1 else end
+            spans.setdefault(match.group(1).decode('utf-8'), {
+                "file": shard['file'], "offset": match.start(), "length": end - match.start()})
+    return spans
+
+
+def load_records(frontmatter: FrontmatterIndex, search: Dict[str, Dict],
+                 shards: Dict[str, Dict]) -> Tuple[list, int]:
+    """One record per operation, and how many of their pages exist on disk."""
+    records = []
+    titles: Dict[str, str] = {}
+    categories = CategoryFiles()
+    for path, path_item in iter_path_items(OPENAPI_FILE):
+        for method, operation in iter_operations(path_item):
+            tag = operation_tag(operation)
+            category = categories.stem(tag)
+            page = endpoint_page_path(category, path)
+            if page not in titles:
+                titles[page] = frontmatter.title(DOCS_DIR / f"{page}.mdx")
+            records.append({
+                "method": method.upper(),
+                "path": path,
+                "operationId": operation.get('operationId', ''),
+                "slug": sanitize_filename(path),
+                "page": page,
+                "title": titles[page] or operation.get('summary') or path,
+                "summary": operation.get('summary', ''),
+                "category": category,
+                "tag": tag,
+                "deprecated": bool(operation.get('deprecated', False)),
+                "search": search.get(page),
+                "llms": shards.get(page),
+            })
+    return records, sum(1 for title in titles.values() if title)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', type=Path, default=LOOKUP_FILE, help='Where to write the table')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "build-endpoint-lookup")
+
+    print("🗂️  Building endpoint lookup table\n")
+
+    if not OPENAPI_FILE.exists():
+        print(f"❌ OpenAPI spec not found: {OPENAPI_FILE}")
+        PROFILER.finish()
+        return 1
+
+    with PROFILER.stage("offsets"):
+        search = search_spans(INDEX_FILE)
+        shards = shard_spans()
+    if not search:
+        print(f"⚠️  No search index at {INDEX_FILE}; search offsets will be empty")
+    if not shards:
+        print("⚠️  No llms shards found; llms offsets will be empty")
+
+    frontmatter = FrontmatterIndex(DOCS_DIR)
+    with PROFILER.stage("operations"):
+        records, pages = load_records(frontmatter, search, shards)
+    frontmatter.save()
+
+    with PROFILER.stage("write"):
+        table = build_lookup(records)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        written = write_if_changed(args.output, table)
+
+    print(f"✅ Indexed {len(records)} operations on {pages} page(s)")
+    print(f"   🔎 {sum(1 for r in records if r['search'])} with search index entries, "
+          f"📝 {sum(1 for r in records if r['llms'])} with llms shard entries")
+    print(f"✅ {'Wrote' if written else 'Unchanged'}: {args.output} ({len(table) / 1024:.0f} KB)")
+
+    print("\n💡 Next steps:")
+    print("   1. Query it with 'python3 scripts/endpoint_lookup.py \"POST /api/camera/getMediaUris\"'")
+    PROFILER.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
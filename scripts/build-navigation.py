@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Build the API reference navigation in a single pass.
+Loads docs.json and _navigation.json once, applies the endpoint merge, accordion
+grouping and service grouping in memory, and writes docs.json once. The result
+matches running update-docs-navigation.py, improve-endpoint-navigation.py and
+add-service-level-navigation.py in that order.
+"""
+
+import argparse
+from pathlib import Path
+
+from output_writer import write_json_if_changed
+from script_loader import load_script
+from stage_profiler import PROFILER, add_profile_arguments
+
+update_navigation = load_script("update-docs-navigation")
+improve_navigation = load_script("improve-endpoint-navigation")
+service_navigation = load_script("add-service-level-navigation")
+
+DOCS_JSON = update_navigation.DOCS_JSON
+NAV_JSON = update_navigation.NAV_JSON
+BACKUP_JSON = update_navigation.BACKUP_JSON
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Build the API reference navigation in a single pass")
+    parser.add_argument('--skip-icons', action='store_true',
+                        help='Do not update endpoint page icons')
+    parser.add_argument('--changes', type=Path, metavar='FILE',
+                        help='Change set from diff-openapi.py; only its categories get the icon '
+                             'pass, and docs.json is left alone when no page was added or removed')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "build-navigation")
+
+    print("🔨 Building API reference navigation\n")
+
+    changed_categories = None
+    if args.changes:
+        changes = load_script("diff-openapi").load_changes(args.changes)
+        if changes is None:
+            print(f"⚠️  Could not read change set {args.changes}, rebuilding everything")
+        else:
+            changed_categories = set(changes['affected']['categories'])
+            if not changes['affected']['navigation']:
+                # Same pages as last time, so the navigation would come out identical
+                if not args.skip_icons:
+                    with PROFILER.stage("icons"):
+                        improve_navigation.process_endpoint_icons(categories=changed_categories)
+                print("✅ Change set adds or removes no pages, navigation is up to date")
+                PROFILER.finish()
+                return 0
+
+    with PROFILER.stage("load"):
+        docs_data = PROFILER.load_json(DOCS_JSON)
+        endpoint_nav = PROFILER.load_json(NAV_JSON)
+    print(f"✅ Loaded {len(endpoint_nav)} endpoint categories from _navigation.json")
+
+    api_tab = update_navigation.find_api_tab(docs_data)
+    if not api_tab:
+        print("❌ Could not find 'API reference' tab in docs.json")
+        PROFILER.finish()
+        return 1
+
+    if not args.skip_icons:
+        with PROFILER.stage("icons"):
+            improve_navigation.process_endpoint_icons(categories=changed_categories)
+        print()
+
+    # Same transforms as the three standalone scripts, without the intermediate files
+    with PROFILER.stage("transform"):
+        update_navigation.merge_endpoint_navigation(api_tab, endpoint_nav)
+        api_tab['groups'] = improve_navigation.build_accordion_groups(api_tab['groups'])
+        api_tab['groups'] = service_navigation.build_service_groups(api_tab['groups'])
+
+    # The backup links the original file as-is instead of re-serializing it
+    with PROFILER.stage("write"):
+        if write_json_if_changed(DOCS_JSON, docs_data, backup=BACKUP_JSON, indent=2):
+            print(f"✅ Backed up docs.json to {BACKUP_JSON}")
+            print(f"✅ Updated {DOCS_JSON}")
+        else:
+            print(f"✅ {DOCS_JSON} already up to date")
+
+    service_navigation.print_service_summary(api_tab['groups'])
+
+    print("\n🎉 Navigation build complete!")
+    print("\n💡 Next steps:")
+    print(f"   1. Review {DOCS_JSON} for the new navigation structure")
+    print("   2. Run 'mint dev' to preview the documentation")
+    print("   3. If there are issues, restore from docs.json.backup")
+
+    PROFILER.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
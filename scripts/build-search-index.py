@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Build the offline full-text search index.
+Tokenizes endpoint page frontmatter, operation summaries from openapi.json, the guides
+and llms-full.txt into a BM25 index (see search_index.py). Term counts are cached per
+source file, so a rebuild only re-tokenizes the files that changed.
+"""
+
+import argparse
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from docs_paths import DOCS_DIR
+from endpoint_pages import ENDPOINT_PAGE_ROOT, CategoryFiles, endpoint_page_path, operation_tag
+from frontmatter_index import FrontmatterIndex, parse_frontmatter_lines
+from openapi_stream import iter_operations, iter_path_items
+from output_writer import write_if_changed, write_json_if_changed
+from search_index import INDEX_FILE, build_index, term_frequencies
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Configuration
+ENDPOINT_DIR = DOCS_DIR / ENDPOINT_PAGE_ROOT
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+LLMS_FULL_FILE = DOCS_DIR / "llms-full.txt"
+GUIDE_DIRS = ["implementations", "low-code-no-code"]
+CACHE_FILE = DOCS_DIR / ".cache" / "search-documents.json"
+CACHE_VERSION = 1
+
+_TAG = re.compile(r'<[^>]+>')
+_SECTION = re.compile(r'^## (.+)$', re.MULTILINE)
+
+
+def signature(path: Path) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def document(doc_id: str, kind: str, url: str, title: str, description: str, body: str) -> Dict:
+    terms, length = term_frequencies(title, f"{description}\n{body}")
+    return {"id": doc_id, "kind": kind, "url": url, "title": title,
+            "description": description[:160], "terms": terms, "length": length}
+
+
+def anchor(heading: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', heading.lower()).strip('-')
+
+
+def split_mdx(text: str) -> Tuple[Dict[str, str], str]:
+    """Frontmatter fields and the body of an MDX page, with JSX/HTML tags removed."""
+    frontmatter = {}
+    if text.startswith('---'):
+        end = text.find('\n---', 3)
+        if end != -1:
+            frontmatter = parse_frontmatter_lines(text[3:end].splitlines())
+            text = text[end + 4:]
+    return frontmatter, _TAG.sub(' ', text)
+
+
+def endpoint_page_sources(frontmatter: FrontmatterIndex) -> Iterator[Tuple[str, Path, Callable[[], List[Dict]]]]:
+    if not ENDPOINT_DIR.is_dir():
+        return
+    for category in sorted(os.scandir(ENDPOINT_DIR), key=lambda entry: entry.name):
+        if not category.is_dir() or category.name.startswith('.'):
+            continue
+        for entry in sorted(os.scandir(category.path), key=lambda entry: entry.name):
+            if not entry.name.endswith('.mdx'):
+                continue
+            path = Path(entry.path)
+            page = f"{ENDPOINT_PAGE_ROOT}/{category.name}/{entry.name[:-4]}"
+
+            def load(path=path, page=page):
+                fields = frontmatter.get(path)
+                return [document(page, "endpoint", f"/{page}", fields.get('title', page),
+                                 fields.get('description', ''),
+                                 # "METHOD path" without the fragment file a page may point at
+                                 " ".join(fields.get('openapi', '').split()[-2:]))]
+            yield f"page:{page}", path, load
+
+
+def load_operations() -> List[Dict]:
+    """One document per endpoint page with the summaries of its operations."""
+    pages: Dict[str, Dict] = {}
+    categories = CategoryFiles()
+    for path, path_item in iter_path_items(OPENAPI_FILE):
+        for method, operation in iter_operations(path_item):
+            tag = operation_tag(operation)
+            page = endpoint_page_path(categories.stem(tag), path)
+            text = " ".join(str(operation.get(key, '')) for key in ('summary', 'description', 'operationId'))
+            doc = document(page, "endpoint", f"/{page}", operation.get('summary') or path,
+                           operation.get('description', ''), f"{method} {path} {tag} {text}")
+            if page in pages:
+                merge_documents(pages[page], doc)
+            else:
+                pages[page] = doc
+    return list(pages.values())
+
+
+def guide_sources() -> Iterator[Tuple[str, Path, Callable[[], List[Dict]]]]:
+    paths = sorted(DOCS_DIR.glob("*.mdx"))
+    for directory in GUIDE_DIRS:
+        paths += sorted((DOCS_DIR / directory).glob("*.mdx"))
+    for path in paths:
+        page = path.relative_to(DOCS_DIR).with_suffix('').as_posix()
+
+        def load(path=path, page=page):
+            fields, body = split_mdx(PROFILER.read_text(path))
+            return [document(page, "guide", f"/{page}", fields.get('title', page),
+                             fields.get('description', ''), body)]
+        yield f"guide:{page}", path, load
+
+
+def load_llms_sections() -> List[Dict]:
+    """One document per ``## `` section of llms-full.txt."""
+    text = PROFILER.read_text(LLMS_FULL_FILE)
+    matches = list(_SECTION.finditer(text))
+    documents = []
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        heading = match.group(1).strip()
+        slug = anchor(heading)
+        documents.append(document(f"llms-full.txt#{slug}", "llms", f"/llms-full.txt#{slug}",
+                                  heading, "", text[match.end():end]))
+    return documents
+
+
+def merge_documents(target: Dict, extra: Dict):
+    """Fold ``extra`` into ``target``; ``target`` keeps its title and description if set."""
+    for term, tf in extra['terms'].items():
+        target['terms'][term] = target['terms'].get(term, 0) + tf
+    target['length'] += extra['length']
+    if not target.get('description'):
+        target['description'] = extra['description']
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', type=Path, default=INDEX_FILE, help='Where to write the index')
+    parser.add_argument('--force', action='store_true', help='Re-tokenize every source')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "build-search-index")
+
+    print("🔎 Building documentation search index\n")
+
+    cache = {}
+    if not args.force and CACHE_FILE.exists():
+        try:
+            data = PROFILER.load_json(CACHE_FILE)
+            if data.get('version') == CACHE_VERSION:
+                cache = data['sources']
+        except (OSError, ValueError):
+            pass
+
+    frontmatter = FrontmatterIndex(DOCS_DIR)
+    sources = list(endpoint_page_sources(frontmatter)) + list(guide_sources())
+    if OPENAPI_FILE.exists():
+        sources.append(("openapi", OPENAPI_FILE, load_operations))
+    if LLMS_FULL_FILE.exists():
+        sources.append(("llms-full", LLMS_FULL_FILE, load_llms_sections))
+
+    entries = {}
+    rebuilt = 0
+    with PROFILER.stage("tokenize"):
+        for key, path, load in sources:
+            stamp = signature(path)
+            entry = cache.get(key)
+            if entry is None or entry['signature'] != stamp:
+                entry = {"signature": stamp, "documents": load()}
+                rebuilt += 1
+            entries[key] = entry
+    frontmatter.save()
+
+    if not rebuilt and entries.keys() == cache.keys() and args.output.exists():
+        print(f"✅ All {len(sources)} source(s) unchanged, {args.output} is up to date")
+        PROFILER.finish()
+        return 0
+
+    # Pages and operations describe the same endpoint; merge them into one document
+    with PROFILER.stage("index"):
+        documents: Dict[str, Dict] = {}
+        for key in sorted(entries):
+            for doc in entries[key]['documents']:
+                if doc['id'] in documents:
+                    merge_documents(documents[doc['id']], doc)
+                else:
+                    documents[doc['id']] = dict(doc, terms=dict(doc['terms']))
+        index = build_index([documents[doc_id] for doc_id in sorted(documents)])
+
+    with PROFILER.stage("write"):
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        written = write_if_changed(args.output, index)
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_json_if_changed(CACHE_FILE, {"version": CACHE_VERSION, "sources": entries},
+                              separators=(',', ':'))
+
+    kinds: Dict[str, int] = {}
+    for doc in documents.values():
+        kinds[doc['kind']] = kinds.get(doc['kind'], 0) + 1
+    print(f"✅ Tokenized {rebuilt} of {len(sources)} source(s), reused {len(sources) - rebuilt} from cache")
+    print(f"✅ Indexed {len(documents)} documents: "
+          + ", ".join(f"{count} {kind}" for kind, count in sorted(kinds.items())))
+    print(f"✅ {'Wrote' if written else 'Unchanged'}: {args.output} ({len(index) / 1024:.0f} KB)")
+
+    print("\n💡 Next steps:")
+    print("   1. Query it with 'python3 scripts/search_index.py <terms>'")
+    PROFILER.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Check internal links and docs.json navigation against the pages on disk.
+Builds the set of existing pages and files in one directory walk, then scans every MDX
+file in a worker pool for markdown links and href/src attributes, checking each internal
+target with a set lookup. Also validates every navigation `pages` entry (including
+OpenAPI operation references) and reports MDX pages that no navigation entry reaches.
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from docs_paths import DOCS_DIR, DOCS_JSON
+from openapi_stream import iter_operations, iter_path_items
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Configuration
+SKIP_DIRS = {".git", ".github", ".cache", "node_modules", "scripts", "__pycache__"}
+PAGE_SUFFIXES = (".mdx", ".md")
+# Reusable fragments; scanned for links but never expected in the navigation
+SNIPPET_DIR = "snippets"
+CHUNK_SIZE = 256
+
+_MARKDOWN_LINK = re.compile(r'\[(?:[^\[\]]|\[[^\[\]]*\])*\]\(\s*<?([^()\s<>]+)>?(?:\s+"[^"]*")?\s*\)')
+_ATTRIBUTE_LINK = re.compile(r'\b(?:href|src)\s*=\s*\{?\s*["\']([^"\']+)["\']')
+_INLINE_CODE = re.compile(r'`[^`\n]*`')
+_SCHEME = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+
+# Set in each worker by _init_worker
+_TARGETS: Set[str] = set()
+
+Issue = Tuple[str, int, str, str]
+
+
+def scan_tree(root: Path) -> Tuple[Set[str], Set[str], List[str]]:
+    """One walk of ``root``: page routes, every other file, and the MDX/MD files to scan."""
+    pages: Set[str] = set()
+    files: Set[str] = set()
+    sources: List[str] = []
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        with os.scandir(root / relative if relative else root) as entries:
+            for entry in entries:
+                path = f"{relative}/{entry.name}" if relative else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith('.'):
+                        pending.append(path)
+                elif entry.name.endswith(PAGE_SUFFIXES):
+                    route = path.rsplit('.', 1)[0]
+                    pages.add(route)
+                    if route == "index" or route.endswith("/index"):
+                        pages.add(route[:-len("index")].rstrip('/'))
+                    sources.append(path)
+                else:
+                    files.add(path)
+    return pages, files, sorted(sources)
+
+
+def resolve_link(source: str, link: str) -> Optional[str]:
+    """Repo-relative target of an internal link, or None for external and anchor-only links."""
+    link = link.strip()
+    if not link or link[0] in '#{' or link.startswith('//') or _SCHEME.match(link):
+        return None
+    link = unquote(link.split('#', 1)[0].split('?', 1)[0])
+    if link.startswith('/'):
+        target = link.lstrip('/')
+    else:
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(source), link))
+    return target.rstrip('/') if target != '.' else ""
+
+
+def iter_links(text: str) -> Iterator[Tuple[int, str]]:
+    """``(line number, link)`` for every link outside fenced code blocks and inline code."""
+    in_fence = False
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if in_fence or ('](' not in line and '=' not in line):
+            continue
+        line = _INLINE_CODE.sub('', line)
+        for pattern in (_MARKDOWN_LINK, _ATTRIBUTE_LINK):
+            for match in pattern.finditer(line):
+                yield number, match.group(1)
+
+
+def _init_worker(targets: Set[str]):
+    global _TARGETS
+    _TARGETS = targets
+
+
+def target_exists(target: str) -> bool:
+    if target in _TARGETS:
+        return True
+    stem, dot, suffix = target.rpartition('.')
+    return bool(dot) and f".{suffix}" in PAGE_SUFFIXES and stem in _TARGETS
+
+
+def check_files(root: str, sources: List[str]) -> Tuple[List[Issue], int]:
+    """Broken links in ``sources`` and how many internal links were checked."""
+    issues = []
+    checked = 0
+    for source in sources:
+        try:
+            with open(os.path.join(root, source), 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            issues.append((source, 0, "", f"unreadable: {e}"))
+            continue
+        for number, link in iter_links(text):
+            target = resolve_link(source, link)
+            if target is None:
+                continue
+            checked += 1
+            if target.startswith('../') or target == '..':
+                issues.append((source, number, link, "points outside the docs"))
+            elif not target_exists(target):
+                issues.append((source, number, link, "no such page or file"))
+    return issues, checked
+
+
+def iter_nav_entries(obj, trail: Tuple[str, ...] = (), spec: str = "") -> Iterator[Tuple[str, str, str]]:
+    """``(page entry, location, default OpenAPI file)`` for every navigation ``pages`` string."""
+    if isinstance(obj, dict):
+        spec = obj.get('openapi', spec) if isinstance(obj.get('openapi', spec), str) else spec
+        label = obj.get('tab') or obj.get('group') or obj.get('anchor') or obj.get('dropdown')
+        if label:
+            trail = trail + (label,)
+        for key, value in obj.items():
+            if key == 'pages' and isinstance(value, list):
+                for page in value:
+                    if isinstance(page, str):
+                        yield page, " > ".join(trail), spec
+                    else:
+                        yield from iter_nav_entries(page, trail, spec)
+            elif isinstance(value, (dict, list)):
+                yield from iter_nav_entries(value, trail, spec)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from iter_nav_entries(item, trail, spec)
+
+
+def split_operation_entry(entry: str, default_spec: str) -> Optional[Tuple[str, str, str]]:
+    """``(spec file, METHOD, path)`` of an OpenAPI navigation entry like 'openapi.json post /api/x'."""
+    parts = entry.split()
+    if len(parts) == 3 and parts[2].startswith('/'):
+        return parts[0].lstrip('/'), parts[1].upper(), parts[2]
+    if len(parts) == 2 and parts[1].startswith('/') and default_spec:
+        return default_spec.lstrip('/'), parts[0].upper(), parts[1]
+    return None
+
+
+def load_spec_operations(spec_file: Path) -> Set[str]:
+    """``"METHOD path"`` of every operation in a spec."""
+    return {f"{method.upper()} {path}" for path, path_item in iter_path_items(spec_file)
+            for method, _ in iter_operations(path_item)}
+
+
+def check_navigation(navigation, pages: Set[str], files: Set[str]) -> Tuple[List[Dict], Set[str], Dict[str, Set[str]]]:
+    """Missing navigation entries, the page routes the navigation reaches and the operations of each spec."""
+    problems = []
+    reached: Set[str] = set()
+    seen: Dict[str, str] = {}
+    specs: Dict[str, Set[str]] = {}
+    missing_specs: Dict[str, List[str]] = {}
+    for entry, location, default_spec in iter_nav_entries(navigation):
+        operation = split_operation_entry(entry, default_spec)
+        if operation:
+            spec, method, path = operation
+            if spec not in files:
+                missing_specs.setdefault(spec, []).append(location)
+                continue
+            if spec not in specs:
+                specs[spec] = load_spec_operations(DOCS_DIR / spec)
+            if f"{method} {path}" not in specs[spec]:
+                problems.append({"entry": entry, "location": location, "problem": f"{method} {path} not in {spec}"})
+            continue
+
+        page = entry.strip('/')
+        if page in seen:
+            problems.append({"entry": entry, "location": location, "problem": f"duplicate of the entry in {seen[page]}",
+                             "warning": True})
+        seen.setdefault(page, location)
+        if page not in pages:
+            problems.append({"entry": entry, "location": location, "problem": "no such page"})
+        reached.add(page)
+
+    # One problem per missing spec rather than one per operation it would have served
+    for spec, locations in missing_specs.items():
+        problems.append({"entry": spec, "location": locations[0],
+                         "problem": f"OpenAPI file not found ({len(locations)} operation entries use it)"})
+    return problems, reached, specs
+
+
+def find_orphans(sources: List[str], reached: Set[str]) -> List[str]:
+    """MDX pages no navigation entry points at (snippets excluded)."""
+    orphans = []
+    for source in sources:
+        route = source.rsplit('.', 1)[0]
+        if not source.endswith('.mdx') or route.split('/', 1)[0] == SNIPPET_DIR:
+            continue
+        if route not in reached and not (route.endswith('index') and route[:-len('index')].rstrip('/') in reached):
+            orphans.append(source)
+    return orphans
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='Worker processes for scanning MDX files (0 = all CPUs, 1 = no pool)')
+    parser.add_argument('--strict', action='store_true', help='Also fail on orphaned pages and duplicate nav entries')
+    parser.add_argument('--json', type=Path, metavar='FILE', help='Write the full report to FILE')
+    parser.add_argument('--show', type=int, default=50, help='Maximum problems printed per section')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+    PROFILER.configure(args, "check-links")
+
+    print("🔗 Checking internal links and navigation\n")
+
+    with PROFILER.stage("walk"):
+        pages, files, sources = scan_tree(DOCS_DIR)
+    print(f"📁 {len(pages)} page routes, {len(files)} other files, {len(sources)} MDX/MD files")
+
+    navigation = {}
+    if DOCS_JSON.exists():
+        navigation = PROFILER.load_json(DOCS_JSON).get('navigation', {})
+    with PROFILER.stage("navigation"):
+        nav_problems, reached, specs = check_navigation(navigation, pages, files)
+        orphans = find_orphans(sources, reached)
+
+    # Operation pages generated from a spec are linkable as /<spec>/<method>/<path>
+    targets = pages | files
+    for spec, operations in specs.items():
+        for operation in operations:
+            method, path = operation.split(' ', 1)
+            targets.add(f"{spec}/{method.lower()}{path}")
+
+    with PROFILER.stage("links"):
+        chunks = [sources[i:i + CHUNK_SIZE] for i in range(0, len(sources), CHUNK_SIZE)]
+        root = str(DOCS_DIR)
+        if jobs > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(targets,)) as pool:
+                results = list(pool.map(check_files, [root] * len(chunks), chunks))
+        else:
+            _init_worker(targets)
+            results = [check_files(root, chunk) for chunk in chunks]
+    broken = [issue for issues, _ in results for issue in issues]
+    checked = sum(count for _, count in results)
+
+    errors = [p for p in nav_problems if not p.get('warning')]
+    warnings = [p for p in nav_problems if p.get('warning')]
+
+    print(f"🔎 Checked {checked} internal links in {len(sources)} files\n")
+    if broken:
+        print(f"❌ {len(broken)} broken link(s):")
+        for source, line, link, reason in broken[:args.show]:
+            print(f"   {source}:{line} → {link} ({reason})")
+        if len(broken) > args.show:
+            print(f"   ... and {len(broken) - args.show} more")
+    if errors:
+        print(f"❌ {len(errors)} navigation entr{'y' if len(errors) == 1 else 'ies'} without a page:")
+        for problem in errors[:args.show]:
+            print(f"   {problem['location'] or '(top level)'}: {problem['entry']} ({problem['problem']})")
+        if len(errors) > args.show:
+            print(f"   ... and {len(errors) - args.show} more")
+    if warnings:
+        print(f"⚠️  {len(warnings)} duplicate navigation entr{'y' if len(warnings) == 1 else 'ies'}")
+        for problem in warnings[:args.show]:
+            print(f"   {problem['location']}: {problem['entry']} ({problem['problem']})")
+    if orphans:
+        print(f"⚠️  {len(orphans)} page(s) not reachable from the navigation:")
+        for orphan in orphans[:args.show]:
+            print(f"   {orphan}")
+        if len(orphans) > args.show:
+            print(f"   ... and {len(orphans) - args.show} more")
+
+    if args.json:
+        report = {
+            "pages": len(pages), "files_scanned": len(sources), "links_checked": checked,
+            "broken_links": [{"file": s, "line": line, "link": link, "reason": reason}
+                             for s, line, link, reason in broken],
+            "navigation": nav_problems, "orphans": orphans,
+        }
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📝 Report written to {args.json}")
+
+    failed = bool(broken or errors or (args.strict and (orphans or warnings)))
+    if not failed:
+        print("✅ No broken links or navigation entries")
+    PROFILER.finish()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Compare two OpenAPI specs operation by operation.
+Reports added, removed and modified operations (down to parameters, request bodies and
+responses) and changed schemas with the endpoint pages that depend on them. The change
+set drives targeted regeneration (--changes in generate-endpoint-docs.py and
+build-navigation.py) and can be rendered as a draft changelog.mdx entry.
+"""
+
+import argparse
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from docs_paths import DOCS_DIR
+from endpoint_pages import CategoryFiles, endpoint_page_path, operation_tag
+from openapi_stream import HTTP_METHODS, JSONStreamReader, iter_operations
+from output_writer import write_if_changed, write_json_if_changed
+from schema_graph import SchemaGraph
+
+# Configuration
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+CHANGES_FILE = DOCS_DIR / ".cache" / "openapi-changes.json"
+
+# Operation fields compared individually; anything else is reported as "other"
+OPERATION_FIELDS = ('summary', 'description', 'deprecated', 'tags', 'operationId',
+                    'parameters', 'requestBody', 'responses', 'security')
+
+
+def digest(value) -> str:
+    """Short stable hash of a JSON value."""
+    data = json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def parameter_key(parameter: dict) -> str:
+    if '$ref' in parameter:
+        return parameter['$ref']
+    return f"{parameter.get('in', '')}:{parameter.get('name', '')}"
+
+
+def fingerprint_operation(path: str, method: str, operation: dict, shared: dict, category: str) -> Dict:
+    """Compact per-field hashes of one operation, enough to describe what changed."""
+    parameters = list(shared.get('parameters', [])) + list(operation.get('parameters', []))
+    tag = operation_tag(operation)
+    return {
+        "method": method,
+        "path": path,
+        "tag": tag,
+        "page": endpoint_page_path(category, path),
+        "summary": operation.get('summary', ''),
+        "deprecated": bool(operation.get('deprecated', False)),
+        "hash": digest([operation, shared]),
+        "fields": {
+            field: digest(operation[field]) for field in OPERATION_FIELDS
+            if field in operation and field != 'parameters'
+        },
+        "other": digest({k: v for k, v in operation.items() if k not in OPERATION_FIELDS}),
+        "parameters": {parameter_key(p): digest(p) for p in parameters if isinstance(p, dict)},
+        "responses": {str(code): digest(body) for code, body in operation.get('responses', {}).items()},
+    }
+
+
+class SpecIndex:
+    """Operation fingerprints, schema hashes and the schema graph of one spec."""
+
+    def __init__(self):
+        self.title = ""
+        self.version = ""
+        self.operations: Dict[str, Dict] = {}
+        self.schemas: Dict[str, str] = {}
+        self.graph = SchemaGraph()
+        # Category stems as split-openapi.py assigns them for this spec
+        self.categories = CategoryFiles()
+
+    @classmethod
+    def load(cls, spec_file: Path) -> "SpecIndex":
+        """Index ``spec_file`` in one streaming pass."""
+        index = cls()
+        with open(spec_file, 'r') as f:
+            reader = JSONStreamReader(f)
+            for key in reader.iter_object():
+                if key == 'info':
+                    info = reader.read_value()
+                    index.title = info.get('title', '')
+                    index.version = info.get('version', '')
+                elif key == 'paths':
+                    for path in reader.iter_object():
+                        index.add_path_item(path, reader.read_value())
+                elif key == 'components':
+                    for component_type in reader.iter_object():
+                        if component_type != 'schemas':
+                            continue
+                        for name in reader.iter_object():
+                            schema = reader.read_value()
+                            index.schemas[name] = digest(schema)
+                            index.graph.add_schema(name, schema)
+        return index
+
+    def add_path_item(self, path: str, path_item: dict):
+        shared = {k: v for k, v in path_item.items() if k not in HTTP_METHODS}
+        for method, operation in iter_operations(path_item):
+            category = self.categories.stem(operation_tag(operation))
+            record = fingerprint_operation(path, method, operation, shared, category)
+            self.operations[f"{method} {path}"] = record
+            self.graph.add_endpoint(record['page'], [operation, shared])
+
+
+def diff_keys(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+    """Added, removed and modified keys between two ``{key: hash}`` maps."""
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "modified": sorted(k for k in old.keys() & new.keys() if old[k] != new[k]),
+    }
+
+
+def describe_operation(record: Dict) -> Dict:
+    return {key: record[key] for key in ('method', 'path', 'tag', 'page', 'summary', 'deprecated')}
+
+
+def diff_operation(old: Dict, new: Dict) -> Dict:
+    """What changed inside an operation present in both specs."""
+    changes = [
+        field for field in OPERATION_FIELDS
+        if field != 'parameters' and old['fields'].get(field) != new['fields'].get(field)
+    ]
+    parameters = diff_keys(old['parameters'], new['parameters'])
+    if any(parameters.values()):
+        changes.append('parameters')
+    if old['other'] != new['other']:
+        changes.append('other')
+    if not changes:
+        changes.append('path-item')
+
+    result = describe_operation(new)
+    result['changes'] = sorted(changes)
+    if any(parameters.values()):
+        result['parameters'] = parameters
+    responses = diff_keys(old['responses'], new['responses'])
+    if any(responses.values()):
+        result['responses'] = responses
+    return result
+
+
+def diff_specs(old: SpecIndex, new: SpecIndex) -> Dict:
+    """Structured change set between two indexed specs."""
+    operations = diff_keys(
+        {key: record['hash'] for key, record in old.operations.items()},
+        {key: record['hash'] for key, record in new.operations.items()},
+    )
+    schemas = diff_keys(old.schemas, new.schemas)
+
+    # A schema change reaches every endpoint that depends on it, directly or through
+    # other schemas; removed schemas are resolved against the old graph
+    schema_changes = []
+    schema_pages: Set[str] = set()
+    for name in schemas['modified'] + schemas['removed']:
+        pages = new.graph.endpoints_using(name) | old.graph.endpoints_using(name)
+        schema_changes.append({"name": name, "change": "modified" if name in new.schemas else "removed",
+                               "endpoints": sorted(pages)})
+        schema_pages |= pages
+
+    added = [describe_operation(new.operations[key]) for key in operations['added']]
+    removed = [describe_operation(old.operations[key]) for key in operations['removed']]
+    modified = [diff_operation(old.operations[key], new.operations[key]) for key in operations['modified']]
+
+    # Pages are per path: a page stays as long as any operation of its path does
+    new_pages = {record['page'] for record in new.operations.values()}
+    old_pages = {record['page'] for record in old.operations.values()}
+    pages = {op['page'] for op in added + modified} | (schema_pages & new_pages)
+    removed_pages = old_pages - new_pages
+    for record in removed:
+        if record['page'] in new_pages:
+            pages.add(record['page'])
+
+    categories = {page.split('/')[-2] for page in pages | removed_pages}
+    return {
+        "old": {"title": old.title, "version": old.version, "operations": len(old.operations),
+                "schemas": len(old.schemas)},
+        "new": {"title": new.title, "version": new.version, "operations": len(new.operations),
+                "schemas": len(new.schemas)},
+        "operations": {"added": added, "removed": removed, "modified": modified},
+        "schemas": {"added": schemas['added'], "changed": schema_changes},
+        "affected": {
+            "pages": sorted(pages),
+            "removed_pages": sorted(removed_pages),
+            "categories": sorted(categories),
+            "navigation": bool(new_pages ^ old_pages),
+        },
+    }
+
+
+def has_changes(changes: Dict) -> bool:
+    return any(changes['operations'].values()) or bool(changes['schemas']['added'] or changes['schemas']['changed'])
+
+
+def load_changes(path: Path) -> Optional[Dict]:
+    """Load a change set written by this script, or None if it is missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def format_operation(record: Dict, link: bool = True) -> str:
+    title = record['summary'] or record['path']
+    label = f"[{title}](/{record['page']})" if link else title
+    suffix = " (deprecated)" if record.get('deprecated') else ""
+    return f"  - **{record['method']}** `{record['path']}`: {label}{suffix}"
+
+
+def changelog_entry(changes: Dict, date: Optional[datetime] = None) -> str:
+    """Draft ``<Update>`` block for changelog.mdx summarizing the change set."""
+    date = date or datetime.now(timezone.utc)
+    operations = changes['operations']
+    lines = [
+        f'<Update label="{date.strftime("%B %Y")}" tags={{["API"]}} '
+        f'description="{changes["new"]["version"] or date.strftime("%Y-%m-%d")}">',
+        "  ## API Reference Updates",
+        "",
+        f"  {len(operations['added'])} new, {len(operations['modified'])} updated and "
+        f"{len(operations['removed'])} removed endpoint(s).",
+    ]
+
+    sections = [
+        ("New Endpoints", [format_operation(op) for op in operations['added']]),
+        ("Updated Endpoints", [
+            format_operation(op) + f" ({', '.join(op['changes'])})" for op in operations['modified']
+        ]),
+        ("Removed Endpoints", [format_operation(op, link=False) for op in operations['removed']]),
+        ("Schema Changes", [
+            f"  - `{schema['name']}` {schema['change']}, used by {len(schema['endpoints'])} endpoint(s)"
+            for schema in changes['schemas']['changed']
+        ] + [f"  - `{name}` added" for name in changes['schemas']['added']]),
+    ]
+    for heading, items in sections:
+        if items:
+            lines += ["", f"  ### {heading}", ""] + items
+
+    lines.append("</Update>")
+    return "\n".join(lines) + "\n"
+
+
+def print_summary(changes: Dict):
+    operations = changes['operations']
+    affected = changes['affected']
+    print(f"📊 {changes['old']['operations']} → {changes['new']['operations']} operations")
+    print(f"   ➕ Added: {len(operations['added'])}")
+    print(f"   ➖ Removed: {len(operations['removed'])}")
+    print(f"   ✏️  Modified: {len(operations['modified'])}")
+    print(f"   🧩 Schemas: {len(changes['schemas']['added'])} added, "
+          f"{len(changes['schemas']['changed'])} changed or removed")
+    print(f"   📄 Affected pages: {len(affected['pages'])} "
+          f"({len(affected['removed_pages'])} removed) in {len(affected['categories'])} categories")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--old', type=Path, required=True, help='Previous OpenAPI spec')
+    parser.add_argument('--new', type=Path, default=OPENAPI_FILE, help='Updated OpenAPI spec')
+    parser.add_argument('--output', type=Path, default=CHANGES_FILE,
+                        help='Where to write the JSON change set')
+    parser.add_argument('--changelog-draft', type=Path, metavar='FILE',
+                        help='Also write a draft changelog.mdx <Update> entry to FILE')
+    args = parser.parse_args()
+
+    print("🔍 Comparing OpenAPI specs\n")
+
+    for spec in (args.old, args.new):
+        if not spec.exists():
+            print(f"❌ OpenAPI spec not found: {spec}")
+            return 1
+
+    changes = diff_specs(SpecIndex.load(args.old), SpecIndex.load(args.new))
+    print_summary(changes)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    write_json_if_changed(args.output, changes, indent=2)
+    print(f"\n✅ Change set written to {args.output}")
+
+    if args.changelog_draft:
+        if has_changes(changes):
+            args.changelog_draft.parent.mkdir(parents=True, exist_ok=True)
+            write_if_changed(args.changelog_draft, changelog_entry(changes))
+            print(f"✅ Changelog draft written to {args.changelog_draft}")
+        else:
+            print("ℹ️  No API changes, skipping changelog draft")
+
+    print("\n💡 Next steps:")
+    print(f"   1. Run 'python3 scripts/generate-endpoint-docs.py --changes {args.output}'")
+    print(f"   2. Run 'python3 scripts/build-navigation.py --changes {args.output}'")
+    if args.changelog_draft:
+        print(f"   3. Review {args.changelog_draft} and paste it into changelog.mdx")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Serve documentation search, endpoint lookup and page fetches from a local asyncio server.
+The on-prem counterpart of the hosted documentation MCP: loads the search index, the
+endpoint lookup table, the llms files and every page in docs.json navigation once,
+answers requests concurrently from memory with an LRU cache of rendered responses, and
+reloads in the background when docs.json or a generated artifact changes.
+
+Routes:
+    GET /search?q=TERMS[&limit=N][&kind=endpoint|guide|llms]
+    GET /endpoint?q=METHOD /path | operationId | slug | page
+    GET /page/<page path>          raw MDX of a navigation page
+    GET /llms.txt, /llms-full.txt, /llms/<shard>.txt, /llms/manifest.json
+    GET /health                    counters, cache stats and what is loaded
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from docs_paths import DOCS_DIR
+from endpoint_lookup import LOOKUP_FILE, EndpointLookup
+from search_index import INDEX_FILE, SearchIndex
+
+# Configuration
+LLMS_FILES = ["llms.txt", "llms-full.txt"]
+SHARD_DIR = DOCS_DIR / "llms"
+ENDPOINT_MANIFEST = DOCS_DIR / "api-reference" / "endpoint" / "_manifest.json"
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+MAX_HEADER_LINES = 100
+
+
+def iter_nav_pages(obj) -> Iterator[str]:
+    """Every page path referenced by a docs.json navigation tree."""
+    if isinstance(obj, dict):
+        for value in obj.values():
+            yield from iter_nav_pages(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, str):
+                yield item
+            else:
+                yield from iter_nav_pages(item)
+
+
+def stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class DocsState:
+    """Everything the server answers from, loaded in one go and swapped as a unit."""
+
+    def __init__(self):
+        self.pages: Dict[str, bytes] = {}
+        self.llms: Dict[str, bytes] = {}
+        self.search: Optional[SearchIndex] = None
+        self.lookup: Optional[EndpointLookup] = None
+        self.watched: List[Path] = []
+        self.signature: Tuple = ()
+        self.loaded_at = time.time()
+        self.load_seconds = 0.0
+
+    @classmethod
+    def load(cls, docs_dir: Path = DOCS_DIR) -> "DocsState":
+        started = time.perf_counter()
+        state = cls()
+        docs_json = docs_dir / "docs.json"
+        watched = [docs_json, INDEX_FILE, LOOKUP_FILE, ENDPOINT_MANIFEST, SHARD_DIR / "manifest.json"]
+
+        try:
+            with open(docs_json, 'r') as f:
+                navigation = json.load(f).get('navigation', {})
+        except (OSError, ValueError):
+            navigation = {}
+        for page in dict.fromkeys(iter_nav_pages(navigation)):
+            path = docs_dir / f"{page}.mdx"
+            try:
+                state.pages[page] = path.read_bytes()
+            except OSError:
+                continue
+            watched.append(path)
+
+        for name in LLMS_FILES:
+            path = docs_dir / name
+            watched.append(path)
+            if path.exists():
+                state.llms[name] = path.read_bytes()
+        if SHARD_DIR.is_dir():
+            for path in sorted(SHARD_DIR.iterdir()):
+                if path.suffix in ('.txt', '.json'):
+                    state.llms[f"llms/{path.name}"] = path.read_bytes()
+
+        if INDEX_FILE.exists():
+            state.search = SearchIndex(INDEX_FILE)
+        if LOOKUP_FILE.exists():
+            state.lookup = EndpointLookup(LOOKUP_FILE)
+
+        state.watched = watched
+        state.signature = state.current_signature()
+        state.load_seconds = time.perf_counter() - started
+        return state
+
+    def current_signature(self) -> Tuple:
+        """Size and mtime of every watched file; any difference means reload."""
+        return tuple(stamp(path) for path in self.watched)
+
+    def summary(self) -> Dict:
+        return {
+            "pages": len(self.pages),
+            "llms_files": len(self.llms),
+            "search_documents": self.search.doc_count if self.search else 0,
+            "endpoint_records": self.lookup.record_count if self.lookup else 0,
+            "loaded_at": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.loaded_at)),
+            "load_ms": round(self.load_seconds * 1000, 1),
+        }
+
+    def close(self):
+        if self.search:
+            self.search.close()
+        if self.lookup:
+            self.lookup.close()
+
+
+class ResponseCache:
+    """Bounded LRU of rendered responses, keyed by request target."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.entries: "OrderedDict[str, Tuple[int, str, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Tuple[int, str, bytes]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Tuple[int, str, bytes]):
+        if self.capacity <= 0:
+            return
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {"entries": len(self.entries), "capacity": self.capacity, "hits": self.hits,
+                "misses": self.misses, "hit_rate": round(self.hits / total, 4) if total else 0.0}
+
+
+def json_response(status: int, value) -> Tuple[int, str, bytes]:
+    return status, "application/json", json.dumps(value, indent=2).encode('utf-8')
+
+
+class DocsServer:
+    """Routes requests against the current ``DocsState`` and reloads it when files change."""
+
+    def __init__(self, state: DocsState, cache_size: int, reload_interval: float):
+        self.state = state
+        self.cache = ResponseCache(cache_size)
+        self.reload_interval = reload_interval
+        self.requests = 0
+        self.reloads = 0
+        self.started = time.time()
+
+    def route(self, target: str) -> Tuple[int, str, bytes]:
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = unquote(url.path)
+        state = self.state
+
+        if path == "/search":
+            if not state.search:
+                return json_response(503, {"error": "search index not built"})
+            query = params.get('q', '').strip()
+            if not query:
+                return json_response(400, {"error": "missing q"})
+            try:
+                limit = max(1, min(int(params.get('limit', 10)), 100))
+            except ValueError:
+                return json_response(400, {"error": "limit must be an integer"})
+            results = state.search.search(query, limit, params.get('kind') or None)
+            return json_response(200, {"query": query, "results": results})
+
+        if path == "/endpoint":
+            if not state.lookup:
+                return json_response(503, {"error": "endpoint lookup table not built"})
+            query = params.get('q', '').strip()
+            if not query:
+                return json_response(400, {"error": "missing q"})
+            matches = state.lookup.resolve(query)
+            return json_response(200 if matches else 404, {"query": query, "matches": matches})
+
+        if path.startswith("/page/"):
+            page = path[len("/page/"):].strip('/')
+            if page.endswith('.mdx'):
+                page = page[:-4]
+            body = state.pages.get(page)
+            if body is None:
+                return json_response(404, {"error": f"no page {page}"})
+            return 200, "text/markdown; charset=utf-8", body
+
+        body = state.llms.get(path.lstrip('/'))
+        if body is not None:
+            kind = "application/json" if path.endswith('.json') else "text/plain; charset=utf-8"
+            return 200, kind, body
+
+        return json_response(404, {"error": f"unknown route {path}"})
+
+    def respond(self, method: str, target: str) -> Tuple[int, str, bytes]:
+        self.requests += 1
+        if method not in ('GET', 'HEAD'):
+            return json_response(405, {"error": "only GET is supported"})
+        if urlsplit(target).path == "/health":
+            return json_response(200, {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "reloads": self.reloads,
+                "cache": self.cache.stats(),
+                "loaded": self.state.summary(),
+            })
+
+        cached = self.cache.get(target)
+        if cached is not None:
+            return cached
+        try:
+            response = self.route(target)
+        except Exception as e:
+            return json_response(500, {"error": str(e)})
+        if response[0] in (200, 404):
+            self.cache.put(target, response)
+        return response
+
+    @staticmethod
+    async def send(writer: asyncio.StreamWriter, status: int, kind: str, body: bytes,
+                   keep_alive: bool, include_body: bool = True):
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: {kind}\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1'))
+        if include_body:
+            writer.write(body)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one connection, keeping it alive when asked to."""
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line.strip():
+                        break
+                    parts = request_line.decode('latin-1').split()
+                    headers = {}
+                    for _ in range(MAX_HEADER_LINES):
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    # readline() raises ValueError for lines longer than the stream's buffer limit
+                    status, kind, body = json_response(400, {"error": "request line or header too long"})
+                    await self.send(writer, status, kind, body, keep_alive=False)
+                    break
+                length = headers.get('content-length', '0')
+                if length.isdigit() and int(length):
+                    await reader.readexactly(int(length))
+
+                if len(parts) != 3:
+                    status, kind, body = json_response(400, {"error": "malformed request line"})
+                    version = "HTTP/1.0"
+                else:
+                    method, target, version = parts
+                    status, kind, body = self.respond(method, target)
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+                await self.send(writer, status, kind, body, keep_alive, include_body=parts[:1] != ['HEAD'])
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    async def watch(self):
+        """Poll the watched files and swap in a freshly loaded state when any changes."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            signature = await asyncio.to_thread(self.state.current_signature)
+            if signature == self.state.signature:
+                continue
+            try:
+                state = await asyncio.to_thread(DocsState.load)
+            except Exception as e:
+                print(f"⚠️  Reload failed, keeping the previous data: {e}")
+                continue
+            # Handlers run on this loop without awaiting mid-request, so nothing
+            # is still reading the old mmaps once the swap happens
+            previous, self.state = self.state, state
+            self.cache.clear()
+            previous.close()
+            self.reloads += 1
+            loaded = state.summary()
+            print(f"🔄 Reloaded in {loaded['load_ms']} ms: {loaded['pages']} pages, "
+                  f"{loaded['search_documents']} search documents, {loaded['endpoint_records']} endpoints")
+
+
+async def serve(args) -> int:
+    state = await asyncio.to_thread(DocsState.load)
+    loaded = state.summary()
+    print(f"📚 Loaded in {loaded['load_ms']} ms: {loaded['pages']} pages, {loaded['llms_files']} llms files, "
+          f"{loaded['search_documents']} search documents, {loaded['endpoint_records']} endpoints")
+    if not state.search:
+        print(f"⚠️  No search index at {INDEX_FILE}; run 'python3 scripts/build-search-index.py'")
+    if not state.lookup:
+        print(f"⚠️  No endpoint lookup table at {LOOKUP_FILE}; run 'python3 scripts/build-endpoint-lookup.py'")
+
+    server = DocsServer(state, args.cache_size, args.reload_interval)
+    listener = await asyncio.start_server(server.handle, args.host, args.port, backlog=1024)
+    print(f"🚀 Serving on http://{args.host}:{args.port} (cache {args.cache_size} responses, "
+          f"reload check every {args.reload_interval:g}s)")
+    watcher = asyncio.create_task(server.watch()) if args.reload_interval > 0 else None
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        if watcher:
+            watcher.cancel()
+        server.state.close()
+    return 0
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default="127.0.0.1", help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8787, help='Port to listen on')
+    parser.add_argument('--cache-size', type=int, default=1024, help='Rendered responses kept in the LRU cache')
+    parser.add_argument('--reload-interval', type=float, default=2.0,
+                        help='Seconds between checks for changed files (0 disables hot reload)')
+    args = parser.parse_args()
+
+    try:
+        return asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+        return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Location of the docs directory, shared by every docs script.
+Scripts run either from the docs directory itself or from the project root above it
+(as the GitHub workflows do), so paths resolve against whichever one holds docs.json.
+"""
+
+from pathlib import Path
+
+DOCS_DIR = Path("docs") if Path("docs/docs.json").exists() else Path(".")
+DOCS_JSON = DOCS_DIR / "docs.json"
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Shared endpoint classification rules.
+One declarative table of icons, action groups and service groups, compiled at import
+time into fast matchers that the generator and all navigation scripts share.
+"""
+
+import argparse
+import posixpath
+import re
+import time
+from functools import lru_cache
+from typing import Any, Iterable, List, Sequence, Tuple
+
+# Icon mapping based on action type
+ACTION_ICONS = {
+    'create': 'square-plus',
+    'add': 'user-plus',
+    'upload': 'cloud-arrow-up',
+    'generate': 'wand-magic-sparkles',
+    'calibrate': 'sliders',
+    'initiate': 'play',
+    'trigger': 'bolt',
+
+    'get': 'eye',
+    'find': 'magnifying-glass',
+    'search': 'magnifying-glass',
+    'list': 'list',
+    'getall': 'list-check',
+    'findall': 'list-check',
+
+    'update': 'pen-to-square',
+    'edit': 'pen',
+    'modify': 'pen',
+    'assign': 'arrow-right-arrow-left',
+    'remove': 'user-minus',
+    'revoke': 'ban',
+    'suspend': 'pause',
+    'unsuspend': 'play',
+
+    'delete': 'trash-can',
+    'erase': 'eraser',
+
+    'unlock': 'lock-open',
+    'lock': 'lock',
+    'revert': 'arrow-rotate-left',
+}
+
+# Category-specific icons
+CATEGORY_ICONS = {
+    'access-control': 'key',
+    'camera': 'video',
+    'door': 'door-open',
+    'user': 'user',
+    'event': 'calendar',
+    'alert': 'bell',
+    'sensor': 'sensor',
+    'webhook': 'webhook',
+    'location': 'map-pin',
+    'org': 'building',
+    'oauth': 'shield-halved',
+    'face-recognition': 'face-smile',
+    'badge-reader': 'id-card',
+    'doorbell': 'bell',
+    'climate': 'temperature-half',
+    'export': 'file-export',
+    'report': 'chart-line',
+    'developer': 'code',
+    'integration': 'plug',
+    'keypad': 'keyboard',
+    'button': 'circle-dot',
+    'device': 'microchip',
+    'component': 'puzzle-piece',
+}
+
+# Accordion sub-groups, checked in order against the page filename
+ACTION_GROUPS = [
+    ('Create & Add', ['create', 'add', 'upload', 'generate', 'initiate', 'calibrate']),
+    ('Get & Find', ['get', 'find', 'search', 'list']),
+    ('Update & Modify', ['update', 'edit', 'modify', 'assign', 'remove', 'revoke', 'suspend', 'unsuspend']),
+    ('Delete & Remove', ['delete', 'erase']),
+]
+OTHER_ACTION_GROUP = 'Other Operations'
+ACTION_GROUP_NAMES = [name for name, _ in ACTION_GROUPS] + [OTHER_ACTION_GROUP]
+
+# Top-level service groupings for API reference categories
+SERVICE_GROUPS = {
+    "Core Services": [
+        "Access Control",
+        "Camera",
+        "Door",
+        "Door Controller",
+        "Doorbell Camera",
+        "User",
+        "Users",
+        "Badge Reader",
+        "Sensor",
+        "Climate",
+        "Button",
+        "Relay",
+        "Media Device",
+    ],
+    "Events & Monitoring": [
+        "Event",
+        "Events",
+        "Event Search",
+        "Alert Monitoring",
+        "Face Recognition Event",
+        "Face Recognition Matchmaker",
+        "Face Recognition Person",
+        "Proximity",
+        "Occupancy",
+    ],
+    "Integrations": [
+        "Access Control Integrations",
+        "Service Management Integrations",
+        "Incident Management Integrations",
+        "IoT Integrations",
+        "Storage Integrations",
+        "Webhook Integrations",
+        "Org Integrations",
+        "Integrations",
+    ],
+    "Organization & Management": [
+        "Organization",
+        "Org",
+        "Location",
+        "Locations",
+        "Customer",
+        "Partner",
+        "License",
+        "Permission",
+        "User Metadata",
+    ],
+    "Security & Access": [
+        "OAuth",
+        "Alarm Monitoring Keypad",
+        "Guest Management Kiosk",
+        "Lockdown Plan",
+        "RapidSOS",
+    ],
+    "Media & Video": [
+        "Video",
+        "Export",
+        "AudioGateway",
+        "AudioPlayback",
+        "TvOS Config",
+    ],
+    "Automation & Rules": [
+        "Rules",
+        "Rules Records",
+        "Schedule",
+        "Policies",
+        "Policy",
+    ],
+    "Device Management": [
+        "Device Config",
+        "Component",
+        "Components",
+        "BLE",
+    ],
+    "Data & Reporting": [
+        "Report",
+        "Reports",
+        "Search",
+        "Logistics",
+        "Vehicle",
+        "Vehicles",
+    ],
+    "Developer & System": [
+        "Developer",
+        "Feature",
+        "Help",
+        "Upload",
+    ],
+}
+OTHER_SERVICE = "Other Services"
+
+
+class KeywordMatcher:
+    """Priority-ordered keyword rules compiled into a single regular expression.
+
+    ``rules`` is a sequence of ``(keywords, value)`` pairs. Calling the matcher
+    returns the value of the first rule with a keyword contained in the text (or
+    starting it, with ``prefix=True``), exactly like scanning the rules in order,
+    but as one regex call per lookup instead of a Python loop over every rule.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[Iterable[str], Any]], prefix: bool = False,
+                 default: Any = None):
+        self.values = [value for _, value in rules]
+        self.default = default
+
+        lead = '' if prefix else '.*?'
+        branches = [
+            f"(?={lead}(?:{'|'.join(re.escape(keyword) for keyword in keywords)}))()"
+            for keywords, _ in rules
+        ]
+        self._match = re.compile('|'.join(branches), re.DOTALL).match
+
+    def __call__(self, text: str) -> Any:
+        match = self._match(text)
+        # Exactly one empty capture group per rule records which branch matched
+        return self.values[match.lastindex - 1] if match else self.default
+
+
+# Compiled once at import time
+_action_icon = KeywordMatcher([((key,), icon) for key, icon in ACTION_ICONS.items()], prefix=True)
+_category_icon = KeywordMatcher([((key,), icon) for key, icon in CATEGORY_ICONS.items()],
+                                default='circle-dot')
+_action_group = KeywordMatcher([(keywords, name) for name, keywords in ACTION_GROUPS],
+                               default=OTHER_ACTION_GROUP)
+
+_ACTION_WORD = re.compile(r'[a-z]+')
+
+SERVICE_BY_GROUP = {}
+for _service, _groups in SERVICE_GROUPS.items():
+    for _group in _groups:
+        SERVICE_BY_GROUP.setdefault(_group, _service)
+
+def get_action_from_path(path: str) -> str:
+    """Extract action from file path."""
+    filename = posixpath.splitext(posixpath.basename(path))[0]
+    # Remove category prefix
+    parts = filename.split('-', 1)
+    if len(parts) > 1:
+        action_part = parts[1]
+    else:
+        action_part = parts[0]
+
+    # Extract first word which is usually the action
+    action = _ACTION_WORD.match(action_part.lower())
+    if action:
+        return action.group(0)
+    return 'other'
+
+@lru_cache(maxsize=4096)
+def get_icon_for_endpoint(category: str, action: str) -> str:
+    """Determine the best icon for an endpoint based on category and action."""
+    # First check for action-specific icon, then fall back to category icon
+    return _action_icon(action) or _category_icon(category)
+
+def endpoint_icon(category: str, page: str) -> str:
+    """Icon for the endpoint page ``page`` (file name or path) in ``category``."""
+    return get_icon_for_endpoint(category, get_action_from_path(page))
+
+def action_group_for(page: str) -> str:
+    """Accordion sub-group for a page, from the action keywords in its filename."""
+    filename = posixpath.splitext(posixpath.basename(page))[0].lower()
+    return _action_group(filename)
+
+def service_for_group(group_name: str) -> str:
+    """Top-level service an API reference category belongs to."""
+    return SERVICE_BY_GROUP.get(group_name, OTHER_SERVICE)
+
+def synthetic_pages(count: int) -> List[Tuple[str, str]]:
+    """Deterministic ``(category, page)`` pairs for benchmarking the matchers."""
+    categories = sorted(CATEGORY_ICONS) + ['misc', 'vehicle', 'rules']
+    verbs = sorted(ACTION_ICONS) + ['export', 'sync', 'wrapper', 'reboot']
+    nouns = ['camera', 'policy', 'state', 'config', 'media', 'uris', 'org', 'user', 'list']
+    pages = []
+    for i in range(count):
+        category = categories[i % len(categories)]
+        verb = verbs[(i * 7) % len(verbs)]
+        noun = nouns[(i * 13) % len(nouns)]
+        pages.append((category, f"api-reference/endpoint/{category}/{category}-{verb}{noun}{i}"))
+    return pages
+
+def main():
+    """Benchmark the compiled classification rules on synthetic endpoints."""
+    parser = argparse.ArgumentParser(description="Benchmark endpoint classification rules")
+    parser.add_argument('--benchmark', type=int, default=100000, metavar='N',
+                        help='Number of synthetic endpoints to classify')
+    args = parser.parse_args()
+
+    for count in (args.benchmark // 10, args.benchmark):
+        pages = synthetic_pages(count)
+        start = time.perf_counter()
+        for category, page in pages:
+            endpoint_icon(category, page)
+            action_group_for(page)
+            service_for_group(category.replace('-', ' ').title())
+        elapsed = time.perf_counter() - start
+        print(f"Classified {count} endpoints in {elapsed:.3f}s "
+              f"({elapsed / max(count, 1) * 1e6:.2f} µs/endpoint)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped endpoint lookup table.
+Resolves an operation ("POST /api/camera/getMediaUris"), an operationId, a page slug or
+a page path to the endpoint's title, category, deprecation flag and the byte ranges of
+its entries in the search index and the llms shards. Keys live in one sorted table, so a
+lookup is a binary search over the mapped file with nothing parsed at startup.
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from docs_paths import DOCS_DIR
+
+LOOKUP_FILE = DOCS_DIR / ".cache" / "endpoint-lookup.bin"
+
+MAGIC = b"RELK"
+FORMAT_VERSION = 1
+# magic, version, record count, key count, then section offsets:
+# record table, record metadata, key table, key strings
+HEADER = struct.Struct("<4sIII4Q")
+# per record: metadata offset, metadata length
+RECORD_ENTRY = struct.Struct("<II")
+# per key: string offset, string length, record id
+KEY_ENTRY = struct.Struct("<III")
+
+# Key kinds, stored as "<kind>:<value>" so one sorted table serves every kind
+KEY_KINDS = ("operation", "operationId", "slug", "page")
+
+
+def operation_key(method: str, path: str) -> str:
+    return f"{method.upper()} {path}"
+
+
+def record_keys(record: Dict) -> List[str]:
+    """Every ``kind:value`` key that resolves to ``record``."""
+    keys = [f"operation:{operation_key(record['method'], record['path'])}",
+            f"slug:{record['slug']}", f"page:{record['page']}"]
+    if record.get('operationId'):
+        keys.append(f"operationId:{record['operationId']}")
+    return keys
+
+
+def build_lookup(records: List[Dict]) -> bytes:
+    """Serialize endpoint records into the lookup format.
+
+    Each record is a JSON object with at least ``method``, ``path``, ``slug`` and
+    ``page``; it is stored whole and returned as-is by lookups.
+    """
+    record_table = bytearray()
+    record_meta = bytearray()
+    keys = []
+    for record_id, record in enumerate(records):
+        meta = json.dumps(record, separators=(',', ':')).encode('utf-8')
+        record_table += RECORD_ENTRY.pack(len(record_meta), len(meta))
+        record_meta += meta
+        keys += [(key.encode('utf-8'), record_id) for key in record_keys(record)]
+
+    key_table = bytearray()
+    key_strings = bytearray()
+    for key, record_id in sorted(keys):
+        key_table += KEY_ENTRY.pack(len(key_strings), len(key), record_id)
+        key_strings += key
+
+    sections = [bytes(record_table), bytes(record_meta), bytes(key_table), bytes(key_strings)]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        position += -position % 4
+        offsets.append(position)
+        position += len(section)
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(records), len(keys), *offsets))
+    for offset, section in zip(offsets, sections):
+        out += b'\0' * (offset - len(out))
+        out += section
+    return bytes(out)
+
+
+class EndpointLookup:
+    """Memory-mapped reader for a table written by ``build_lookup``."""
+
+    def __init__(self, path: Path = LOOKUP_FILE):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.record_count, self.key_count,
+         self._records, self._meta, self._keys, self._strings) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} endpoint lookup table")
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self) -> "EndpointLookup":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _key(self, position: int) -> bytes:
+        offset, length, _ = KEY_ENTRY.unpack_from(self._mmap, self._keys + position * KEY_ENTRY.size)
+        start = self._strings + offset
+        return self._mmap[start:start + length]
+
+    def record(self, record_id: int) -> Dict:
+        offset, length = RECORD_ENTRY.unpack_from(self._mmap, self._records + record_id * RECORD_ENTRY.size)
+        start = self._meta + offset
+        return json.loads(self._mmap[start:start + length])
+
+    def find(self, kind: str, value: str) -> List[Dict]:
+        """Records whose ``kind`` key equals ``value``, by binary search."""
+        key = f"{kind}:{value}".encode('utf-8')
+        low, high = 0, self.key_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        results = []
+        while low < self.key_count and self._key(low) == key:
+            record_id = KEY_ENTRY.unpack_from(self._mmap, self._keys + low * KEY_ENTRY.size)[2]
+            results.append(self.record(record_id))
+            low += 1
+        return results
+
+    def operation(self, method: str, path: str) -> Optional[Dict]:
+        found = self.find("operation", operation_key(method, path))
+        return found[0] if found else None
+
+    def operation_id(self, operation_id: str) -> List[Dict]:
+        return self.find("operationId", operation_id)
+
+    def slug(self, slug: str) -> List[Dict]:
+        return self.find("slug", slug)
+
+    def page(self, page: str) -> List[Dict]:
+        return self.find("page", page.strip('/'))
+
+    def resolve(self, query: str) -> List[Dict]:
+        """Look ``query`` up as whichever kind of key it looks like."""
+        query = query.strip()
+        parts = query.split()
+        if len(parts) == 2 and parts[1].startswith('/'):
+            found = self.operation(*parts)
+            return [found] if found else []
+        if '/' in query:
+            return self.page(query)
+        return self.operation_id(query) or self.slug(query.lower())
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Look up an endpoint in the lookup table")
+    parser.add_argument('query', nargs='+',
+                        help='"METHOD /path", an operationId, a page slug or a page path')
+    parser.add_argument('--table', type=Path, default=LOOKUP_FILE, help='Table built by build-endpoint-lookup.py')
+    parser.add_argument('--json', action='store_true', help='Print matches as JSON')
+    args = parser.parse_args()
+
+    if not args.table.exists():
+        print(f"❌ Endpoint lookup table not found: {args.table}")
+        print("   Run 'python3 scripts/build-endpoint-lookup.py' first")
+        return 1
+
+    started = time.perf_counter()
+    with EndpointLookup(args.table) as table:
+        results = table.resolve(' '.join(args.query))
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0 if results else 1
+
+    if not results:
+        print(f"❌ No endpoint matches '{' '.join(args.query)}'")
+        return 1
+    print(f"🔍 {len(results)} match(es) in {elapsed:.2f} ms\n")
+    for record in results:
+        deprecated = " (deprecated)" if record.get('deprecated') else ""
+        print(f"{record['method']} {record['path']}{deprecated}")
+        print(f"    {record['title']}  [{record['category']}]")
+        print(f"    /{record['page']}")
+        if record.get('search'):
+            print(f"    search index: bytes {record['search']['offset']}+{record['search']['length']}")
+        if record.get('llms'):
+            print(f"    {record['llms']['file']}: bytes {record['llms']['offset']}+{record['llms']['length']}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
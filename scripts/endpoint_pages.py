@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Shared naming rules for generated endpoint pages.
+Maps OpenAPI paths to the MDX files and navigation paths under api-reference/endpoint/.
+"""
+
+import re
+from typing import Dict, Set
+
+ENDPOINT_PAGE_ROOT = "api-reference/endpoint"
+DEFAULT_TAG = "Default"
+
+
+def category_slug(tag: str) -> str:
+    """Category file stem for a tag, matching generate_navigation_structure's mapping."""
+    slug = tag.lower().replace(' webservice', '').replace(' ', '-')
+    return re.sub(r'[^a-z0-9._-]', '', slug) or 'default'
+
+
+class CategoryFiles:
+    """Category file stems by tag, assigned the way split-openapi.py names its files.
+
+    A tag's stem is its slug, unless an earlier tag already took that slug (e.g.
+    "Camera Webservice" and "Camera"); then the number of tags seen so far is
+    appended. Stems depend on the order tags first appear, so feed every
+    operation of a spec through ``stem`` in spec order.
+    """
+
+    def __init__(self):
+        self.stems: Dict[str, str] = {}
+        self._taken: Set[str] = set()
+
+    def stem(self, tag: str) -> str:
+        stem = self.stems.get(tag)
+        if stem is None:
+            stem = category_slug(tag)
+            if stem in self._taken:
+                stem = f"{stem}-{len(self.stems)}"
+            self.stems[tag] = stem
+            self._taken.add(stem)
+        return stem
+
+
+def operation_tag(operation: dict) -> str:
+    """The tag an operation is filed under: its first tag, or DEFAULT_TAG."""
+    tags = operation.get('tags') or [DEFAULT_TAG]
+    return tags[0]
+
+
+def sanitize_filename(name: str) -> str:
+    """Convert endpoint path to valid filename."""
+    # Remove /api/ prefix and convert to lowercase
+    name = name.replace("/api/", "").lower()
+    # Replace slashes with hyphens
+    name = name.replace("/", "-")
+    # Remove special characters
+    name = re.sub(r'[^a-z0-9\-]', '', name)
+    return name
+
+
+def endpoint_page_path(category: str, path: str) -> str:
+    """Navigation path (no extension) of the page documenting ``path`` in ``category``."""
+    return f"{ENDPOINT_PAGE_ROOT}/{category}/{sanitize_filename(path)}"
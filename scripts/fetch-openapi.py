@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Fetch the public OpenAPI spec with conditional, compressed requests.
+Sends the stored ETag/Last-Modified so an unchanged spec costs a 304, accepts gzip and
+deflate, skips everything when the body hashes to the spec already on disk, and
+validates the spec and extracts its stats in a single parse.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import urllib.error
+import urllib.request
+import zlib
+from email.message import Message
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from docs_paths import DOCS_DIR
+from output_writer import write_if_changed, write_json_if_changed
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Configuration
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+CACHE_FILE = DOCS_DIR / ".cache" / "openapi-fetch.json"
+BASE_URL = "https://api2.rhombussystems.com"
+SPEC_PATH = "/api/openapi/public.json"
+USER_AGENT = "rhombus-docs-fetch-openapi"
+
+
+def decode_body(body: bytes, encoding: str) -> bytes:
+    """Undo the response's Content-Encoding."""
+    encoding = encoding.strip().lower()
+    if encoding in ('', 'identity'):
+        return body
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        # Servers disagree on whether deflate means zlib-wrapped or raw
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+def spec_stats(body: bytes) -> Dict:
+    """Validate an OpenAPI document and return its title, version and path count."""
+    spec = PROFILER.parse_json(body)
+    if not isinstance(spec, dict) or not isinstance(spec.get('paths'), dict):
+        raise ValueError("Document has no 'paths' object")
+    info = spec.get('info') if isinstance(spec.get('info'), dict) else {}
+    return {
+        "title": info.get('title') or "Unknown",
+        "version": info.get('version') or "Unknown",
+        "endpoints": len(spec['paths']),
+    }
+
+
+def load_cache(cache_file: Path, spec_file: Path) -> Dict:
+    """Cached validators and stats, trusted only while the spec on disk is unchanged."""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        stat = os.stat(spec_file)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('size') == stat.st_size and cache.get('mtime') == stat.st_mtime_ns:
+        return cache
+    # The spec was touched since the last fetch; keep the entry only if its content still matches
+    if cache.get('sha256') == hashlib.sha256(PROFILER.read_bytes(spec_file)).hexdigest():
+        cache.update(size=stat.st_size, mtime=stat.st_mtime_ns)
+        return cache
+    return {}
+
+
+def fetch(url: str, cache: Dict, timeout: float) -> Tuple[int, bytes, Message]:
+    """GET ``url`` conditionally; returns status, decoded body and response headers."""
+    headers = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate", "User-Agent": USER_AGENT}
+    if cache.get('etag'):
+        headers["If-None-Match"] = cache['etag']
+    if cache.get('last_modified'):
+        headers["If-Modified-Since"] = cache['last_modified']
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            raw = response.read()
+            PROFILER.count("bytes_read", len(raw))
+            return response.status, decode_body(raw, response.headers.get('Content-Encoding', '')), response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b'', e.headers
+        raise
+
+
+def write_github_output(path: Optional[str], values: Dict):
+    """Append ``key=value`` lines for later workflow steps."""
+    if not path:
+        return
+    with open(path, 'a') as f:
+        for key, value in values.items():
+            f.write(f"{key}={str(value).replace(chr(10), ' ')}\n")
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--base-url', default=BASE_URL, help='API origin to fetch the spec from')
+    parser.add_argument('--spec-path', default=SPEC_PATH, help='Path of the spec on the API origin')
+    parser.add_argument('--output', type=Path, default=OPENAPI_FILE, help='Where to store the spec')
+    parser.add_argument('--cache-file', type=Path, default=CACHE_FILE,
+                        help='Where ETag, Last-Modified, hash and stats are remembered')
+    parser.add_argument('--backup', type=Path, metavar='FILE',
+                        help='Keep the previous spec here when it changes (e.g. for diff-openapi.py)')
+    parser.add_argument('--github-output', metavar='FILE',
+                        help='Append changed/title/version/endpoints for GitHub Actions')
+    parser.add_argument('--force', action='store_true', help='Ignore cached validators')
+    parser.add_argument('--timeout', type=float, default=60, help='Request timeout in seconds')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "fetch-openapi")
+
+    url = args.base_url.rstrip('/') + args.spec_path
+    print("🔄 Fetching latest OpenAPI spec from Rhombus API...")
+    print(f"📡 Source: {url}")
+
+    cache = {} if args.force else load_cache(args.cache_file, args.output)
+
+    try:
+        with PROFILER.stage("fetch"):
+            status, body, headers = fetch(url, cache, args.timeout)
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        print(f"❌ Failed to download OpenAPI spec: {e}")
+        PROFILER.finish()
+        return 1
+
+    changed = False
+    if status == 304:
+        print("✅ Not modified since last fetch (HTTP 304)")
+        stats = cache['stats']
+    else:
+        digest = hashlib.sha256(body).hexdigest()
+        if cache.get('sha256') == digest:
+            print("✅ Downloaded spec is identical to the current one")
+            stats = cache['stats']
+        else:
+            try:
+                with PROFILER.stage("validate"):
+                    stats = spec_stats(body)
+            except ValueError as e:
+                print(f"❌ Downloaded spec is not a valid OpenAPI document: {e}")
+                PROFILER.finish()
+                return 1
+            print("✅ OpenAPI spec is valid JSON")
+
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            with PROFILER.stage("write"):
+                changed = write_if_changed(args.output, body, backup=args.backup)
+            print(f"✅ {'Updated' if changed else 'Unchanged'}: {args.output}")
+        cache['sha256'] = digest
+
+    stat = os.stat(args.output)
+    cache.update(
+        etag=headers.get('ETag') or cache.get('etag'),
+        last_modified=headers.get('Last-Modified') or cache.get('last_modified'),
+        size=stat.st_size,
+        mtime=stat.st_mtime_ns,
+        stats=stats,
+    )
+    args.cache_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json_if_changed(args.cache_file, cache, indent=2)
+
+    print("📊 API Info:")
+    print(f"   Title: {stats['title']}")
+    print(f"   Version: {stats['version']}")
+    print(f"   Endpoints: {stats['endpoints']}")
+
+    write_github_output(args.github_output, {"changed": str(changed).lower(), **stats})
+
+    if changed:
+        print("\n💡 Next steps:")
+        print("   1. Run 'python3 scripts/split-openapi.py' to refresh the category files")
+    PROFILER.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Persistent index of MDX frontmatter.
+Entries are keyed by path, size and mtime, so unchanged pages are answered from the
+index without being opened. Cache misses read only up to the closing --- marker.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from stage_profiler import PROFILER
+
+INDEX_FILE = Path(".cache") / "frontmatter-index.json"
+INDEX_VERSION = 1
+
+
+def parse_frontmatter_lines(lines: Iterable[str]) -> Dict[str, str]:
+    """Parse ``key: value`` frontmatter lines, stripping surrounding quotes."""
+    frontmatter = {}
+    for line in lines:
+        if ':' in line:
+            key, value = line.split(':', 1)
+            frontmatter[key.strip()] = value.strip().strip('"\'')
+    return frontmatter
+
+
+def read_frontmatter_header(file_path: Path) -> Dict[str, str]:
+    """Read the frontmatter of an MDX file without reading past its closing marker."""
+    size = 0
+    try:
+        with open(file_path, 'rb') as f:
+            first = f.readline()
+            size += len(first)
+            if first.rstrip() != b'---':
+                return {}
+            lines = []
+            for line in f:
+                size += len(line)
+                if line.rstrip() == b'---':
+                    return parse_frontmatter_lines(lines)
+                lines.append(line.decode('utf-8').rstrip('\n'))
+    except (OSError, UnicodeDecodeError):
+        pass
+    finally:
+        if size:
+            PROFILER.count("files_read")
+            PROFILER.count("bytes_read", size)
+    return {}
+
+
+class FrontmatterIndex:
+    """Frontmatter of every MDX file under ``base_dir``, persisted between runs."""
+
+    def __init__(self, base_dir: Path, index_file: Optional[Path] = None):
+        self.base_dir = Path(base_dir)
+        self.index_file = index_file or self.base_dir / INDEX_FILE
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = PROFILER.load_json(self.index_file)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION:
+            self.entries = data.get('entries', {})
+
+    def _key(self, file_path: Path) -> str:
+        path = Path(file_path)
+        try:
+            return path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def get(self, file_path: Path) -> Dict[str, str]:
+        """Frontmatter fields of ``file_path``; only stats the file when it is unchanged."""
+        key = self._key(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            if self.entries.pop(key, None) is not None:
+                self._dirty = True
+            return {}
+
+        entry = self.entries.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            self.hits += 1
+            return entry['fields']
+
+        self.misses += 1
+        fields = read_frontmatter_header(file_path)
+        self.entries[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "fields": fields}
+        self._dirty = True
+        return fields
+
+    def title(self, file_path: Path) -> str:
+        return self.get(file_path).get('title', '')
+
+    def description(self, file_path: Path) -> str:
+        return self.get(file_path).get('description', '')
+
+    def icon(self, file_path: Path) -> str:
+        return self.get(file_path).get('icon', '')
+
+    def operation(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        """``(METHOD, path)`` from the page's ``openapi:`` field, if any."""
+        value = self.get(file_path).get('openapi', '')
+        parts = value.split()
+        if len(parts) < 2:
+            return None
+        return parts[-2].upper(), parts[-1]
+
+    def deprecated(self, file_path: Path) -> bool:
+        return self.get(file_path).get('deprecated', '').lower() == 'true'
+
+    def prune(self, keep: Iterable[Path]):
+        """Forget every entry not in ``keep``."""
+        keys = {self._key(path) for path in keep}
+        for key in list(self.entries):
+            if key not in keys:
+                del self.entries[key]
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Persist the index if anything changed since it was loaded."""
+        if not self._dirty:
+            return False
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        PROFILER.dump_json({"version": INDEX_VERSION, "entries": self.entries}, tmp_file, separators=(',', ':'))
+        os.replace(tmp_file, self.index_file)
+        self._dirty = False
+        return True
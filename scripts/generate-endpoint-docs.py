@@ -4,26 +4,179 @@ Generate Mintlify endpoint documentation from OpenAPI split files.
 Creates organized MDX files for all API endpoints with proper navigation.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from docs_paths import DOCS_DIR, DOCS_JSON
+from endpoint_classification import endpoint_icon
+from endpoint_pages import ENDPOINT_PAGE_ROOT, category_slug, endpoint_page_path, sanitize_filename
+from openapi_fragments import FRAGMENT_MODES, FRAGMENT_ROOT, build_fragment, fragment_file
+from output_writer import write_if_changed
+from schema_fields import DEFAULT_MAX_CHARS, DEFAULT_MAX_DEPTH, SchemaFieldRenderer
+from schema_graph import SchemaGraph
+from schema_store import SchemaStore
+from script_loader import load_script
+from stage_profiler import PROFILER, add_profile_arguments
 
 # Configuration
-SPLIT_DIR = Path("docs/api-reference/openapi-split")
-ENDPOINT_DIR = Path("docs/api-reference/endpoint")
+SPLIT_DIR = DOCS_DIR / "api-reference" / "openapi-split"
+ENDPOINT_DIR = DOCS_DIR / ENDPOINT_PAGE_ROOT
 SCHEMAS_DIR = SPLIT_DIR / "schemas"
+MANIFEST_FILE = ENDPOINT_DIR / "_manifest.json"
+NAV_OUTPUT_FILE = ENDPOINT_DIR / "_navigation.json"
+SCHEMA_GRAPH_FILE = SPLIT_DIR / "_schema_graph.json"
+BASE_FILE = SPLIT_DIR / "_base.json"
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+FRAGMENT_REPORT_FILE = DOCS_DIR / ".cache" / "openapi-fragments-report.json"
+
+# Bump whenever generate_mdx_content output changes so every page is re-rendered once
+GENERATOR_VERSION = 3
+
+def content_hash(data: Any) -> str:
+    """Return a stable SHA-256 hex digest for bytes, text or JSON-serializable data."""
+    if not isinstance(data, (str, bytes)):
+        data = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def page_file(nav_path: str) -> Path:
+    """Resolve a navigation page path back to its MDX file."""
+    return DOCS_DIR / f"{nav_path}.mdx"
+
+def load_manifest(fields: Optional[Dict] = None, fragments: Optional[str] = None) -> Dict:
+    """Load the build manifest, discarding it if it was written by another generator version
+    or with other field rendering or OpenAPI fragment options."""
+    empty = {"version": GENERATOR_VERSION, "fields": fields, "fragments": fragments, "categories": {}}
+    if not MANIFEST_FILE.exists():
+        return empty
+
+    try:
+        manifest = PROFILER.load_json(MANIFEST_FILE)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable manifest {MANIFEST_FILE}: {e}")
+        return empty
+
+    if manifest.get('version') != GENERATOR_VERSION:
+        print(f"ℹ️  Generator version changed, regenerating all pages")
+        return empty
+    if manifest.get('fields') != fields:
+        print(f"ℹ️  Field rendering options changed, regenerating all pages")
+        return empty
+    if manifest.get('fragments') != fragments:
+        print(f"ℹ️  OpenAPI fragment mode changed, regenerating all pages")
+        return empty
+    return manifest
+
+def save_manifest(manifest: Dict) -> bool:
+    """Persist the build manifest, leaving the file untouched when nothing changed."""
+    content = PROFILER.dumps_json(manifest, indent=2, sort_keys=True) + "\n"
+    return write_if_changed(MANIFEST_FILE, content)
+
+def prune_pages(pages: Dict[str, Dict], keep: set) -> int:
+    """Delete generated pages whose operation no longer exists."""
+    removed = 0
+    for record in pages.values():
+        if record['page'] in keep:
+            continue
+        filepath = page_file(record['page'])
+        if filepath.exists():
+            filepath.unlink()
+            removed += 1
+    return removed
+
+# Per-process schema store and renderers, so shared models are parsed and rendered
+# once per worker rather than per category
+SCHEMA_STORE = SchemaStore(SCHEMAS_DIR)
+_FIELD_RENDERERS: Dict[Tuple, SchemaFieldRenderer] = {}
+
+def field_renderer(fields: Dict) -> SchemaFieldRenderer:
+    """The memoizing schema renderer for a set of field rendering options."""
+    key = (fields['depth'], fields['max_chars'])
+    if key not in _FIELD_RENDERERS:
+        _FIELD_RENDERERS[key] = SchemaFieldRenderer(SCHEMA_STORE, max_depth=fields['depth'],
+                                                    max_chars=fields['max_chars'])
+    return _FIELD_RENDERERS[key]
+
+def render_counters() -> Dict[str, int]:
+    """Field renderer and schema store counters of this process."""
+    counters = dict.fromkeys(("fragments", "hits", "truncated_pages"), 0)
+    for renderer in _FIELD_RENDERERS.values():
+        stats = renderer.stats()
+        for key in counters:
+            counters[key] += stats[key]
+    store = SCHEMA_STORE.stats()
+    for key in ("hits", "misses", "evictions"):
+        counters[f"store_{key}"] = store[key]
+    return counters
+
+def process_category_job(*args) -> Tuple[Tuple[Dict, Dict], Dict[str, int]]:
+    """process_category_file in a worker process, plus the counters it added there."""
+    before = render_counters()
+    result = process_category_file(*args)
+    after = render_counters()
+    return result, {key: after[key] - before[key] for key in after}
+
+@lru_cache(maxsize=None)
+def load_base() -> Dict:
+    """Top-level spec fields other than paths and component schemas, from split-openapi.py."""
+    try:
+        return PROFILER.load_json(BASE_FILE)
+    except (OSError, ValueError):
+        return {}
+
+def page_schema_digests(category: str, graph: SchemaGraph, schema_hashes: Dict[str, str],
+                        base_hash: Optional[str] = None) -> Dict[str, str]:
+    """Per page of ``category``, a hash of every schema its fields and fragment are built from."""
+    prefix = f"{ENDPOINT_PAGE_ROOT}/{category}/"
+    return {
+        page: content_hash([base_hash, {name: schema_hashes.get(name) for name in sorted(graph.endpoint_schemas(page))}])
+        for page in graph.endpoints if page.startswith(prefix)
+    }
 
-def sanitize_filename(name: str) -> str:
-    """Convert endpoint path to valid filename."""
-    # Remove /api/ prefix and convert to lowercase
-    name = name.replace("/api/", "").lower()
-    # Replace slashes with hyphens
-    name = name.replace("/", "-")
-    # Remove special characters
-    name = re.sub(r'[^a-z0-9\-]', '', name)
-    return name
+def write_fragment(fragment_path: str, paths: Dict[str, Dict]) -> Tuple[int, bool]:
+    """Write the OpenAPI fragment for ``paths``; returns its size and whether it changed."""
+    content = PROFILER.dumps_json(build_fragment(load_base(), paths, SCHEMA_STORE), indent=2) + "\n"
+    target = DOCS_DIR / fragment_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return len(content.encode('utf-8')), write_if_changed(target, content)
+
+def prune_fragments(categories: Dict[str, Dict]) -> int:
+    """Delete fragment files no page record points at, e.g. after a mode change."""
+    root = DOCS_DIR / FRAGMENT_ROOT
+    if not root.exists():
+        return 0
+    keep = {DOCS_DIR / record['fragment'] for category in categories.values()
+            for record in category.get('pages', {}).values() if record.get('fragment')}
+    removed = 0
+    for path in sorted(root.rglob("*.json"), reverse=True):
+        if path not in keep:
+            path.unlink()
+            removed += 1
+    for directory in sorted((d for d in root.rglob("*") if d.is_dir()), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+    if not any(root.iterdir()):
+        root.rmdir()
+    return removed
+
+def fragment_report(categories: Dict[str, Dict], spec_bytes: int) -> Dict:
+    """Per-page size of the referenced fragment against the monolithic spec."""
+    pages = sorted(
+        ({"page": record['page'], "fragment": record['fragment'], "bytes": record['fragment_bytes'],
+          "reduction": round(1 - record['fragment_bytes'] / spec_bytes, 4) if spec_bytes else None}
+         for category in categories.values() for record in category.get('pages', {}).values()
+         if record.get('fragment')),
+        key=lambda entry: entry['page'])
+    return {"spec_bytes": spec_bytes, "files": len({entry['fragment'] for entry in pages}), "pages": pages}
 
 def get_method_and_summary(endpoint_data: Dict) -> tuple:
     """Extract HTTP method and summary from endpoint data."""
@@ -33,8 +186,11 @@ def get_method_and_summary(endpoint_data: Dict) -> tuple:
             return method.upper(), details.get('summary', ''), details.get('description', ''), details.get('deprecated', False)
     return 'POST', '', '', False
 
-def generate_mdx_content(path: str, endpoint_data: Dict, category: str) -> str:
-    """Generate MDX content for an endpoint."""
+def generate_mdx_content(path: str, endpoint_data: Dict, category: str,
+                         renderer: Optional[SchemaFieldRenderer] = None,
+                         openapi_file: Optional[str] = None) -> str:
+    """Generate MDX content for an endpoint, with static field blocks when given a renderer
+    and the ``openapi:`` reference pointing into ``openapi_file`` when given one."""
     method, summary, description, deprecated = get_method_and_summary(endpoint_data)
 
     # Use summary as title, fallback to path
@@ -45,30 +201,15 @@ def generate_mdx_content(path: str, endpoint_data: Dict, category: str) -> str:
     if len(desc) > 160:
         desc = desc[:157] + "..."
 
-    # Determine icon based on category
-    icon_map = {
-        'camera': 'camera',
-        'access-control': 'lock',
-        'user': 'user',
-        'event': 'calendar',
-        'location': 'map-pin',
-        'door': 'door-open',
-        'sensor': 'sensor',
-        'video': 'video',
-        'alert': 'bell',
-        'org': 'building',
-        'webhook': 'webhook',
-        'oauth': 'key',
-        'report': 'chart-bar'
-    }
-
-    icon = icon_map.get(category, 'circle-dot')
+    # Same icon improve-endpoint-navigation.py would assign, so pages need no later patch
+    icon = endpoint_icon(category, sanitize_filename(path))
+    operation = f"/{openapi_file} {method} {path}" if openapi_file else f"{method} {path}"
 
     # Build frontmatter
     frontmatter = f"""---
 title: "{title}"
 description: "{desc}"
-openapi: "{method} {path}"
+openapi: "{operation}"
 icon: "{icon}"
 """
 
@@ -91,63 +232,133 @@ icon: "{icon}"
     # Note about auto-generated docs
     content += '<Note>\nThe parameters and response fields below are automatically generated from the OpenAPI specification.\n</Note>\n'
 
+    if renderer is not None:
+        fields = renderer.render_operation(endpoint_data.get(method.lower(), {}), endpoint_data.get('parameters'))
+        if fields:
+            content += f"\n{fields}\n"
+
     return content
 
-def process_category_file(category_file: Path) -> Dict[str, str]:
-    """Process a category JSON file and generate MDX files."""
-    print(f"Processing: {category_file.name}")
+def process_category_file(category_file: Path, previous: Optional[Dict] = None,
+                          force: bool = False, fields: Optional[Dict] = None,
+                          schema_digests: Optional[Dict[str, str]] = None,
+                          fragments: Optional[str] = None) -> Tuple[Dict[str, str], Dict]:
+    """Process a category JSON file and generate MDX files.
+
+    ``previous`` is this category's record from the build manifest. Endpoints whose
+    operation hash matches it are neither rendered nor written, and pages of removed
+    operations are deleted. With ``fields``, pages get static field blocks and
+    ``schema_digests`` (see page_schema_digests) joins the hashes, so a changed
+    model re-renders the pages that show it. With ``fragments`` ("category" or
+    "endpoint"), each page references a slim OpenAPI document written alongside it
+    (see openapi_fragments.py), whose schemas are covered by the same digests.
+    Returns the ``{path: nav_path}`` map and the new record.
+    """
+    previous = previous or {"source": None, "pages": {}}
+    previous_pages = previous.get('pages', {})
+    category = category_file.stem
 
-    with open(category_file, 'r') as f:
-        data = json.load(f)
+    raw = PROFILER.read_bytes(category_file)
+    source_hash = content_hash(raw)
+    if fields is not None or fragments:
+        source_hash = content_hash([source_hash, schema_digests or {}])
+    renderer = field_renderer(fields) if fields is not None else None
+
+    # Fast path: the category file is byte-identical and every page (and fragment) is still on disk
+    if not force and previous.get('source') == source_hash and all(
+        page_file(record['page']).exists()
+        and (not record.get('fragment') or (DOCS_DIR / record['fragment']).exists())
+        for record in previous_pages.values()
+    ):
+        print(f"Unchanged: {category_file.name}")
+        return {path: record['page'] for path, record in previous_pages.items()}, previous
+
+    print(f"Processing: {category_file.name}")
+    data = PROFILER.parse_json(raw)
 
-    category = category_file.stem
     category_display = data.get('tag', category)
     paths = data.get('paths', {})
 
     if not paths:
         print(f"  ⚠️  No paths found in {category_file.name}")
-        return {}
+        removed = prune_pages(previous_pages, set())
+        if removed:
+            print(f"  🗑️  Removed {removed} stale page(s)")
+        return {}, {"source": source_hash, "pages": {}}
 
     # Create category directory
     category_dir = ENDPOINT_DIR / category
     category_dir.mkdir(parents=True, exist_ok=True)
 
     generated_files = {}
-    endpoint_count = 0
+    pages = {}
+    written = 0
+    skipped = 0
+
+    # One fragment for the whole category, rewritten only when its content changes
+    category_fragment = None
+    if fragments == "category":
+        category_fragment = fragment_file(fragments, category, "")
+        category_fragment_bytes, _ = write_fragment(category_fragment, paths)
 
     for path, methods in paths.items():
         # Generate filename from path
         filename = sanitize_filename(path) + ".mdx"
         filepath = category_dir / filename
 
+        # Store path WITHOUT .mdx extension for navigation
+        nav_path = endpoint_page_path(category, path)
+        generated_files[path] = nav_path
+
+        operation_hash = content_hash({"category": category, "operation": methods})
+        if fields is not None or fragments:
+            operation_hash = content_hash([operation_hash, (schema_digests or {}).get(nav_path)])
+        fragment = category_fragment or (fragment_file(fragments, category, path) if fragments else None)
+        record = previous_pages.get(path)
+
+        if (not force and record and record['source'] == operation_hash
+                and record['page'] == nav_path and filepath.exists()
+                and record.get('fragment') == fragment
+                and (fragment is None or (DOCS_DIR / fragment).exists())):
+            if category_fragment:
+                record = dict(record, fragment_bytes=category_fragment_bytes)
+            pages[path] = record
+            skipped += 1
+            continue
+
         # Generate MDX content
-        mdx_content = generate_mdx_content(path, methods, category)
+        mdx_content = generate_mdx_content(path, methods, category, renderer, fragment)
+        output_hash = content_hash(mdx_content)
 
-        # Write file
-        with open(filepath, 'w') as f:
-            f.write(mdx_content)
+        # Write file only when the rendered page differs from what is on disk
+        if not (record and record['output'] == output_hash and filepath.exists()):
+            written += write_if_changed(filepath, mdx_content)
 
-        # Store path WITHOUT .mdx extension for navigation
-        nav_path = str(filepath.relative_to('docs')).replace('.mdx', '')
-        generated_files[path] = nav_path
-        endpoint_count += 1
+        pages[path] = {"page": nav_path, "source": operation_hash, "output": output_hash}
+        if fragment:
+            pages[path]['fragment'] = fragment
+            pages[path]['fragment_bytes'] = (category_fragment_bytes if category_fragment
+                                             else write_fragment(fragment, {path: methods})[0])
+
+    removed = prune_pages(previous_pages, set(generated_files.values()))
 
-    print(f"  ✅ Generated {endpoint_count} endpoint(s) in {category}/")
-    return generated_files
+    print(f"  ✅ {len(generated_files)} endpoint(s) in {category}/ "
+          f"({written} written, {skipped} unchanged, {removed} removed)")
+    return generated_files, {"source": source_hash, "pages": pages}
 
 def generate_navigation_structure(all_endpoints: Dict[str, Dict[str, str]]) -> List[Dict]:
     """Generate navigation structure for docs.json."""
     nav_groups = []
 
     # Load category display names from index
-    with open(SPLIT_DIR / "_index.json", 'r') as f:
-        index_data = json.load(f)
-        categories = index_data.get('categories', [])
+    index_data = PROFILER.load_json(SPLIT_DIR / "_index.json")
+    categories = index_data.get('categories', [])
+    files = index_data.get('files', {})
 
     # Create mapping from filename to display name
     category_names = {}
     for cat in categories:
-        filename = cat.lower().replace(' webservice', '').replace(' ', '-')
+        filename = Path(files[cat]).stem if cat in files else category_slug(cat)
         category_names[filename] = cat.replace(' Webservice', '')
 
     for category, endpoints in sorted(all_endpoints.items()):
@@ -166,6 +377,38 @@ def generate_navigation_structure(all_endpoints: Dict[str, Dict[str, str]]) -> L
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate every page, ignoring the build manifest')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes, one category each (0 = all CPUs); '
+                             'with --profile, I/O inside workers is not counted')
+    parser.add_argument('--changes', type=Path, metavar='FILE',
+                        help='Change set from diff-openapi.py; categories it does not touch '
+                             'are carried over from the manifest without being read')
+    parser.add_argument('--fields', action='store_true',
+                        help='Render parameter and response fields statically from the split schemas')
+    parser.add_argument('--field-depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help='Levels of nested <Expandable> properties to render with --fields')
+    parser.add_argument('--field-max-chars', type=int, default=DEFAULT_MAX_CHARS,
+                        help='Per-page cap on rendered field blocks with --fields')
+    parser.add_argument('--openapi-fragments', choices=FRAGMENT_MODES,
+                        help='Write a slim OpenAPI document per category or per endpoint under '
+                             f'{FRAGMENT_ROOT}/ and point each page\'s openapi: frontmatter at it')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+    fields = {"depth": args.field_depth, "max_chars": args.field_max_chars} if args.fields else None
+    PROFILER.configure(args, "generate-endpoint-docs")
+
+    changed_categories = None
+    if args.changes:
+        changes = load_script("diff-openapi").load_changes(args.changes)
+        if changes is None:
+            print(f"⚠️  Could not read change set {args.changes}, processing every category")
+        else:
+            changed_categories = set(changes['affected']['categories'])
+
     print("🔨 Generating Mintlify endpoint documentation from OpenAPI split files\n")
 
     # Ensure directories exist
@@ -179,33 +422,132 @@ def main():
 
     if not category_files:
         print("❌ No category files found in", SPLIT_DIR)
+        PROFILER.finish()
         return
 
     print(f"📁 Found {len(category_files)} category files\n")
 
-    # Process each category
+    with PROFILER.stage("load-manifest"):
+        manifest = load_manifest(fields, args.openapi_fragments)
+    previous_categories = manifest['categories']
+
+    # Process each category, fanning out to worker processes when requested.
+    # Results are merged in sorted file order so output matches the serial run.
+    category_files = sorted(category_files)
+    previous_records = [previous_categories.get(f.stem) for f in category_files]
+
+    # With a change set, untouched categories keep their manifest record as-is
+    carried = {}
+    if changed_categories is not None and not args.force:
+        for category_file, previous in zip(category_files, previous_records):
+            if (previous and category_file.stem not in changed_categories
+                    and all(page_file(r['page']).exists() for r in previous['pages'].values())):
+                carried[category_file] = ({path: record['page'] for path, record in previous['pages'].items()},
+                                          previous)
+        print(f"🎯 Change set touches {len(changed_categories)} categories, "
+              f"carrying over {len(carried)} unchanged\n")
+    pending = [(f, previous) for f, previous in zip(category_files, previous_records) if f not in carried]
+
+    # Static fields and fragments depend on the schemas too; hash each one once for every page that uses it
+    digests = {f: None for f, _ in pending}
+    if (fields is not None or args.openapi_fragments) and pending:
+        with PROFILER.stage("schema-digests"):
+            graph = SchemaGraph.load(SCHEMA_GRAPH_FILE) if SCHEMA_GRAPH_FILE.exists() else SchemaGraph()
+            schema_hashes = {}
+            for name in graph.edges:
+                path = SCHEMA_STORE.path(name)
+                try:
+                    schema_hashes[name] = content_hash(PROFILER.read_bytes(path)) if path else None
+                except OSError:
+                    schema_hashes[name] = None
+            base_hash = content_hash(PROFILER.read_bytes(BASE_FILE)) if args.openapi_fragments else None
+            digests = {f: page_schema_digests(f.stem, graph, schema_hashes, base_hash) for f, _ in pending}
+
+    # Worker processes report their rendering counters with each category
+    worker_counters: Dict[str, int] = {}
+    workers = 0
+    with PROFILER.stage("categories"):
+        if jobs > 1 and len(pending) > 1:
+            print(f"⚙️  Using {jobs} worker processes\n")
+            workers = jobs
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                processed = list(pool.map(process_category_job, [f for f, _ in pending],
+                                          [previous for _, previous in pending], repeat(args.force),
+                                          repeat(fields), [digests[f] for f, _ in pending],
+                                          repeat(args.openapi_fragments)))
+                results = dict(zip([f for f, _ in pending], (result for result, _ in processed)))
+                for _, added in processed:
+                    for key, value in added.items():
+                        worker_counters[key] = worker_counters.get(key, 0) + value
+        else:
+            results = {f: process_category_file(f, previous, args.force, fields, digests[f],
+                                                args.openapi_fragments)
+                       for f, previous in pending}
+        results.update(carried)
+
     all_endpoints = {}
+    categories = {}
     total_generated = 0
 
-    for category_file in sorted(category_files):
-        endpoints = process_category_file(category_file)
+    for category_file in category_files:
+        endpoints, record = results[category_file]
+        categories[category_file.stem] = record
         if endpoints:
             all_endpoints[category_file.stem] = endpoints
             total_generated += len(endpoints)
 
+    # Prune pages of categories that disappeared from the spec
+    for category, record in previous_categories.items():
+        if category not in categories:
+            removed = prune_pages(record.get('pages', {}), set())
+            print(f"🗑️  Removed category {category} ({removed} page(s))")
+
+    manifest['categories'] = categories
+    manifest['fields'] = fields
+    manifest['fragments'] = args.openapi_fragments
+    with PROFILER.stage("save-manifest"):
+        save_manifest(manifest)
+
     print(f"\n✅ Generated {total_generated} endpoint documentation pages")
+    counters = {key: value + worker_counters.get(key, 0) for key, value in render_counters().items()}
+    # Each worker keeps its own renderer and store, so shared models are rendered and parsed once per worker
+    scope = f" across {workers} workers" if workers else ""
+    if fields is not None:
+        print(f"🧩 Field blocks: {counters['fragments']} model fragments rendered{scope} and reused "
+              f"{counters['hits']} times, {counters['truncated_pages']} page(s) hit the size cap")
+    if counters['store_hits'] or counters['store_misses']:
+        print(f"📦 Schema store: {counters['store_misses']} parses of {len(SCHEMA_STORE)} schemas{scope}, "
+              f"{counters['store_hits']} cache hits, {counters['store_evictions']} evictions "
+              f"(LRU of {SCHEMA_STORE.max_entries})")
     print(f"📁 Output directory: {ENDPOINT_DIR}")
 
+    with PROFILER.stage("fragments"):
+        removed_fragments = prune_fragments(categories)
+    if removed_fragments:
+        print(f"🗑️  Removed {removed_fragments} stale OpenAPI fragment(s)")
+    if args.openapi_fragments:
+        spec_bytes = OPENAPI_FILE.stat().st_size if OPENAPI_FILE.exists() else 0
+        report = fragment_report(categories, spec_bytes)
+        FRAGMENT_REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(FRAGMENT_REPORT_FILE, PROFILER.dumps_json(report, indent=2) + "\n")
+        sizes = sorted(entry['bytes'] for entry in report['pages'])
+        if sizes and spec_bytes:
+            median = sizes[len(sizes) // 2]
+            print(f"📉 OpenAPI fragments: {report['files']} file(s); a page references {median / 1024:.1f} KB "
+                  f"(median, largest {sizes[-1] / 1024:.1f} KB) instead of {spec_bytes / 1024:.0f} KB, "
+                  f"{1 - median / spec_bytes:.1%} smaller")
+            print(f"   Per-page report: {FRAGMENT_REPORT_FILE}")
+
     # Generate navigation structure
     print("\n📚 Generating navigation structure...")
-    nav_structure = generate_navigation_structure(all_endpoints)
-
-    nav_output_file = Path("docs/api-reference/endpoint/_navigation.json")
-    with open(nav_output_file, 'w') as f:
-        json.dump(nav_structure, f, indent=2)
+    with PROFILER.stage("navigation"):
+        nav_structure = generate_navigation_structure(all_endpoints)
 
-    print(f"✅ Navigation structure saved to {nav_output_file}")
-    print(f"   Copy this into the 'API reference' tab in docs/docs.json")
+        if write_if_changed(NAV_OUTPUT_FILE, PROFILER.dumps_json(nav_structure, indent=2)):
+            print(f"✅ Navigation structure saved to {NAV_OUTPUT_FILE}")
+        else:
+            print(f"✅ Navigation structure unchanged in {NAV_OUTPUT_FILE}")
+    print(f"   Copy this into the 'API reference' tab in {DOCS_JSON}")
 
     # Show summary
     print("\n📊 Summary by Category:")
@@ -214,9 +556,11 @@ def main():
 
     print("\n🎉 Documentation generation complete!")
     print("\n💡 Next steps:")
-    print("   1. Review generated files in docs/api-reference/endpoint/")
-    print("   2. Update docs/docs.json with navigation from _navigation.json")
+    print(f"   1. Review generated files in {ENDPOINT_DIR}/")
+    print(f"   2. Update {DOCS_JSON} with navigation from _navigation.json")
     print("   3. Run 'mint dev' to preview the documentation")
 
+    PROFILER.finish()
+
 if __name__ == "__main__":
     main()
@@ -4,204 +4,138 @@ Improve endpoint navigation by adding better icons and organizing with accordion
 Groups endpoints by action type (Create, Read, Update, Delete, etc.) for cleaner navigation.
 """
 
-import json
-import os
+import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set
+
+from docs_paths import DOCS_DIR, DOCS_JSON
+from endpoint_classification import (
+    ACTION_GROUP_NAMES,
+    action_group_for,
+    endpoint_icon,
+)
+from frontmatter_index import FrontmatterIndex
+from output_writer import atomic_write, write_json_if_changed
+from stage_profiler import PROFILER, add_profile_arguments
 
 # Configuration
-ENDPOINT_DIR = Path("docs/api-reference/endpoint")
-DOCS_JSON = Path("docs/docs.json")
-BACKUP_JSON = Path("docs/docs.json.backup")
-
-# Icon mapping based on action type
-ACTION_ICONS = {
-    'create': 'square-plus',
-    'add': 'user-plus',
-    'upload': 'cloud-arrow-up',
-    'generate': 'wand-magic-sparkles',
-    'calibrate': 'sliders',
-    'initiate': 'play',
-    'trigger': 'bolt',
-
-    'get': 'eye',
-    'find': 'magnifying-glass',
-    'search': 'magnifying-glass',
-    'list': 'list',
-    'getall': 'list-check',
-    'findall': 'list-check',
-
-    'update': 'pen-to-square',
-    'edit': 'pen',
-    'modify': 'pen',
-    'assign': 'arrow-right-arrow-left',
-    'remove': 'user-minus',
-    'revoke': 'ban',
-    'suspend': 'pause',
-    'unsuspend': 'play',
-
-    'delete': 'trash-can',
-    'erase': 'eraser',
-
-    'unlock': 'lock-open',
-    'lock': 'lock',
-    'revert': 'arrow-rotate-left',
-}
-
-# Category-specific icons
-CATEGORY_ICONS = {
-    'access-control': 'key',
-    'camera': 'video',
-    'door': 'door-open',
-    'user': 'user',
-    'event': 'calendar',
-    'alert': 'bell',
-    'sensor': 'sensor',
-    'webhook': 'webhook',
-    'location': 'map-pin',
-    'org': 'building',
-    'oauth': 'shield-halved',
-    'face-recognition': 'face-smile',
-    'badge-reader': 'id-card',
-    'doorbell': 'bell',
-    'climate': 'temperature-half',
-    'export': 'file-export',
-    'report': 'chart-line',
-    'developer': 'code',
-    'integration': 'plug',
-    'keypad': 'keyboard',
-    'button': 'circle-dot',
-    'device': 'microchip',
-    'component': 'puzzle-piece',
-}
-
-def get_action_from_path(path: str) -> str:
-    """Extract action from file path."""
-    filename = Path(path).stem
-    # Remove category prefix
-    parts = filename.split('-', 1)
-    if len(parts) > 1:
-        action_part = parts[1]
-    else:
-        action_part = parts[0]
-
-    # Extract first word which is usually the action
-    action = re.match(r'^([a-z]+)', action_part.lower())
-    if action:
-        return action.group(1)
-    return 'other'
-
-def get_icon_for_endpoint(category: str, action: str) -> str:
-    """Determine the best icon for an endpoint based on category and action."""
-    # First check for action-specific icon
-    for key, icon in ACTION_ICONS.items():
-        if action.startswith(key):
-            return icon
-
-    # Fall back to category icon
-    for key, icon in CATEGORY_ICONS.items():
-        if key in category:
-            return icon
-
-    return 'circle-dot'
+ENDPOINT_DIR = DOCS_DIR / "api-reference" / "endpoint"
+BACKUP_JSON = DOCS_DIR / "docs.json.backup"
+ICON_LINE = re.compile(rb'^icon:\s*"([^"]*)"')
+
+def read_frontmatter_block(handle) -> Optional[List[bytes]]:
+    """Read the frontmatter lines (including both --- markers) from an open file."""
+    first = handle.readline()
+    if first.strip() != b'---':
+        return None
+
+    lines = [first]
+    for line in handle:
+        lines.append(line)
+        if line.strip() == b'---':
+            return lines
+    return None
 
 def update_endpoint_icon(file_path: Path, new_icon: str) -> bool:
-    """Update the icon in an endpoint MDX file."""
-    try:
-        content = file_path.read_text()
-
-        # Update icon in frontmatter
-        updated_content = re.sub(
-            r'icon: "[^"]*"',
-            f'icon: "{new_icon}"',
-            content
-        )
+    """Update the icon in an endpoint MDX file's frontmatter.
 
-        if updated_content != content:
-            file_path.write_text(updated_content)
+    Only the frontmatter is read. Files whose icon is already correct are left
+    untouched; a same-length icon is overwritten in place, anything else is
+    rewritten atomically.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            header = read_frontmatter_block(f)
+            PROFILER.count("files_read")
+            PROFILER.count("bytes_read", f.tell())
+            if header is None:
+                return False
+
+            offset = 0
+            for index, line in enumerate(header):
+                match = ICON_LINE.match(line)
+                if match:
+                    break
+                offset += len(line)
+            else:
+                return False
+
+            current = match.group(1)
+            replacement = new_icon.encode('utf-8')
+            if current == replacement:
+                return False
+
+            if len(current) != len(replacement):
+                rest = f.read()
+                PROFILER.count("bytes_read", len(rest))
+
+        if len(current) == len(replacement):
+            with open(file_path, 'r+b') as f:
+                f.seek(offset + match.start(1))
+                f.write(replacement)
+            PROFILER.count("files_written")
+            PROFILER.count("bytes_written", len(replacement))
             return True
-        return False
+
+        new_line = line[:match.start(1)] + replacement + line[match.end(1):]
+        content = b''.join(header[:index]) + new_line + b''.join(header[index + 1:]) + rest
+        atomic_write(file_path, content)
+        return True
     except Exception as e:
         print(f"  ⚠️  Error updating {file_path}: {e}")
         return False
 
 def categorize_endpoints(pages: List[str]) -> Dict[str, List[str]]:
     """Categorize endpoints by action type for accordion groups."""
-    categories = {
-        'Create & Add': [],
-        'Get & Find': [],
-        'Update & Modify': [],
-        'Delete & Remove': [],
-        'Other Operations': []
-    }
+    categories = {name: [] for name in ACTION_GROUP_NAMES}
 
     for page in pages:
-        # Get the full filename to check for action keywords
-        filename = Path(page).stem.lower()
-
         # Check for action keywords in the filename
-        if any(word in filename for word in ['create', 'add', 'upload', 'generate', 'initiate', 'calibrate']):
-            categories['Create & Add'].append(page)
-        elif any(word in filename for word in ['get', 'find', 'search', 'list']):
-            categories['Get & Find'].append(page)
-        elif any(word in filename for word in ['update', 'edit', 'modify', 'assign', 'remove', 'revoke', 'suspend', 'unsuspend']):
-            categories['Update & Modify'].append(page)
-        elif any(word in filename for word in ['delete', 'erase']):
-            categories['Delete & Remove'].append(page)
-        else:
-            categories['Other Operations'].append(page)
+        categories[action_group_for(page)].append(page)
 
     # Remove empty categories
     return {k: v for k, v in categories.items() if v}
 
-def process_endpoint_icons():
-    """Update all endpoint icons based on their action type."""
+def process_endpoint_icons(jobs: int = 8, categories: Optional[Set[str]] = None):
+    """Update all endpoint icons based on their action type.
+
+    Pages generated by generate-endpoint-docs.py already carry the right icon, so
+    this pass only touches trees produced by older generator versions. Pages the
+    frontmatter index already knows to be correct are skipped without being opened.
+    ``categories`` limits the pass to those category directories.
+    """
     print("🎨 Updating endpoint icons...\n")
 
     updated_count = 0
+    frontmatter = FrontmatterIndex(DOCS_DIR)
 
-    for category_dir in sorted(ENDPOINT_DIR.iterdir()):
-        if not category_dir.is_dir() or category_dir.name.startswith('.'):
-            continue
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for category_dir in sorted(ENDPOINT_DIR.iterdir()):
+            if not category_dir.is_dir() or category_dir.name.startswith('.'):
+                continue
+            if categories is not None and category_dir.name not in categories:
+                continue
 
-        category_name = category_dir.name
-        print(f"📁 Processing {category_name}...")
+            category_name = category_dir.name
+            print(f"📁 Processing {category_name}...")
 
-        for mdx_file in sorted(category_dir.glob("*.mdx")):
-            action = get_action_from_path(str(mdx_file))
-            new_icon = get_icon_for_endpoint(category_name, action)
+            pending = []
+            for mdx_file in sorted(category_dir.glob("*.mdx")):
+                icon = endpoint_icon(category_name, str(mdx_file))
+                if frontmatter.icon(mdx_file) != icon:
+                    pending.append((mdx_file, icon))
 
-            if update_endpoint_icon(mdx_file, new_icon):
-                updated_count += 1
+            updated_count += sum(pool.map(update_endpoint_icon, *zip(*pending))) if pending else 0
 
-        print(f"   Updated icons for {category_name}")
+            print(f"   Updated icons for {category_name}")
 
+    frontmatter.save()
     print(f"\n✅ Updated icons in {updated_count} endpoint files")
 
-def create_accordion_navigation():
-    """Create accordion-style navigation groups for better organization."""
-    print("\n📚 Reorganizing navigation with accordion groups...\n")
-
-    # Backup existing docs.json
-    with open(DOCS_JSON, 'r') as f:
-        docs_data = json.load(f)
-
-    with open(BACKUP_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
-    print(f"✅ Backed up docs.json to {BACKUP_JSON}")
-
-    # Find the API reference tab
-    api_tab = None
-    for tab in docs_data['navigation']['tabs']:
-        if tab['tab'] == 'API reference':
-            api_tab = tab
-            break
-
-    if not api_tab:
-        print("❌ Could not find 'API reference' tab in docs.json")
-        return
-
+def build_accordion_groups(api_groups: List[Dict]) -> List[Dict]:
+    """Split large API reference categories into action-type accordion sub-groups."""
     # Keep the introduction group
     intro_group = {
         "group": "API documentation",
@@ -211,7 +145,7 @@ def create_accordion_navigation():
     # Process each category group and add accordion subgroups
     new_groups = [intro_group]
 
-    for group in api_tab['groups'][1:]:  # Skip intro group
+    for group in api_groups[1:]:  # Skip intro group
         category_name = group['group']
         pages = group['pages']
 
@@ -238,16 +172,39 @@ def create_accordion_navigation():
             # Keep small categories as-is
             new_groups.append(group)
 
+    return new_groups
+
+def create_accordion_navigation():
+    """Create accordion-style navigation groups for better organization."""
+    print("\n📚 Reorganizing navigation with accordion groups...\n")
+
+    docs_data = PROFILER.load_json(DOCS_JSON)
+
+    # Find the API reference tab
+    api_tab = None
+    for tab in docs_data['navigation']['tabs']:
+        if tab['tab'] == 'API reference':
+            api_tab = tab
+            break
+
+    if not api_tab:
+        print("❌ Could not find 'API reference' tab in docs.json")
+        return
+
     # Update the API reference groups
+    new_groups = build_accordion_groups(api_tab['groups'])
     api_tab['groups'] = new_groups
 
-    # Write updated docs.json
-    with open(DOCS_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
-
-    print(f"✅ Updated navigation with accordion groups")
+    # Write updated docs.json, backing up the previous version if it changed
+    if write_json_if_changed(DOCS_JSON, docs_data, backup=BACKUP_JSON, indent=2):
+        print(f"✅ Backed up docs.json to {BACKUP_JSON}")
+        print(f"✅ Updated navigation with accordion groups")
+    else:
+        print(f"✅ Navigation already uses accordion groups")
+    print_accordion_summary(new_groups)
 
-    # Show summary
+def print_accordion_summary(new_groups: List[Dict]):
+    """Print a summary of the accordion navigation structure."""
     print(f"\n📊 Navigation structure:")
     print(f"   Total groups: {len(new_groups)}")
     accordion_count = sum(1 for g in new_groups if any(isinstance(p, dict) for p in g.get('pages', [])))
@@ -255,19 +212,30 @@ def create_accordion_navigation():
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Improve endpoint navigation and icons")
+    parser.add_argument('--jobs', '-j', type=int, default=8,
+                        help='Number of threads used to patch endpoint icons')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "improve-endpoint-navigation")
+
     print("🔨 Improving endpoint navigation and icons\n")
 
     # Update all endpoint icons
-    process_endpoint_icons()
+    with PROFILER.stage("icons"):
+        process_endpoint_icons(args.jobs)
 
     # Create accordion navigation structure
-    create_accordion_navigation()
+    with PROFILER.stage("accordions"):
+        create_accordion_navigation()
 
     print("\n🎉 Navigation improvement complete!")
     print("\n💡 Next steps:")
-    print("   1. Review docs/docs.json for the new navigation structure")
+    print(f"   1. Review {DOCS_JSON} for the new navigation structure")
     print("   2. Refresh your browser to see the updated icons and accordion groups")
     print("   3. If there are issues, restore from docs.json.backup")
 
+    PROFILER.finish()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Load-test the local documentation server and report latency percentiles.
+Replays a seeded mix of search, endpoint-lookup and page-fetch requests, drawn from the
+endpoint pages on disk, over keep-alive connections at the requested concurrency, then
+prints throughput and p50/p90/p99 latency overall and per request kind.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import quote, urlsplit
+
+from docs_paths import DOCS_DIR
+from endpoint_pages import ENDPOINT_PAGE_ROOT
+
+# Configuration
+ENDPOINT_DIR = DOCS_DIR / ENDPOINT_PAGE_ROOT
+KINDS = ("search", "endpoint", "page")
+
+
+def endpoint_pages() -> List[str]:
+    pages = []
+    if not ENDPOINT_DIR.is_dir():
+        return pages
+    for category in sorted(os.scandir(ENDPOINT_DIR), key=lambda entry: entry.name):
+        if category.is_dir():
+            pages += sorted(f"{ENDPOINT_PAGE_ROOT}/{category.name}/{entry.name[:-4]}"
+                            for entry in os.scandir(category.path) if entry.name.endswith('.mdx'))
+    return pages
+
+
+def build_targets(count: int, mix: Dict[str, int], seed: int) -> List[Tuple[str, str]]:
+    """``count`` (kind, request target) pairs in the proportions of ``mix``."""
+    pages = endpoint_pages()
+    if not pages:
+        raise SystemExit(f"❌ No endpoint pages under {ENDPOINT_DIR} to draw requests from")
+    rng = random.Random(seed)
+    words = sorted({word for page in pages for word in page.rsplit('/', 1)[-1].split('-') if word.isalpha()})
+    kinds = [kind for kind, weight in mix.items() for _ in range(weight)]
+
+    targets = []
+    for _ in range(count):
+        kind = rng.choice(kinds)
+        page = rng.choice(pages)
+        if kind == "search":
+            terms = " ".join(rng.sample(words, min(len(words), rng.randint(1, 3))))
+            targets.append((kind, f"/search?q={quote(terms)}&limit=10"))
+        elif kind == "endpoint":
+            targets.append((kind, f"/endpoint?q={quote(page.rsplit('/', 1)[-1])}"))
+        else:
+            targets.append((kind, f"/page/{page}"))
+    return targets
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str,
+                  target: str) -> Tuple[int, bytes]:
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def worker(host: str, port: int, queue: List[Tuple[str, str]],
+                 latencies: Dict[str, List[float]], errors: Dict[str, int]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while queue:
+            kind, target = queue.pop()
+            started = time.perf_counter()
+            try:
+                status, _ = await request(reader, writer, host, target)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                errors[kind] = errors.get(kind, 0) + 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies[kind].append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                errors[kind] = errors.get(kind, 0) + 1
+    finally:
+        writer.close()
+
+
+async def fetch_health(host: str, port: int) -> Dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, body = await request(reader, writer, host, "/health")
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted ``values``."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values) + 0.5)) - 1))]
+
+
+def print_row(label: str, values: List[float], errors: int):
+    values = sorted(values)
+    print(f"   {label:<9} {len(values):>7} {errors:>6} {percentile(values, 0.50):>8.2f} "
+          f"{percentile(values, 0.90):>8.2f} {percentile(values, 0.99):>8.2f} {values[-1] if values else 0:>8.2f}")
+
+
+async def run(args) -> int:
+    url = urlsplit(args.url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+    mix = dict(zip(KINDS, args.mix))
+    targets = build_targets(args.requests, mix, args.seed)
+
+    try:
+        before = await fetch_health(host, port)
+    except OSError as e:
+        print(f"❌ Could not reach {args.url}: {e}")
+        print("   Start it with 'python3 scripts/docs-server.py'")
+        return 1
+
+    print(f"🏋️  {args.requests} requests at concurrency {args.concurrency} against {args.url}")
+    print(f"   Mix: " + ", ".join(f"{kind} {weight}" for kind, weight in mix.items()) + "\n")
+
+    latencies: Dict[str, List[float]] = {kind: [] for kind in KINDS}
+    errors: Dict[str, int] = {}
+    queue = list(reversed(targets))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, queue, latencies, errors)
+                           for _ in range(min(args.concurrency, len(targets)))))
+    elapsed = time.perf_counter() - started
+    after = await fetch_health(host, port)
+
+    completed = sum(len(values) for values in latencies.values())
+    print(f"✅ {completed} responses in {elapsed:.2f}s ({completed / elapsed:.0f} req/s)\n")
+    print(f"   {'kind':<9} {'count':>7} {'errors':>6} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for kind in KINDS:
+        if mix.get(kind):
+            print_row(kind, latencies[kind], errors.get(kind, 0))
+    print_row("all", [value for values in latencies.values() for value in values], sum(errors.values()))
+
+    hits = after['cache']['hits'] - before['cache']['hits']
+    misses = after['cache']['misses'] - before['cache']['misses']
+    if hits + misses:
+        print(f"\n   💾 Server cache hit rate during the run: {hits / (hits + misses):.1%}")
+    return 1 if errors and args.fail_on_error else 0
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', default="http://127.0.0.1:8787", help='Server started by docs-server.py')
+    parser.add_argument('--requests', '-n', type=int, default=2000, help='Total number of requests')
+    parser.add_argument('--concurrency', '-c', type=int, default=16, help='Concurrent keep-alive connections')
+    parser.add_argument('--mix', type=int, nargs=3, default=[2, 1, 1], metavar=('SEARCH', 'ENDPOINT', 'PAGE'),
+                        help='Relative weights of search, endpoint and page requests')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the request mix')
+    parser.add_argument('--fail-on-error', action='store_true', help='Exit 1 if any request failed')
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    exit(main())
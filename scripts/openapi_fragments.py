@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Slim, self-contained OpenAPI documents for generated endpoint pages.
+A fragment holds the shared top-level fields of the spec (from openapi-split/_base.json),
+only the path items of one category or one endpoint, and the transitive closure of the
+component schemas they reference, so a page can point its `openapi:` frontmatter at a
+file a small fraction of the size of the monolithic openapi.json.
+"""
+
+from typing import Dict, Set
+
+from endpoint_pages import sanitize_filename
+from openapi_stream import iter_operations
+from schema_graph import collect_refs
+from schema_store import SchemaStore
+
+FRAGMENT_ROOT = "api-reference/openapi-fragments"
+FRAGMENT_MODES = ("category", "endpoint")
+
+
+def fragment_file(mode: str, category: str, path: str) -> str:
+    """Docs-relative fragment file that documents ``path`` of ``category`` in ``mode``."""
+    if mode == "category":
+        return f"{FRAGMENT_ROOT}/{category}.json"
+    return f"{FRAGMENT_ROOT}/{category}/{sanitize_filename(path)}.json"
+
+
+def build_fragment(base: dict, paths: Dict[str, dict], store: SchemaStore) -> dict:
+    """OpenAPI document with ``base``'s top-level fields, ``paths`` and their schema closure.
+
+    Non-schema components (security schemes, shared parameters and responses) are
+    small and kept whole, and the schemas they reference are included as well.
+    """
+    components = dict(base.get('components') or {})
+    refs: Set[str] = collect_refs(paths) | collect_refs(components)
+    schemas = store.closure(refs)
+    if schemas:
+        components['schemas'] = {name: schemas[name] for name in sorted(schemas)}
+
+    used_tags = {tag for path_item in paths.values()
+                 for _, operation in iter_operations(path_item) for tag in operation.get('tags') or []}
+
+    fragment = {}
+    for key, value in base.items():
+        if key == 'components':
+            continue
+        if key == 'tags' and isinstance(value, list):
+            value = [tag for tag in value if isinstance(tag, dict) and tag.get('name') in used_tags]
+            if not value:
+                continue
+        fragment[key] = value
+    fragment['paths'] = paths
+    if components:
+        fragment['components'] = components
+    return fragment
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON reader for large OpenAPI specifications.
+Walks a document one value at a time so callers never hold the whole spec in memory.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, IO, Iterator, Tuple
+
+CHUNK_SIZE = 1 << 16
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+class JSONStreamReader:
+    """Reads a JSON document incrementally from a text file object.
+
+    Objects are walked with ``iter_object``, which yields each key and leaves the
+    cursor on its value. The caller then either decodes the value with
+    ``read_value`` or descends into it with another ``iter_object`` call.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int = CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.consumed = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    @property
+    def offset(self) -> int:
+        """Character offset of the cursor in the underlying document."""
+        return self.consumed + self.pos
+
+    def _fill(self, min_size: int = 0) -> bool:
+        """Drop the consumed prefix and read at least one more chunk."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.consumed += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.fp.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.offset}, found {found!r}")
+        self.pos += 1
+
+    def read_value(self) -> Any:
+        """Decode and return the complete value at the cursor."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Value spans past the buffer; grow it geometrically and retry
+                if self._fill(len(self.buf)):
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buf) and self._fill(len(self.buf)):
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self):
+        """Consume the value at the cursor without keeping it."""
+        self.read_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield the keys of the object at the cursor; each value must be consumed."""
+        self._expect('{')
+        if self._peek() == '}':
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected object key at offset {self.offset}")
+            self._expect(':')
+            start = self.offset
+            yield key
+            if self.offset == start:
+                self.skip_value()
+
+            separator = self._peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '}}' at offset {self.offset - 1}, found {separator!r}")
+
+
+def iter_path_items(spec_file: Path) -> Iterator[Tuple[str, dict]]:
+    """Yield ``(path, path_item)`` pairs from an OpenAPI file, one at a time."""
+    with open(spec_file, 'r') as f:
+        reader = JSONStreamReader(f)
+        for key in reader.iter_object():
+            if key != 'paths':
+                continue
+            for path in reader.iter_object():
+                yield path, reader.read_value()
+
+
+def iter_operations(path_item: dict) -> Iterator[Tuple[str, dict]]:
+    """Yield ``(METHOD, operation)`` pairs for the HTTP operations of a path item."""
+    for method in HTTP_METHODS:
+        operation = path_item.get(method)
+        if isinstance(operation, dict):
+            yield method.upper(), operation
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Write-if-changed output layer shared by the docs scripts.
+Content is rendered in memory (or streamed, for large outputs) and compared with the
+file on disk; identical files are left untouched so their mtimes stay stable. Real
+writes go through a temp file and an atomic rename, and backups hardlink the
+previous file instead of copying it.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from stage_profiler import PROFILER
+
+# Process umask, applied to new files since mkstemp always creates them 0600
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+BUFFER_SIZE = 1 << 16
+
+
+def file_matches(path: Path, data: bytes,
+                 normalize: Optional[Callable[[bytes], bytes]] = None) -> bool:
+    """Whether ``path`` already holds ``data``; sizes are compared before any read."""
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return False
+    if normalize is None:
+        return size == len(data) and PROFILER.read_bytes(path) == data
+    return normalize(PROFILER.read_bytes(path)) == normalize(data)
+
+
+def backup_file(path: Path, backup: Path):
+    """Make ``backup`` refer to the current contents of ``path``.
+
+    A hardlink costs no I/O; the following atomic replace gives ``path`` a new
+    inode, so the link keeps the old contents. Falls back to a copy where links
+    are not supported.
+    """
+    try:
+        os.unlink(backup)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copy2(path, backup)
+
+
+def _remove(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _file_mode(path: Path) -> int:
+    """Permissions for the replacement of ``path``: its own, or the umask default."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write(path: Path, data: bytes):
+    """Replace ``path`` with ``data`` via a temp file in the same directory."""
+    path = Path(path)
+    mode = _file_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove(tmp_path)
+        raise
+    PROFILER.count("files_written")
+    PROFILER.count("bytes_written", len(data))
+
+
+def write_if_changed(path: Path, content: Union[str, bytes], backup: Optional[Path] = None,
+                     normalize: Optional[Callable[[bytes], bytes]] = None) -> bool:
+    """Atomically write ``content`` to ``path`` unless the file already holds it.
+
+    ``backup`` receives the previous file, and only when a write happens.
+    ``normalize`` maps both sides before comparing, for outputs with volatile
+    parts such as timestamps. Returns whether the file was written.
+    """
+    path = Path(path)
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    if file_matches(path, data, normalize):
+        return False
+    if backup is not None and path.exists():
+        backup_file(path, backup)
+    atomic_write(path, data)
+    return True
+
+
+def write_json_if_changed(path: Path, value: Any, backup: Optional[Path] = None,
+                          **kwargs) -> bool:
+    """Serialize ``value`` with ``json.dumps(**kwargs)`` and write it if it changed."""
+    return write_if_changed(path, PROFILER.dumps_json(value, **kwargs), backup)
+
+
+class StreamingOutput:
+    """Write-if-changed for outputs produced chunk by chunk.
+
+    Chunks go straight to a buffered temp file next to ``path`` while a hash of
+    the content is kept; on exit the existing file is hashed the same way and
+    only replaced if it differs. Memory use does not depend on the output size.
+    ``normalize`` works as in ``write_if_changed`` but is applied one line at a
+    time, so it must only rewrite within lines. Use as a context manager;
+    ``written`` tells whether the file changed.
+    """
+
+    def __init__(self, path: Path, backup: Optional[Path] = None,
+                 normalize: Optional[Callable[[bytes], bytes]] = None):
+        self.path = Path(path)
+        self.backup = backup
+        self.normalize = normalize
+        self.size = 0
+        self.written = False
+        self._digest = hashlib.sha256()
+        self._pending = b''
+
+    def __enter__(self) -> "StreamingOutput":
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        self._file = os.fdopen(fd, 'wb', buffering=BUFFER_SIZE)
+        return self
+
+    def write(self, content: Union[str, bytes]):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self._file.write(data)
+        self.size += len(data)
+        self._update(data)
+
+    def _update(self, data: bytes):
+        if self.normalize is None:
+            self._digest.update(data)
+            return
+        *lines, self._pending = (self._pending + data).split(b'\n')
+        for line in lines:
+            self._digest.update(self.normalize(line + b'\n'))
+
+    def _hexdigest(self) -> str:
+        if self._pending:
+            self._digest.update(self.normalize(self._pending))
+            self._pending = b''
+        return self._digest.hexdigest()
+
+    def _matches(self) -> bool:
+        """Whether the file on disk hashes to the streamed content."""
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
+            return False
+        if self.normalize is None and size != self.size:
+            return False
+        existing = StreamingOutput(self.path, normalize=self.normalize)
+        with open(self.path, 'rb') as f:
+            for block in iter(lambda: f.read(BUFFER_SIZE), b''):
+                existing._update(block)
+        PROFILER.count("files_read")
+        PROFILER.count("bytes_read", size)
+        return existing._hexdigest() == self._hexdigest()
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is not None:
+            _remove(self._tmp_path)
+            return False
+        try:
+            if self._matches():
+                _remove(self._tmp_path)
+                return False
+            os.chmod(self._tmp_path, _file_mode(self.path))
+            if self.backup is not None and self.path.exists():
+                backup_file(self.path, self.backup)
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            _remove(self._tmp_path)
+            raise
+        self.written = True
+        PROFILER.count("files_written")
+        PROFILER.count("bytes_written", self.size)
+        return False
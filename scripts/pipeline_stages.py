@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Declarative table of the docs pipeline stages.
+Each stage names the script it runs and the files it reads and writes, relative to the
+docs directory, so tools that drive the pipeline (watch-docs.py, build-docs.py) can tell
+which stages a change affects, and which stages depend on each other, without hard-coding
+the order of the workflow steps.
+"""
+
+import fnmatch
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+class Stage:
+    """One pipeline step: a script plus the path patterns it reads and writes.
+
+    Patterns are docs-relative. A plain pattern covers that file or everything
+    under that directory; a pattern with wildcards and no slash matches files
+    at the top of the docs directory only. A stage without inputs (fetching the
+    spec) depends on nothing local and can never be skipped as up to date.
+    """
+
+    def __init__(self, name: str, script: str, inputs: Sequence[str], outputs: Sequence[str],
+                 args: Sequence[str] = ()):
+        self.name = name
+        self.script = script
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.args = tuple(args)
+
+    def reads(self, path: str) -> bool:
+        return any(path_matches(path, pattern) for pattern in self.inputs)
+
+    def command(self, extra_args: Sequence[str] = ()) -> List[str]:
+        return [sys.executable, str(SCRIPTS_DIR / self.script), *self.args, *extra_args]
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r})"
+
+
+# In pipeline order; every stage only reads what earlier stages (or people) write
+STAGES = [
+    Stage("fetch", "fetch-openapi.py",
+          inputs=[],
+          outputs=["api-reference/openapi.json"]),
+    Stage("split", "split-openapi.py",
+          inputs=["api-reference/openapi.json"],
+          outputs=["api-reference/openapi-split"]),
+    Stage("generate", "generate-endpoint-docs.py",
+          inputs=["api-reference/openapi-split"],
+          outputs=["api-reference/endpoint", "api-reference/openapi-fragments"]),
+    Stage("navigation", "build-navigation.py",
+          inputs=["docs.json", "api-reference/endpoint/_navigation.json"],
+          outputs=["docs.json", "docs.json.backup", "api-reference/endpoint"]),
+    Stage("llms", "update-llms-files.py",
+          inputs=["docs.json", "*.mdx", "implementations", "low-code-no-code", "snippets",
+                  "api-reference/endpoint", "api-reference/openapi-split"],
+          outputs=["llms.txt", "llms-full.txt", "llms", ".cache/llms-shards.json"]),
+    Stage("search", "build-search-index.py",
+          inputs=["*.mdx", "implementations", "low-code-no-code", "api-reference/endpoint",
+                  "api-reference/openapi.json", "llms-full.txt"],
+          outputs=[".cache/search-index.bin", ".cache/search-documents.json"]),
+    Stage("lookup", "build-endpoint-lookup.py",
+          inputs=["api-reference/openapi.json", "api-reference/endpoint", ".cache/search-index.bin", "llms"],
+          outputs=[".cache/endpoint-lookup.bin"]),
+    Stage("links", "check-links.py",
+          inputs=["docs.json", "*.mdx", "*.md", "implementations", "low-code-no-code", "snippets",
+                  "api-reference", "logo"],
+          outputs=[]),
+]
+
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+
+def has_wildcard(pattern: str) -> bool:
+    return any(char in pattern for char in '*?[')
+
+
+def path_matches(path: str, pattern: str) -> bool:
+    """Whether the docs-relative ``path`` is covered by ``pattern`` (see Stage)."""
+    if has_wildcard(pattern):
+        return '/' not in path and fnmatch.fnmatchcase(path, pattern)
+    pattern = pattern.rstrip('/')
+    return path == pattern or path.startswith(pattern + '/')
+
+
+def patterns_overlap(first: str, second: str) -> bool:
+    """Whether two patterns can cover the same file."""
+    first_wild, second_wild = has_wildcard(first), has_wildcard(second)
+    if first_wild or second_wild:
+        if first_wild and second_wild:
+            return first == second
+        plain, wild = (second, first) if first_wild else (first, second)
+        return '/' not in plain.rstrip('/') and fnmatch.fnmatchcase(plain.rstrip('/'), wild)
+    return path_matches(first, second) or path_matches(second, first)
+
+
+def dependencies(stages: Sequence[Stage]) -> Dict[str, Set[str]]:
+    """For each stage, the earlier stages among ``stages`` that write something it reads."""
+    upstream: Dict[str, Set[str]] = {}
+    for index, stage in enumerate(stages):
+        upstream[stage.name] = {
+            earlier.name for earlier in stages[:index]
+            if any(patterns_overlap(read, written) for read in stage.inputs for written in earlier.outputs)
+        }
+    return upstream
+
+
+def select_stages(names: Iterable[str]) -> List[Stage]:
+    """The named stages, in pipeline order."""
+    wanted = set(names)
+    unknown = wanted - set(STAGE_NAMES)
+    if unknown:
+        raise ValueError(f"unknown stage(s): {', '.join(sorted(unknown))}")
+    return [stage for stage in STAGES if stage.name in wanted]
+
+
+def run_stage(stage: Stage, extra_args: Sequence[str] = (), quiet: bool = True) -> Tuple[bool, float, str]:
+    """Run a stage's script from the current directory.
+
+    Returns whether it succeeded, its wall time and, when ``quiet``, its captured output.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(stage.command(extra_args), text=True,
+                            stdout=subprocess.PIPE if quiet else None,
+                            stderr=subprocess.STDOUT if quiet else None)
+    return result.returncode == 0, time.perf_counter() - started, result.stdout or ""
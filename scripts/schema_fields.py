@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Static Mintlify field blocks for OpenAPI operations.
+Renders parameters, request bodies and responses as <ParamField>/<ResponseField> blocks
+with <Expandable> children. Component schemas are rendered once per (kind, schema, depth)
+and the fragment is reused by every endpoint that references them; depth, property and
+page-size caps bound the output for large or recursive models.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from schema_store import SchemaStore
+
+PARAMETER_LOCATIONS = ('path', 'query', 'header')
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_PROPERTIES = 40
+DEFAULT_MAX_CHARS = 60000
+INDENT = "    "
+
+
+def mdx_text(text: Any) -> str:
+    """Single-line MDX text with the characters JSX would interpret escaped."""
+    text = " ".join(str(text).split())
+    return (text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            .replace('{', '&#123;').replace('}', '&#125;'))
+
+
+def mdx_code(value: Any) -> str:
+    """Single-line inline code span; code spans show their content verbatim, so nothing is escaped."""
+    text = " ".join(str(value).split())
+    if not text:
+        return '`""`'
+    # The fence must be longer than any backtick run inside the value
+    fence = "`" * (max(map(len, re.findall(r'`+', text)), default=0) + 1)
+    if text.startswith('`') or text.endswith('`'):
+        text = f" {text} "
+    return f"{fence}{text}{fence}"
+
+
+def mdx_attribute(value: Any) -> str:
+    return str(value).replace('&', '&amp;').replace('"', '&quot;')
+
+
+class SchemaFieldRenderer:
+    """Schema-to-MDX renderer with memoized fragments for component schemas.
+
+    Component schemas come from ``store``, parsed lazily. Fragments are
+    a pure function of (field kind, schema name, depth) because indentation and
+    the depth cap both derive from the depth, so recursive models terminate at
+    ``max_depth`` and every cached fragment can be pasted as-is.
+    """
+
+    def __init__(self, store: SchemaStore, max_depth: int = DEFAULT_MAX_DEPTH,
+                 max_properties: int = DEFAULT_MAX_PROPERTIES, max_chars: int = DEFAULT_MAX_CHARS):
+        self.store = store
+        self.max_depth = max_depth
+        self.max_properties = max_properties
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self.truncated_pages = 0
+        self._fragments: Dict[Tuple[str, str, int], str] = {}
+
+    def _resolve(self, node: Any) -> Tuple[Optional[str], dict]:
+        return self.store.resolve(node)
+
+    def type_label(self, node: Any, seen: frozenset = frozenset()) -> str:
+        name, schema = self._resolve(node)
+        # A schema reached again through its own items or options is labelled by name
+        if name in seen:
+            return name
+        seen = seen | {name} if name else seen
+        kind = schema.get('type')
+        if kind == 'array':
+            return f"{self.type_label(schema.get('items', {}), seen)}[]"
+        if name and (kind in (None, 'object') or schema.get('properties')):
+            return name
+        for combinator in ('oneOf', 'anyOf'):
+            if schema.get(combinator):
+                return " | ".join(self.type_label(option, seen) for option in schema[combinator])
+        if schema.get('allOf'):
+            return next((n for n, _ in map(self._resolve, schema['allOf']) if n), 'object')
+        if kind and schema.get('format'):
+            return f"{kind}<{schema['format']}>"
+        return kind or ('object' if schema.get('properties') else 'any')
+
+    def _properties(self, node: Any, seen: frozenset = frozenset()) -> Tuple[Dict[str, Any], Set[str]]:
+        """Properties and required names of an object schema, merging allOf/oneOf/anyOf parts."""
+        name, schema = self._resolve(node)
+        if name in seen:
+            return {}, set()
+        seen = seen | {name} if name else seen
+        properties = dict(schema.get('properties') or {})
+        required = set(schema.get('required') or [])
+        for part in schema.get('allOf') or []:
+            extra, extra_required = self._properties(part, seen)
+            properties.update(extra)
+            required |= extra_required
+        for combinator in ('oneOf', 'anyOf'):
+            for part in schema.get(combinator) or []:
+                for key, value in self._properties(part, seen)[0].items():
+                    properties.setdefault(key, value)
+        return properties, required
+
+    def _object_node(self, node: Any, hops: int = 0) -> Any:
+        """The schema whose properties a field expands: the node itself or its array items."""
+        _, schema = self._resolve(node)
+        if schema.get('type') == 'array' and hops < 8:
+            return self._object_node(schema.get('items', {}), hops + 1)
+        return node
+
+    def children(self, tag: str, node: Any, depth: int) -> str:
+        """Fields for the properties of ``node`` at ``depth``; memoized for component schemas."""
+        name, _ = self._resolve(node)
+        key = (tag, name, depth)
+        if name is not None and key in self._fragments:
+            self.hits += 1
+            return self._fragments[key]
+
+        properties, required = self._properties(node)
+        indent = INDENT * depth
+        lines = [self.field(tag, prop, schema, prop in required, depth)
+                 for prop, schema in list(properties.items())[:self.max_properties]]
+        if len(properties) > self.max_properties:
+            lines.append(f"{indent}_{len(properties) - self.max_properties} more properties not shown._")
+        fragment = "\n".join(lines)
+
+        if name is not None:
+            self.misses += 1
+            self._fragments[key] = fragment
+        return fragment
+
+    def field(self, tag: str, name: str, node: Any, required: bool, depth: int,
+              location: str = "body") -> str:
+        """One <ParamField>/<ResponseField>, with an <Expandable> for object properties."""
+        _, schema = self._resolve(node)
+        indent = INDENT * depth
+        attributes = [f'{location}="{mdx_attribute(name)}"' if tag == 'ParamField' else f'name="{mdx_attribute(name)}"',
+                      f'type="{mdx_attribute(self.type_label(node))}"']
+        if required:
+            attributes.append('required')
+        if 'default' in schema and not isinstance(schema['default'], (dict, list)):
+            attributes.append(f'default="{mdx_attribute(schema["default"])}"')
+        if (node.get('deprecated') if isinstance(node, dict) else False) or schema.get('deprecated'):
+            attributes.append('deprecated')
+
+        head = f"{indent}<{tag} {' '.join(attributes)}"
+        lines = [f"{head}>"]
+        description = (node.get('description') if isinstance(node, dict) else None) or schema.get('description')
+        if description:
+            lines.append(f"{indent}  {mdx_text(description)}")
+        if schema.get('enum'):
+            options = ", ".join(mdx_code(option) for option in schema['enum'][:self.max_properties])
+            lines.append(f"{indent}  Available options: {options}")
+
+        target = self._object_node(node)
+        if depth + 1 < self.max_depth and self._properties(target)[0]:
+            lines.append(f'{indent}  <Expandable title="properties">')
+            lines.append(self.children(tag, target, depth + 1))
+            lines.append(f"{indent}  </Expandable>")
+        if len(lines) == 1:
+            return f"{head} />"
+        lines.append(f"{indent}</{tag}>")
+        return "\n".join(lines)
+
+    def _body_fields(self, tag: str, content: Any, location: str = "body") -> List[str]:
+        """Top-level fields of a JSON request or response body."""
+        if not isinstance(content, dict):
+            return []
+        media = content.get('application/json') or next(iter(content.values()), None)
+        schema = media.get('schema') if isinstance(media, dict) else None
+        if not schema:
+            return []
+        _, resolved = self._resolve(schema)
+        properties, required = self._properties(schema)
+        if resolved.get('type') == 'array' or not properties:
+            return [self.field(tag, location, schema, False, 0, location)]
+        fields = [self.field(tag, prop, node, prop in required, 0, location)
+                  for prop, node in list(properties.items())[:self.max_properties]]
+        if len(properties) > self.max_properties:
+            fields.append(f"_{len(properties) - self.max_properties} more properties not shown._")
+        return fields
+
+    def render_operation(self, operation: dict, shared_parameters: Optional[list] = None) -> str:
+        """Parameter, request body and response blocks for one operation."""
+        fields = []
+        for parameter in list(shared_parameters or []) + list(operation.get('parameters') or []):
+            if isinstance(parameter, dict) and parameter.get('in') in PARAMETER_LOCATIONS and parameter.get('name'):
+                node = dict(parameter.get('schema') or {})
+                if parameter.get('description'):
+                    node = {'allOf': [node], 'description': parameter['description']} if '$ref' in node else \
+                        dict(node, description=parameter['description'])
+                fields.append(self.field('ParamField', parameter['name'], node, bool(parameter.get('required')),
+                                         0, parameter['in']))
+
+        body = operation.get('requestBody')
+        if isinstance(body, dict):
+            fields += self._body_fields('ParamField', body.get('content'))
+
+        responses = operation.get('responses') or {}
+        for status in sorted(responses):
+            if str(status).startswith('2') and isinstance(responses[status], dict):
+                fields += self._body_fields('ResponseField', responses[status].get('content'), "response")
+                break
+
+        # Keep whole top-level fields while the page stays under the size cap
+        kept, size = [], 0
+        for field in fields:
+            if size + len(field) > self.max_chars:
+                self.truncated_pages += 1
+                kept.append(f"<Note>\n{len(fields) - len(kept)} more field(s) are omitted here; "
+                            "see the API playground for the full schema.\n</Note>")
+                break
+            kept.append(field)
+            size += len(field) + 2
+        return "\n\n".join(kept)
+
+    def stats(self) -> Dict[str, int]:
+        return {"fragments": len(self._fragments), "hits": self.hits, "misses": self.misses,
+                "truncated_pages": self.truncated_pages}
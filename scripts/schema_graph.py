@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Schema reference graph for the OpenAPI spec.
+Built once over components/schemas and the endpoints that use them, it answers
+"which schemas does this category need" and "which endpoint pages use schema X".
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Set
+
+from docs_paths import DOCS_DIR
+
+GRAPH_FILE = DOCS_DIR / "api-reference" / "openapi-split" / "_schema_graph.json"
+REF_PREFIX = "#/components/schemas/"
+
+
+def collect_refs(node: Any) -> Set[str]:
+    """Return the names of every component schema referenced directly by ``node``."""
+    refs = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str) and ref.startswith(REF_PREFIX):
+                refs.add(ref[len(REF_PREFIX):])
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return refs
+
+
+class SchemaGraph:
+    """Directed graph of schema-to-schema and endpoint-to-schema references.
+
+    Transitive closures are memoized per schema. Recursive models are handled by
+    computing closures per strongly connected component, so every schema in a
+    cycle shares one cached closure.
+    """
+
+    def __init__(self):
+        self.edges: Dict[str, Set[str]] = {}
+        self.endpoints: Dict[str, Set[str]] = {}
+        self._closures: Dict[str, FrozenSet[str]] = {}
+        self._users: Dict[str, Set[str]] = None
+
+    def add_schema(self, name: str, schema: Any):
+        """Register a component schema and the schemas it references."""
+        self.edges[name] = collect_refs(schema)
+        self._closures.clear()
+        self._users = None
+
+    def add_endpoint(self, endpoint: str, node: Any):
+        """Register the schemas referenced directly by an endpoint's operations."""
+        self.endpoints.setdefault(endpoint, set()).update(collect_refs(node))
+        self._users = None
+
+    def closure(self, name: str) -> FrozenSet[str]:
+        """Every schema reachable from ``name``, including ``name`` itself."""
+        if name not in self._closures:
+            self._compute_closures(name)
+        return self._closures[name]
+
+    def closure_of(self, names: Iterable[str]) -> Set[str]:
+        """Union of the cached closures of ``names``."""
+        result = set()
+        for name in names:
+            result |= self.closure(name)
+        return result
+
+    def endpoint_schemas(self, endpoint: str) -> Set[str]:
+        """Every schema an endpoint depends on, directly or transitively."""
+        return self.closure_of(self.endpoints.get(endpoint, ()))
+
+    def endpoints_using(self, schema: str) -> Set[str]:
+        """Endpoints whose request or response depends on ``schema``."""
+        if self._users is None:
+            users: Dict[str, Set[str]] = {}
+            for endpoint in self.endpoints:
+                for name in self.endpoint_schemas(endpoint):
+                    users.setdefault(name, set()).add(endpoint)
+            self._users = users
+        return self._users.get(schema, set())
+
+    def _compute_closures(self, start: str):
+        """Iterative Tarjan SCC walk from ``start`` that fills the closure cache."""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack = []
+        on_stack = set()
+
+        def visit(node: str):
+            index[node] = low[node] = len(index)
+            stack.append(node)
+            on_stack.add(node)
+            work.append((node, iter(sorted(self.edges.get(node, ())))))
+
+        work = []
+        visit(start)
+        while work:
+            node, children = work[-1]
+            descended = False
+            for child in children:
+                if child in self._closures:
+                    continue
+                if child not in index:
+                    visit(child)
+                    descended = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+
+            if low[node] != index[node]:
+                continue
+
+            # ``node`` roots a strongly connected component; every edge leaving it
+            # points at a component whose closure is already cached
+            members = set()
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                members.add(member)
+                if member == node:
+                    break
+
+            closure = set(members)
+            for member in members:
+                for child in self.edges.get(member, ()):
+                    if child not in members:
+                        closure |= self._closures[child]
+
+            frozen = frozenset(closure)
+            for member in members:
+                self._closures[member] = frozen
+
+    def to_dict(self) -> Dict:
+        return {
+            "schemas": {name: sorted(refs) for name, refs in sorted(self.edges.items())},
+            "endpoints": {name: sorted(refs) for name, refs in sorted(self.endpoints.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SchemaGraph":
+        graph = cls()
+        graph.edges = {name: set(refs) for name, refs in data.get('schemas', {}).items()}
+        graph.endpoints = {name: set(refs) for name, refs in data.get('endpoints', {}).items()}
+        return graph
+
+    @classmethod
+    def load(cls, path: Path = GRAPH_FILE) -> "SchemaGraph":
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: Path = GRAPH_FILE):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Query the schema reference graph written by split-openapi.py")
+    parser.add_argument('--graph', type=Path, default=GRAPH_FILE, help='Path to _schema_graph.json')
+    parser.add_argument('--affected', nargs='+', metavar='SCHEMA',
+                        help='List endpoint pages that must be regenerated when these schemas change')
+    parser.add_argument('--closure', nargs='+', metavar='SCHEMA',
+                        help='List every schema reachable from these schemas')
+    args = parser.parse_args()
+
+    if not args.graph.exists():
+        print(f"❌ Schema graph not found: {args.graph}")
+        print("   Run 'python3 scripts/split-openapi.py' first")
+        return 1
+
+    graph = SchemaGraph.load(args.graph)
+
+    if args.closure:
+        for name in sorted(graph.closure_of(args.closure)):
+            print(name)
+
+    if args.affected:
+        pages = set()
+        for name in args.affected:
+            pages |= graph.endpoints_using(name)
+        for page in sorted(pages):
+            print(page)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Lazy, LRU-cached access to the component schemas split into openapi-split/schemas/.
+The store lists the schema files once without parsing them, parses a schema the first
+time it is asked for and keeps at most a fixed number of parsed schemas, so memory stays
+flat however many schemas the spec grows. $refs are resolved one hop at a time, only when
+a caller follows them.
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from docs_paths import DOCS_DIR
+from schema_graph import REF_PREFIX, collect_refs
+from stage_profiler import PROFILER
+
+SCHEMAS_DIR = DOCS_DIR / "api-reference" / "openapi-split" / "schemas"
+DEFAULT_CACHE_SIZE = 512
+# Longest chain of schemas that are only a $ref to another schema
+MAX_REF_HOPS = 16
+
+
+def schema_filename(name: str) -> str:
+    """File name for a component schema inside schemas/."""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', name) + ".json"
+
+
+class SchemaStore:
+    """Component schemas by name, parsed on first access and kept in a bounded LRU.
+
+    Lookups of names without a file return None and are not counted as misses.
+    Returned schemas are shared with the cache and must not be modified.
+    """
+
+    def __init__(self, schemas_dir: Path = SCHEMAS_DIR, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.schemas_dir = Path(schemas_dir)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._files: Optional[Dict[str, str]] = None
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+
+    @property
+    def files(self) -> Dict[str, str]:
+        """``{file name: path}`` of every schema file, listed on first use."""
+        if self._files is None:
+            self._files = {}
+            if self.schemas_dir.is_dir():
+                with os.scandir(self.schemas_dir) as entries:
+                    self._files = {entry.name: entry.path for entry in entries if entry.name.endswith('.json')}
+        return self._files
+
+    def reindex(self):
+        """Forget the file listing and every parsed schema, e.g. after split-openapi.py ran again."""
+        self._files = None
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __contains__(self, name: str) -> bool:
+        return schema_filename(name) in self.files
+
+    def path(self, name: str) -> Optional[Path]:
+        location = self.files.get(schema_filename(name))
+        return Path(location) if location else None
+
+    def get(self, name: str) -> Optional[dict]:
+        """The parsed schema called ``name``, or None if there is no such schema."""
+        schema = self._cache.get(name)
+        if schema is not None:
+            self._cache.move_to_end(name)
+            self.hits += 1
+            return schema
+
+        location = self.files.get(schema_filename(name))
+        if location is None:
+            return None
+        try:
+            schema = PROFILER.load_json(Path(location))
+        except (OSError, ValueError):
+            return None
+        self.misses += 1
+        self._cache[name] = schema
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+        return schema
+
+    def __call__(self, name: str) -> Optional[dict]:
+        return self.get(name)
+
+    def resolve(self, node: Any) -> Tuple[Optional[str], dict]:
+        """``(component name, schema)`` of a node, following $refs to other components.
+
+        Plain nodes come back as ``(None, node)``; unresolvable refs as ``(name, {})``.
+        """
+        if not isinstance(node, dict):
+            return None, {}
+        name = None
+        for _ in range(MAX_REF_HOPS):
+            ref = node.get('$ref')
+            if not (isinstance(ref, str) and ref.startswith(REF_PREFIX)):
+                break
+            name = ref[len(REF_PREFIX):]
+            node = self.get(name) or {}
+        return name, node
+
+    def closure(self, names: Iterable[str]) -> Dict[str, dict]:
+        """Every schema reachable from ``names``, by name; missing schemas are skipped."""
+        schemas: Dict[str, dict] = {}
+        pending = sorted(names)
+        while pending:
+            name = pending.pop()
+            if name in schemas:
+                continue
+            schema = self.get(name)
+            if schema is None:
+                continue
+            schemas[name] = schema
+            pending.extend(collect_refs(schema) - schemas.keys())
+        return schemas
+
+    def iter_names(self) -> Iterator[str]:
+        """File stems of every schema, which equal the schema names for all but unusual names."""
+        return (name[:-len('.json')] for name in sorted(self.files))
+
+    def stats(self) -> Dict[str, int]:
+        return {"schemas": len(self.files), "cached": len(self._cache), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Print component schemas from openapi-split/schemas")
+    parser.add_argument('names', nargs='*', metavar='SCHEMA', help='Schemas to print')
+    parser.add_argument('--schemas-dir', type=Path, default=SCHEMAS_DIR, help='Directory written by split-openapi.py')
+    parser.add_argument('--closure', action='store_true', help='Also print every schema they reference')
+    args = parser.parse_args()
+
+    store = SchemaStore(args.schemas_dir)
+    if not len(store):
+        print(f"❌ No schemas in {args.schemas_dir}")
+        print("   Run 'python3 scripts/split-openapi.py' first")
+        return 1
+
+    missing = [name for name in args.names if name not in store]
+    if missing:
+        print(f"❌ Unknown schema(s): {', '.join(missing)}")
+        return 1
+    schemas = store.closure(args.names) if args.closure else {name: store.get(name) for name in args.names}
+    if schemas:
+        print(json.dumps({name: schemas[name] for name in sorted(schemas)}, indent=2))
+    else:
+        print(f"📦 {len(store)} schemas in {args.schemas_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
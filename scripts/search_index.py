@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Compact BM25 full-text index over the documentation.
+The index is one binary file: a sorted term table, array-backed postings and
+per-document metadata. Queries memory-map it and touch only the postings of the
+query terms, so they answer in milliseconds without reading any source file.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import mmap
+import re
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from docs_paths import DOCS_DIR
+
+INDEX_FILE = DOCS_DIR / ".cache" / "search-index.bin"
+
+MAGIC = b"RSIX"
+FORMAT_VERSION = 1
+# magic, version, doc count, term count, average doc length, then section offsets:
+# doc table, doc metadata, term table, term strings, postings
+HEADER = struct.Struct("<4sIIId5Q")
+# per doc: metadata offset, metadata length, document length in tokens
+DOC_ENTRY = struct.Struct("<III")
+# per term: string offset, string length, document frequency, postings offset (in u32 units)
+TERM_ENTRY = struct.Struct("<IIII")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_BOOST = 3
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this "
+    "to was were will with you your".split()
+)
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]{2,}s(?![a-z])|[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased terms; camelCase and snake_case identifiers are split into words."""
+    tokens = []
+    for word in _WORD.findall(text):
+        parts = _CAMEL.findall(word) if not word.islower() else [word]
+        if len(parts) > 1:
+            tokens.append(word.lower())
+        for part in parts:
+            part = part.lower()
+            if part not in STOPWORDS:
+                tokens.append(part)
+    return tokens
+
+
+def term_frequencies(title: str, body: str) -> Tuple[Dict[str, int], int]:
+    """Term counts of a document, with title terms boosted, and its length in tokens."""
+    counts: Dict[str, int] = {}
+    title_tokens = tokenize(title)
+    body_tokens = tokenize(body)
+    for token in title_tokens:
+        counts[token] = counts.get(token, 0) + TITLE_BOOST
+    for token in body_tokens:
+        counts[token] = counts.get(token, 0) + 1
+    return counts, len(title_tokens) * TITLE_BOOST + len(body_tokens)
+
+
+def _native(values: array) -> array:
+    """The index is little-endian; swap on big-endian hosts."""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def build_index(documents: List[Dict]) -> bytes:
+    """Serialize ``documents`` into the binary index format.
+
+    Each document is ``{"id", "title", "url", "kind", "description", "terms", "length"}``
+    where ``terms`` maps a term to its (boosted) frequency.
+    """
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    doc_table = bytearray()
+    doc_meta = bytearray()
+    total_length = 0
+    for doc_id, doc in enumerate(documents):
+        meta = json.dumps({key: doc.get(key, '') for key in ('id', 'title', 'url', 'kind', 'description')},
+                          separators=(',', ':')).encode('utf-8')
+        doc_table += DOC_ENTRY.pack(len(doc_meta), len(meta), doc['length'])
+        doc_meta += meta
+        total_length += doc['length']
+        for term, tf in doc['terms'].items():
+            postings.setdefault(term, []).append((doc_id, tf))
+
+    term_table = bytearray()
+    term_strings = bytearray()
+    posting_values = array('I')
+    for term in sorted(postings, key=lambda t: t.encode('utf-8')):
+        encoded = term.encode('utf-8')
+        entries = postings[term]
+        term_table += TERM_ENTRY.pack(len(term_strings), len(encoded), len(entries), len(posting_values))
+        term_strings += encoded
+        for doc_id, tf in entries:
+            posting_values.append(doc_id)
+            posting_values.append(tf)
+
+    sections = [bytes(doc_table), bytes(doc_meta), bytes(term_table), bytes(term_strings),
+                _native(posting_values).tobytes()]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        # Keep every section 4-byte aligned so postings can be cast to u32 in place
+        position += -position % 4
+        offsets.append(position)
+        position += len(section)
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(documents), len(postings),
+                                total_length / len(documents) if documents else 0.0, *offsets))
+    for offset, section in zip(offsets, sections):
+        out += b'\0' * (offset - len(out))
+        out += section
+    return bytes(out)
+
+
+class SearchIndex:
+    """Memory-mapped reader for an index written by ``build_index``."""
+
+    def __init__(self, path: Path = INDEX_FILE):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.doc_count, self.term_count, self.avgdl,
+         self._docs, self._meta, self._terms, self._strings, self._postings) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} search index")
+        self._view = memoryview(self._mmap)
+        self._posting_values = self._view[self._postings:].cast('I') if sys.byteorder == 'little' else None
+
+    def close(self):
+        if self._posting_values is not None:
+            self._posting_values.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "SearchIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _term(self, position: int) -> Tuple[bytes, int, int]:
+        offset, length, df, postings = TERM_ENTRY.unpack_from(self._mmap, self._terms + position * TERM_ENTRY.size)
+        start = self._strings + offset
+        return self._mmap[start:start + length], df, postings
+
+    def lookup(self, term: str) -> Optional[Tuple[int, int]]:
+        """``(document frequency, postings offset)`` of ``term``, by binary search."""
+        key = term.encode('utf-8')
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            candidate, df, postings = self._term(middle)
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return df, postings
+        return None
+
+    def _posting_pairs(self, df: int, offset: int) -> Iterable[Tuple[int, int]]:
+        """``(doc_id, tf)`` pairs of a term, read straight from the mapped file."""
+        if self._posting_values is not None:
+            values = self._posting_values[offset:offset + df * 2]
+        else:
+            start = self._postings + offset * 4
+            values = array('I', self._mmap[start:start + df * 8])
+            values.byteswap()
+        return zip(values[0::2], values[1::2])
+
+    def document_length(self, doc_id: int) -> int:
+        return DOC_ENTRY.unpack_from(self._mmap, self._docs + doc_id * DOC_ENTRY.size)[2]
+
+    def document_span(self, doc_id: int) -> Tuple[int, int]:
+        """Byte offset and length of a document's metadata within the index file."""
+        offset, length, _ = DOC_ENTRY.unpack_from(self._mmap, self._docs + doc_id * DOC_ENTRY.size)
+        return self._meta + offset, length
+
+    def document(self, doc_id: int) -> Dict:
+        start, length = self.document_span(doc_id)
+        return json.loads(self._mmap[start:start + length])
+
+    def search(self, query: str, limit: int = 10, kind: Optional[str] = None) -> List[Dict]:
+        """Top ``limit`` documents for ``query`` by BM25, best first."""
+        scores: Dict[int, float] = {}
+        lengths: Dict[int, int] = {}
+        for term in set(tokenize(query)):
+            found = self.lookup(term)
+            if found is None:
+                continue
+            df, offset = found
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in self._posting_pairs(df, offset):
+                length = lengths.get(doc_id)
+                if length is None:
+                    length = lengths[doc_id] = self.document_length(doc_id)
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.avgdl or 1))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        results = []
+        ranked = heapq.nlargest(len(scores) if kind else limit, scores.items(), key=lambda item: item[1])
+        for doc_id, score in ranked:
+            doc = self.document(doc_id)
+            if kind and doc.get('kind') != kind:
+                continue
+            doc['score'] = round(score, 4)
+            results.append(doc)
+            if len(results) == limit:
+                break
+        return results
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Query the documentation search index")
+    parser.add_argument('query', nargs='+', help='Search terms')
+    parser.add_argument('--index', type=Path, default=INDEX_FILE, help='Index built by build-search-index.py')
+    parser.add_argument('--limit', '-n', type=int, default=10, help='Number of results')
+    parser.add_argument('--kind', choices=['endpoint', 'guide', 'llms'], help='Only return this kind of document')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if not args.index.exists():
+        print(f"❌ Search index not found: {args.index}")
+        print("   Run 'python3 scripts/build-search-index.py' first")
+        return 1
+
+    started = time.perf_counter()
+    with SearchIndex(args.index) as index:
+        results = index.search(' '.join(args.query), args.limit, args.kind)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"🔍 {len(results)} result(s) in {elapsed:.1f} ms\n")
+    for rank, doc in enumerate(results, 1):
+        print(f"{rank:2}. {doc['title']}  [{doc['kind']}, {doc['score']}]")
+        print(f"    {doc['url']}")
+        if doc.get('description'):
+            print(f"    {doc['description']}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
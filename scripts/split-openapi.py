@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Split the monolithic OpenAPI spec into per-tag category files.
+Streams api-reference/openapi.json one path item at a time and writes openapi-split/
+(_base.json, _index.json, one file per tag and schemas/) in a single pass, along with
+the schema reference graph (_schema_graph.json) used for per-category schema closures.
+"""
+
+import argparse
+import json
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, IO, Set, Tuple
+
+from docs_paths import DOCS_DIR
+from endpoint_pages import CategoryFiles, endpoint_page_path, operation_tag
+from openapi_stream import HTTP_METHODS, JSONStreamReader, iter_operations
+from schema_graph import SchemaGraph, collect_refs
+from schema_store import schema_filename
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Configuration
+OPENAPI_FILE = DOCS_DIR / "api-reference" / "openapi.json"
+SPLIT_DIR = DOCS_DIR / "api-reference" / "openapi-split"
+MAX_OPEN_FILES = 128
+
+
+def split_path_item(path_item: dict) -> Dict[str, dict]:
+    """Group the operations of a path item by their first tag."""
+    shared = {k: v for k, v in path_item.items() if k not in HTTP_METHODS}
+    by_tag: Dict[str, dict] = {}
+    for method, operation in iter_operations(path_item):
+        by_tag.setdefault(operation_tag(operation), dict(shared))[method.lower()] = operation
+    return by_tag
+
+
+class CategoryWriter:
+    """Appends path items to per-tag category files as they are streamed in."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        self.files: Dict[str, str] = {}
+        self.categories = CategoryFiles()
+        self.counts: Dict[str, int] = {}
+        self._open: "OrderedDict[str, IO[str]]" = OrderedDict()
+
+    def _handle(self, tag: str) -> IO[str]:
+        handle = self._open.get(tag)
+        if handle is not None:
+            self._open.move_to_end(tag)
+            return handle
+
+        # Keep the number of simultaneously open files bounded
+        if len(self._open) >= MAX_OPEN_FILES:
+            _, oldest = self._open.popitem(last=False)
+            oldest.close()
+
+        if tag in self.files:
+            handle = open(self.output_dir / self.files[tag], 'a')
+        else:
+            filename = self.categories.stem(tag) + ".json"
+            self.files[tag] = filename
+            self.counts[tag] = 0
+            handle = open(self.output_dir / filename, 'w')
+            handle.write('{\n  "tag": ' + json.dumps(tag) + ',\n  "paths": {')
+            PROFILER.count("files_written")
+        self._open[tag] = handle
+        return handle
+
+    def add(self, tag: str, path: str, path_item: dict) -> str:
+        """Append a path item to its tag's file and return the category file stem."""
+        handle = self._handle(tag)
+        separator = ',' if self.counts[tag] else ''
+        body = PROFILER.dumps_json(path_item, indent=2).replace('\n', '\n    ')
+        chunk = f'{separator}\n    {json.dumps(path)}: {body}'
+        handle.write(chunk)
+        PROFILER.count("bytes_written", len(chunk))
+        self.counts[tag] += 1
+        return Path(self.files[tag]).stem
+
+    def close(self, trailers: Dict[str, dict] = None):
+        """Terminate every category file, appending extra top-level keys per tag."""
+        for handle in self._open.values():
+            handle.close()
+        self._open.clear()
+
+        trailers = trailers or {}
+        for tag, filename in self.files.items():
+            with open(self.output_dir / filename, 'a') as handle:
+                handle.write('\n  }')
+                for key, value in trailers.get(tag, {}).items():
+                    body = json.dumps(value, indent=2).replace('\n', '\n  ')
+                    handle.write(f',\n  {json.dumps(key)}: {body}')
+                handle.write('\n}\n')
+
+
+def publish(staging_dir: Path, output_dir: Path) -> Tuple[int, int]:
+    """Move staged files into place, keeping byte-identical files untouched.
+
+    Category and schema files that were not produced by this run are removed.
+    Returns the number of files updated and removed.
+    """
+    updated = removed = 0
+    produced = set()
+    for staged in sorted(staging_dir.rglob("*.json")):
+        relative = staged.relative_to(staging_dir)
+        produced.add(relative)
+        target = output_dir / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() and PROFILER.read_bytes(target) == PROFILER.read_bytes(staged):
+            continue
+        staged.replace(target)
+        updated += 1
+
+    for existing in list(output_dir.glob("*.json")) + list((output_dir / "schemas").glob("*.json")):
+        if existing.relative_to(output_dir) not in produced:
+            existing.unlink()
+            removed += 1
+
+    shutil.rmtree(staging_dir)
+    return updated, removed
+
+
+def split_spec(spec_file: Path, output_dir: Path) -> Dict:
+    """Split ``spec_file`` into ``output_dir`` in a single streaming pass."""
+    staging_dir = output_dir / ".staging"
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    (staging_dir / "schemas").mkdir(parents=True)
+
+    base = {}
+    writer = CategoryWriter(staging_dir)
+    graph = SchemaGraph()
+    tag_refs: Dict[str, Set[str]] = {}
+    schema_count = 0
+
+    with PROFILER.stage("stream-spec"), open(spec_file, 'r') as f:
+        PROFILER.count("files_read")
+        PROFILER.count("bytes_read", spec_file.stat().st_size)
+        reader = JSONStreamReader(f)
+        for key in reader.iter_object():
+            if key == 'paths':
+                for path in reader.iter_object():
+                    for tag, item in split_path_item(reader.read_value()).items():
+                        category = writer.add(tag, path, item)
+                        graph.add_endpoint(endpoint_page_path(category, path), item)
+                        tag_refs.setdefault(tag, set()).update(collect_refs(item))
+            elif key == 'components':
+                components = {}
+                for component_type in reader.iter_object():
+                    if component_type != 'schemas':
+                        components[component_type] = reader.read_value()
+                        continue
+                    for name in reader.iter_object():
+                        schema = reader.read_value()
+                        graph.add_schema(name, schema)
+                        PROFILER.dump_json(schema, staging_dir / "schemas" / schema_filename(name), indent=2)
+                        schema_count += 1
+                base['components'] = components
+            else:
+                base[key] = reader.read_value()
+
+    # Each category needs the transitive closure of the schemas its endpoints
+    # reference; the graph memoizes closures so shared models are walked once
+    with PROFILER.stage("schema-closures"):
+        writer.close({
+            tag: {"schemas": sorted(graph.closure_of(refs))}
+            for tag, refs in tag_refs.items()
+        })
+        graph.save(staging_dir / "_schema_graph.json")
+
+    categories = sorted(writer.files)
+    index = {
+        "title": base.get('info', {}).get('title', ''),
+        "version": base.get('info', {}).get('version', ''),
+        "categories": categories,
+        "files": {tag: writer.files[tag] for tag in categories},
+        "endpoints": {tag: writer.counts[tag] for tag in categories},
+        "schemas": schema_count,
+    }
+
+    PROFILER.dump_json(base, staging_dir / "_base.json", indent=2)
+    PROFILER.dump_json(index, staging_dir / "_index.json", indent=2)
+
+    with PROFILER.stage("publish"):
+        updated, removed = publish(staging_dir, output_dir)
+    index['updated_files'] = updated
+    index['removed_files'] = removed
+    return index
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--input', type=Path, default=OPENAPI_FILE, help='OpenAPI spec to split')
+    parser.add_argument('--output-dir', type=Path, default=SPLIT_DIR, help='Destination directory')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "split-openapi")
+
+    print("✂️  Splitting OpenAPI spec into category files\n")
+
+    if not args.input.exists():
+        print(f"❌ OpenAPI spec not found: {args.input}")
+        return 1
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    index = split_spec(args.input, args.output_dir)
+
+    print(f"✅ Split {sum(index['endpoints'].values())} paths into {len(index['categories'])} categories")
+    print(f"✅ Extracted {index['schemas']} schemas to {args.output_dir / 'schemas'}")
+    print(f"📁 Updated {index['updated_files']} file(s), removed {index['removed_files']} stale file(s)")
+
+    print("\n💡 Next steps:")
+    print("   1. Run 'python3 scripts/generate-endpoint-docs.py' to regenerate endpoint pages")
+
+    PROFILER.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
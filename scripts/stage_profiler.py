@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Stage profiler and I/O counters shared by the docs scripts.
+Enabled with --profile, it records wall time, files and bytes read and written,
+JSON parse/dump time and peak memory per stage, and writes a JSON report.
+"""
+
+import argparse
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from docs_paths import DOCS_DIR
+
+PROFILE_DIR = DOCS_DIR / ".cache"
+COUNTERS = (
+    "files_read", "files_written", "bytes_read", "bytes_written",
+    "json_parse_seconds", "json_dump_seconds",
+)
+
+
+class StageProfiler:
+    """Collects per-stage measurements; every method is a cheap no-op when disabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.script = ""
+        self.report_file: Optional[Path] = None
+        self.cprofile_dir: Optional[Path] = None
+        self.stages: List[Dict[str, Any]] = []
+        self.totals: Dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        self._open: List[Dict[str, Any]] = []
+        self._started = 0.0
+        # Counters are bumped from worker threads (icon updates, link checks)
+        self._lock = threading.Lock()
+
+    def configure(self, args: argparse.Namespace, script: str):
+        """Enable profiling from the options added by ``add_profile_arguments``."""
+        self.script = script
+        self.enabled = bool(getattr(args, 'profile', False))
+        if not self.enabled:
+            return
+        self.report_file = Path(args.profile_output or PROFILE_DIR / f"profile-{script}.json")
+        self.cprofile_dir = Path(args.cprofile_dir) if args.cprofile_dir else None
+        self._started = time.perf_counter()
+        tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the enclosed block as one stage; stages may nest."""
+        if not self.enabled:
+            yield
+            return
+
+        # Fold the running peak into open stages before resetting it for this one
+        peak = tracemalloc.get_traced_memory()[1]
+        for parent in self._open:
+            parent["peak_memory_bytes"] = max(parent["peak_memory_bytes"], peak)
+        tracemalloc.reset_peak()
+
+        record = {"name": name, "seconds": 0.0, "peak_memory_bytes": 0, **dict.fromkeys(COUNTERS, 0)}
+        profile = cProfile.Profile() if self.cprofile_dir else None
+        self._open.append(record)
+        start = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+                self.cprofile_dir.mkdir(parents=True, exist_ok=True)
+                profile.dump_stats(self.cprofile_dir / f"{self.script}-{len(self.stages)}-{name}.prof")
+            record["seconds"] = round(time.perf_counter() - start, 6)
+            for counter in ("json_parse_seconds", "json_dump_seconds"):
+                record[counter] = round(record[counter], 6)
+            peak = tracemalloc.get_traced_memory()[1]
+            record["peak_memory_bytes"] = max(record["peak_memory_bytes"], peak)
+            self._open.pop()
+            for parent in self._open:
+                parent["peak_memory_bytes"] = max(parent["peak_memory_bytes"], peak)
+            self.stages.append(record)
+
+    def count(self, counter: str, amount: float = 1):
+        """Add ``amount`` to a counter of every open stage and of the totals."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.totals[counter] += amount
+            for record in self._open:
+                record[counter] += amount
+
+    def read_bytes(self, path: Path) -> bytes:
+        data = Path(path).read_bytes()
+        self.count("files_read")
+        self.count("bytes_read", len(data))
+        return data
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode('utf-8')
+
+    def write_bytes(self, path: Path, data: bytes):
+        Path(path).write_bytes(data)
+        self.count("files_written")
+        self.count("bytes_written", len(data))
+
+    def write_text(self, path: Path, content: str):
+        self.write_bytes(path, content.encode('utf-8'))
+
+    def load_json(self, path: Path) -> Any:
+        return self.parse_json(self.read_bytes(path))
+
+    def parse_json(self, data) -> Any:
+        start = time.perf_counter()
+        value = json.loads(data)
+        self.count("json_parse_seconds", time.perf_counter() - start)
+        return value
+
+    def dumps_json(self, value: Any, **kwargs) -> str:
+        start = time.perf_counter()
+        content = json.dumps(value, **kwargs)
+        self.count("json_dump_seconds", time.perf_counter() - start)
+        return content
+
+    def dump_json(self, value: Any, path: Path, **kwargs):
+        self.write_text(path, self.dumps_json(value, **kwargs))
+
+    def report(self) -> Dict[str, Any]:
+        totals = {counter: round(value, 6) for counter, value in self.totals.items()}
+        totals["seconds"] = round(time.perf_counter() - self._started, 6)
+        totals["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        for record in self.stages:
+            totals["peak_memory_bytes"] = max(totals["peak_memory_bytes"], record["peak_memory_bytes"])
+        return {"script": self.script, "stages": self.stages, "totals": totals}
+
+    def finish(self) -> Optional[Path]:
+        """Write the JSON report if profiling is enabled and return its path."""
+        if not self.enabled:
+            return None
+        self.report_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.report_file, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        tracemalloc.stop()
+        print(f"\n⏱️  Profile written to {self.report_file}")
+        return self.report_file
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add the --profile options shared by every docs script."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true',
+                       help='Record per-stage timings, I/O counters and peak memory')
+    group.add_argument('--profile-output', metavar='FILE',
+                       help='Where to write the JSON profile report (default: .cache/profile-<script>.json)')
+    group.add_argument('--cprofile-dir', metavar='DIR',
+                       help='Also dump a cProfile .prof file per stage into DIR')
+
+
+PROFILER = StageProfiler()
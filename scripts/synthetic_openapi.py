@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic OpenAPI generator for benchmarking the docs pipeline.
+Produces Rhombus-shaped specs of any size offline; the spec is streamed to disk so
+even 100k-operation specs are written without building them in memory.
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import IO, List
+
+from endpoint_classification import SERVICE_GROUPS
+
+VERBS = ['get', 'find', 'list', 'search', 'create', 'add', 'upload', 'update', 'assign',
+         'delete', 'erase', 'unlock', 'revoke', 'export', 'trigger', 'sync']
+NOUNS = ['Camera', 'Policy', 'State', 'Config', 'MediaUris', 'Settings', 'Members',
+         'Credentials', 'Report', 'Footage', 'Alerts', 'Schedule', 'Devices', 'Firmware']
+
+
+def synthetic_tags(count: int) -> List[str]:
+    """Tag names, starting with real service categories so grouping is exercised."""
+    known = [name for groups in SERVICE_GROUPS.values() for name in groups]
+    tags = [f"{name} Webservice" for name in known[:count]]
+    tags += [f"Synthetic {i} Webservice" for i in range(len(tags), count)]
+    return tags
+
+
+def synthetic_schemas(count: int, depth: int, rng: random.Random) -> List[dict]:
+    """Schemas arranged in ``depth`` levels; each level references the one below."""
+    levels = max(1, depth)
+    per_level = max(1, count // levels)
+    schemas = []
+    for index in range(per_level * levels):
+        level = index // per_level
+        properties = {
+            "uuid": {"type": "string", "description": f"Identifier of item {index}"},
+            "count": {"type": "integer", "format": "int32"},
+            "enabled": {"type": "boolean"},
+        }
+        if level > 0:
+            child = f"Model{(level - 1) * per_level + rng.randrange(per_level)}"
+            properties["child"] = {"$ref": f"#/components/schemas/{child}"}
+            properties["children"] = {"type": "array", "items": {"$ref": f"#/components/schemas/{child}"}}
+        schemas.append({"name": f"Model{index}", "level": level, "schema": {
+            "type": "object",
+            "description": f"Synthetic model {index}",
+            "properties": properties,
+        }})
+    return schemas
+
+
+def write_spec(fp: IO[str], operations: int, tags: int = 60, schemas: int = 500,
+               depth: int = 4, seed: int = 1):
+    """Stream a synthetic OpenAPI document with ``operations`` operations to ``fp``."""
+    rng = random.Random(seed)
+    tag_names = synthetic_tags(tags)
+    models = synthetic_schemas(schemas, depth, rng)
+    top_level = max(model['level'] for model in models)
+    roots = [model['name'] for model in models if model['level'] == top_level]
+
+    fp.write('{"openapi": "3.0.1", "info": {"title": "Rhombus API (synthetic)", "version": "bench"},')
+    fp.write(' "servers": [{"url": "https://api2.rhombussystems.com"}],')
+    fp.write(' "tags": ' + json.dumps([{"name": tag} for tag in tag_names]) + ',')
+    fp.write(' "paths": {')
+
+    for index in range(operations):
+        tag = tag_names[index % len(tag_names)]
+        segment = tag.replace(' Webservice', '').replace(' ', '')
+        segment = segment[0].lower() + segment[1:]
+        path = f"/api/{segment}/{rng.choice(VERBS)}{rng.choice(NOUNS)}{index}"
+        operation = {
+            "tags": [tag],
+            "summary": f"Synthetic operation {index}",
+            "description": f"Performs synthetic operation {index} on the {tag} service.",
+            "operationId": f"operation{index}",
+            "requestBody": {"content": {"application/json": {
+                "schema": {"$ref": f"#/components/schemas/{rng.choice(roots)}"}}}},
+            "responses": {"200": {"description": "OK", "content": {"application/json": {
+                "schema": {"$ref": f"#/components/schemas/{rng.choice(roots)}"}}}}},
+        }
+        if index % 97 == 0:
+            operation["deprecated"] = True
+        separator = ',' if index else ''
+        fp.write(f'{separator}{json.dumps(path)}: {json.dumps({"post": operation})}')
+
+    fp.write('}, "components": {"securitySchemes": {"ApiKeyAuth": {"type": "apiKey", "in": "header",'
+             ' "name": "x-auth-apikey"}}, "schemas": {')
+    fp.write(','.join(f'{json.dumps(model["name"])}: {json.dumps(model["schema"])}' for model in models))
+    fp.write('}}}\n')
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', type=Path, help='Where to write the spec')
+    parser.add_argument('--operations', type=int, default=1000)
+    parser.add_argument('--tags', type=int, default=60)
+    parser.add_argument('--schemas', type=int, default=500)
+    parser.add_argument('--schema-depth', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        write_spec(f, args.operations, args.tags, args.schemas, args.schema_depth, args.seed)
+    print(f"✅ Wrote {args.operations} operations to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
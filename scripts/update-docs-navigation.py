@@ -4,41 +4,26 @@ Update docs.json with generated endpoint navigation structure.
 Merges the generated navigation while preserving other configuration.
 """
 
-import json
-from pathlib import Path
+import argparse
+from typing import Dict, List, Optional
 
-# File paths
-DOCS_JSON = Path("docs/docs.json")
-NAV_JSON = Path("docs/api-reference/endpoint/_navigation.json")
-BACKUP_JSON = Path("docs/docs.json.backup")
-
-def main():
-    print("🔄 Updating docs.json with endpoint navigation...\n")
+from docs_paths import DOCS_DIR, DOCS_JSON
+from output_writer import write_json_if_changed
+from stage_profiler import PROFILER, add_profile_arguments
 
-    # Backup existing docs.json
-    with open(DOCS_JSON, 'r') as f:
-        docs_data = json.load(f)
-
-    with open(BACKUP_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
-    print(f"✅ Backed up docs.json to {BACKUP_JSON}")
-
-    # Load generated navigation
-    with open(NAV_JSON, 'r') as f:
-        endpoint_nav = json.load(f)
-    print(f"✅ Loaded {len(endpoint_nav)} endpoint categories from _navigation.json")
+# File paths
+NAV_JSON = DOCS_DIR / "api-reference" / "endpoint" / "_navigation.json"
+BACKUP_JSON = DOCS_DIR / "docs.json.backup"
 
-    # Find the API reference tab
-    api_tab = None
+def find_api_tab(docs_data: Dict) -> Optional[Dict]:
+    """Return the 'API reference' tab from docs.json navigation."""
     for tab in docs_data['navigation']['tabs']:
         if tab['tab'] == 'API reference':
-            api_tab = tab
-            break
-
-    if not api_tab:
-        print("❌ Could not find 'API reference' tab in docs.json")
-        return
+            return tab
+    return None
 
+def merge_endpoint_navigation(api_tab: Dict, endpoint_nav: List[Dict]) -> List[Dict]:
+    """Replace the API reference groups with the intro group plus generated endpoints."""
     # Keep the introduction group, add all generated endpoints
     intro_group = {
         "group": "API documentation",
@@ -47,14 +32,42 @@ def main():
 
     # Update the API reference groups
     api_tab['groups'] = [intro_group] + endpoint_nav
+    return api_tab['groups']
 
-    print(f"✅ Updated API reference tab with {len(endpoint_nav)} endpoint groups")
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_profile_arguments(parser)
+    PROFILER.configure(parser.parse_args(), "update-docs-navigation")
 
-    # Write updated docs.json
-    with open(DOCS_JSON, 'w') as f:
-        json.dump(docs_data, f, indent=2)
+    print("🔄 Updating docs.json with endpoint navigation...\n")
+
+    with PROFILER.stage("load"):
+        docs_data = PROFILER.load_json(DOCS_JSON)
 
-    print(f"✅ Updated {DOCS_JSON}")
+        # Load generated navigation
+        endpoint_nav = PROFILER.load_json(NAV_JSON)
+        print(f"✅ Loaded {len(endpoint_nav)} endpoint categories from _navigation.json")
+
+    # Find the API reference tab
+    api_tab = find_api_tab(docs_data)
+
+    if not api_tab:
+        print("❌ Could not find 'API reference' tab in docs.json")
+        PROFILER.finish()
+        return
+
+    with PROFILER.stage("merge"):
+        merge_endpoint_navigation(api_tab, endpoint_nav)
+
+    print(f"✅ Updated API reference tab with {len(endpoint_nav)} endpoint groups")
+
+    # Write updated docs.json, backing up the previous version if it changed
+    with PROFILER.stage("write"):
+        if write_json_if_changed(DOCS_JSON, docs_data, backup=BACKUP_JSON, indent=2):
+            print(f"✅ Backed up docs.json to {BACKUP_JSON}")
+            print(f"✅ Updated {DOCS_JSON}")
+        else:
+            print(f"✅ {DOCS_JSON} already up to date")
     print(f"\n📊 Navigation structure:")
     print(f"   Total groups: {len(api_tab['groups'])}")
 
@@ -64,9 +77,11 @@ def main():
 
     print("\n🎉 Navigation update complete!")
     print("\n💡 Next steps:")
-    print("   1. Review docs/docs.json")
+    print(f"   1. Review {DOCS_JSON}")
     print("   2. Run 'mint dev' to preview the documentation")
     print("   3. If there are issues, restore from docs.json.backup")
 
+    PROFILER.finish()
+
 if __name__ == "__main__":
     main()
@@ -6,20 +6,229 @@ This script analyzes the project structure, documentation files, and configurati
 to generate comprehensive context files for AI assistants.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from docs_paths import DOCS_DIR
+from endpoint_classification import ACTION_GROUP_NAMES
+from endpoint_pages import ENDPOINT_PAGE_ROOT, category_slug
+from frontmatter_index import FrontmatterIndex
+from output_writer import StreamingOutput, write_if_changed, write_json_if_changed
+from stage_profiler import PROFILER, add_profile_arguments
+
+# Per-category shards of the endpoint reference, with a manifest for clients
+SHARD_DIR = "llms"
+SHARD_MANIFEST = "manifest.json"
+SHARD_VERSION = 1
+# Page signatures of the last render; kept out of the committed manifest since mtimes differ per checkout
+SHARD_CACHE = Path(".cache") / "llms-shards.json"
+
+LAST_UPDATED = re.compile(rb'^\*\*Last Updated\*\*: .*$', re.MULTILINE)
+
+
+def without_timestamp(data: bytes) -> bytes:
+    """Blank out the Last Updated line so a new timestamp alone never triggers a write."""
+    return LAST_UPDATED.sub(b'', data)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English prose and code: about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+class SectionBudget:
+    """Streams generator chunks into an output within a byte and/or token budget.
+
+    Without a budget chunks pass through untouched. With one, content is written
+    line by line until the next line would exceed it; from then on the rest of the
+    current ``## `` section is dropped and later sections keep only their heading,
+    each followed by a note saying how many lines were omitted. Headings inside
+    code fences are not treated as sections, and a cut fence is closed.
+    """
+
+    LINE = re.compile(r'[^\n]*\n|[^\n]+')
+
+    def __init__(self, out, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None):
+        self.out = out
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.bytes = 0
+        self.chars = 0
+        self.truncated: List[str] = []
+        self._section = "(preamble)"
+        self._dropped = 0
+        self._exhausted = False
+        self._in_fence = False
+        self._line_start = True
+
+    @property
+    def tokens(self) -> int:
+        return (self.chars + 3) // 4
+
+    def _emit(self, text: str):
+        self.out.write(text)
+        self.bytes += len(text.encode('utf-8'))
+        self.chars += len(text)
+        self._line_start = text.endswith('\n')
+
+    def _end_line(self):
+        if not self._line_start:
+            self._emit('\n')
+
+    def _fits(self, text: str) -> bool:
+        if self.max_bytes is not None and self.bytes + len(text.encode('utf-8')) > self.max_bytes:
+            return False
+        return self.max_tokens is None or estimate_tokens(text) + self.tokens <= self.max_tokens
+
+    def _close_section(self):
+        if not self._dropped:
+            return
+        self.truncated.append(self._section)
+        self._end_line()
+        self._emit(f"\n_{self._dropped} line(s) omitted to fit the output budget._\n\n")
+        self._dropped = 0
+
+    def _piece(self, piece: str, starts_line: bool):
+        if starts_line and not self._in_fence and piece.startswith('## '):
+            self._close_section()
+            self._section = piece.strip()[3:]
+            if self._exhausted:
+                self._emit(piece)
+                return
+        fence = starts_line and piece.startswith('```')
+        if not self._exhausted and not self._fits(piece):
+            self._exhausted = True
+            if self._in_fence and not fence:
+                self._end_line()
+                self._emit("```\n")
+        if fence:
+            self._in_fence = not self._in_fence
+        if self._exhausted:
+            self._dropped += starts_line
+            return
+        self._emit(piece)
+
+    def feed(self, chunks: Iterable[str]):
+        """Write every chunk, then the note for a section cut at the end."""
+        budgeted = self.max_bytes is not None or self.max_tokens is not None
+        starts_line = True
+        for chunk in chunks:
+            if not budgeted:
+                self._emit(chunk)
+                continue
+            for piece in self.LINE.findall(chunk):
+                self._piece(piece, starts_line)
+                starts_line = piece.endswith('\n')
+        self._close_section()
+
+
+class ProjectSnapshot:
+    """Project structure gathered from one directory walk and one docs.json parse.
+
+    Every analysis the generators run is served from this snapshot, so building
+    both llms files touches the filesystem once instead of once per question.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.config: Optional[Dict] = None
+        self.endpoint_mdx_total = 0
+        self.endpoint_categories: Dict[str, int] = {}
+        self.split_files = 0
+        self.scripts = 0
+        self.workflows = 0
+        self.cache: Dict[str, object] = {}
+
+        self._scan()
+        self._load_config()
+
+    @staticmethod
+    def _entries(path: Path) -> List[os.DirEntry]:
+        try:
+            with os.scandir(path) as it:
+                return list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def _count_mdx(self, path: Path) -> int:
+        """Count *.mdx files below ``path`` recursively."""
+        total = 0
+        for entry in self._entries(path):
+            if entry.is_dir(follow_symlinks=False):
+                total += self._count_mdx(Path(entry.path))
+            elif entry.name.endswith(".mdx"):
+                total += 1
+        return total
+
+    def _scan(self):
+        api_dir = self.base_dir / "api-reference"
+
+        # Endpoint pages: per-category counts of direct *.mdx files, plus a recursive total
+        for entry in self._entries(api_dir / "endpoint"):
+            if entry.is_dir():
+                direct = 0
+                for child in self._entries(Path(entry.path)):
+                    if child.is_dir(follow_symlinks=False):
+                        self.endpoint_mdx_total += self._count_mdx(Path(child.path))
+                    elif child.name.endswith(".mdx"):
+                        direct += 1
+                self.endpoint_categories[entry.name] = direct
+                self.endpoint_mdx_total += direct
+            elif entry.name.endswith(".mdx"):
+                self.endpoint_mdx_total += 1
+
+        self.split_files = sum(
+            1 for entry in self._entries(api_dir / "openapi-split")
+            if entry.name.endswith(".json") and not entry.name.startswith("_")
+        )
+        self.scripts = sum(1 for entry in self._entries(self.base_dir / "scripts") if "." in entry.name)
+        self.workflows = sum(
+            1 for entry in self._entries(self.base_dir / ".github" / "workflows")
+            if entry.name.endswith(".yml")
+        )
+
+    def _load_config(self):
+        docs_json_path = self.base_dir / "docs.json"
+        if docs_json_path.exists():
+            self.config = PROFILER.load_json(docs_json_path)
 
 
 class LLMSFileGenerator:
     """Generates llms.txt and llms-full.txt files from project analysis."""
 
-    def __init__(self, docs_dir: str = "docs"):
+    def __init__(self, docs_dir: Path = DOCS_DIR):
         self.docs_dir = Path(docs_dir)
-        self.base_dir = self.docs_dir if self.docs_dir.exists() else Path(".")
+        self.base_dir = self.docs_dir
+        self._snapshot: Optional[ProjectSnapshot] = None
+        self._frontmatter: Optional[FrontmatterIndex] = None
+
+    def ensure_snapshot(self) -> ProjectSnapshot:
+        """Build the project snapshot unless it is already built, and return it."""
+        if self._snapshot is None:
+            self._snapshot = ProjectSnapshot(self.base_dir)
+        return self._snapshot
+
+    @property
+    def snapshot(self) -> ProjectSnapshot:
+        """Project snapshot, built on first use and shared by every analysis."""
+        return self.ensure_snapshot()
+
+    @property
+    def frontmatter(self) -> FrontmatterIndex:
+        """Persistent frontmatter index shared by every page lookup."""
+        if self._frontmatter is None:
+            self._frontmatter = FrontmatterIndex(self.base_dir)
+        return self._frontmatter
+
+    def refresh(self):
+        """Discard the snapshot so the next analysis re-reads the project."""
+        self._snapshot = None
 
     def count_endpoints_in_nav(self, nav_data: dict) -> Dict[str, int]:
         """Count endpoints by category from navigation structure."""
@@ -53,9 +262,12 @@ class LLMSFileGenerator:
 
     def analyze_docs_json(self) -> Dict:
         """Analyze docs.json for configuration and structure."""
-        docs_json_path = self.base_dir / "docs.json"
+        if "docs_json" not in self.snapshot.cache:
+            self.snapshot.cache["docs_json"] = self._analyze_config(self.snapshot.config)
+        return self.snapshot.cache["docs_json"]
 
-        if not docs_json_path.exists():
+    def _analyze_config(self, config: Optional[Dict]) -> Dict:
+        if config is None:
             return {
                 "total_endpoints": 0,
                 "categories": [],
@@ -63,9 +275,6 @@ class LLMSFileGenerator:
                 "navigation_tabs": []
             }
 
-        with open(docs_json_path, 'r') as f:
-            config = json.load(f)
-
         # Count endpoints from navigation
         endpoint_counts = self.count_endpoints_in_nav(config.get("navigation", {}))
 
@@ -92,75 +301,35 @@ class LLMSFileGenerator:
 
     def count_files_by_type(self) -> Dict[str, int]:
         """Count documentation files by type."""
-        counts = {
-            "mdx": 0,
-            "json": 0,
-            "scripts": 0,
-            "workflows": 0
+        snapshot = self.snapshot
+        return {
+            "mdx": snapshot.endpoint_mdx_total,
+            "json": snapshot.split_files,
+            "scripts": snapshot.scripts,
+            "workflows": snapshot.workflows
         }
 
-        # Count MDX files
-        if (self.base_dir / "api-reference" / "endpoint").exists():
-            counts["mdx"] = len(list((self.base_dir / "api-reference" / "endpoint").rglob("*.mdx")))
-
-        # Count split OpenAPI files
-        if (self.base_dir / "api-reference" / "openapi-split").exists():
-            split_dir = self.base_dir / "api-reference" / "openapi-split"
-            counts["json"] = len([f for f in split_dir.glob("*.json") if not f.name.startswith("_")])
-
-        # Count scripts
-        if (self.base_dir / "scripts").exists():
-            counts["scripts"] = len(list((self.base_dir / "scripts").glob("*.*")))
-
-        # Count workflows
-        if (self.base_dir / ".github" / "workflows").exists():
-            counts["workflows"] = len(list((self.base_dir / ".github" / "workflows").glob("*.yml")))
-
-        return counts
-
     def get_api_categories(self) -> List[Tuple[str, int]]:
         """Get API categories and their endpoint counts."""
-        endpoint_dir = self.base_dir / "api-reference" / "endpoint"
-
-        if not endpoint_dir.exists():
-            return []
-
         categories = []
-        for category_dir in sorted(endpoint_dir.iterdir()):
-            if category_dir.is_dir():
-                count = len(list(category_dir.glob("*.mdx")))
-                if count > 0:
-                    # Format category name nicely
-                    name = category_dir.name.replace("-", " ").title()
-                    categories.append((name, count))
+        for directory, count in sorted(self.snapshot.endpoint_categories.items()):
+            if count > 0:
+                # Format category name nicely
+                name = directory.replace("-", " ").title()
+                categories.append((name, count))
 
         return categories
 
     def read_frontmatter(self, file_path: Path) -> Dict:
         """Extract YAML frontmatter from MDX file."""
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            # Extract frontmatter between --- markers
-            match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            if match:
-                frontmatter = {}
-                for line in match.group(1).split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        frontmatter[key.strip()] = value.strip().strip('"\'')
-                return frontmatter
-        except Exception:
-            pass
-        return {}
+        return self.frontmatter.get(file_path)
 
-    def generate_llms_txt(self) -> str:
-        """Generate concise llms.txt content."""
+    def iter_llms_txt(self) -> Iterator[str]:
+        """Yield the concise llms.txt content chunk by chunk."""
         config = self.analyze_docs_json()
         file_counts = self.count_files_by_type()
 
-        content = f"""# Rhombus Developer Documentation
+        yield f"""# Rhombus Developer Documentation
 
 This is a Mintlify documentation site for Rhombus security platform API documentation. The project provides comprehensive developer resources for integrating with Rhombus cameras, sensors, access control systems, and analytics.
 
@@ -201,12 +370,12 @@ This is a Mintlify documentation site for Rhombus security platform API document
 
         # Add navigation tabs
         for tab in config['navigation_tabs']:
-            content += f"- **{tab['name']} Tab**: "
+            yield f"- **{tab['name']} Tab**: "
             if 'groups' in tab:
-                content += ", ".join(tab['groups'])
-            content += "\n"
+                yield ", ".join(tab['groups'])
+            yield "\n"
 
-        content += f"""
+        yield f"""
 ## Technical Implementation
 
 ### API Integration
@@ -263,24 +432,24 @@ icon: "icon-name"          # Optional
         categories = self.get_api_categories()
         core_services = [cat for cat in categories if cat[1] > 10][:5]
         for name, count in core_services:
-            content += f"- **{name}**: {count} endpoints\n"
+            yield f"- **{name}**: {count} endpoints\n"
 
-        content += f"""
+        yield f"""
 ### Events & Monitoring
 """
         event_categories = [cat for cat in categories if any(term in cat[0].lower() for term in ['event', 'alert', 'face', 'occupancy'])]
         for name, count in event_categories[:4]:
-            content += f"- **{name}**: {count} endpoints\n"
+            yield f"- **{name}**: {count} endpoints\n"
 
-        content += f"""
+        yield f"""
 ### Integrations
 """
         integration_categories = [cat for cat in categories if 'integration' in cat[0].lower()][:2]
         for name, count in integration_categories:
-            content += f"- **{name}**: {count} endpoints\n"
+            yield f"- **{name}**: {count} endpoints\n"
 
         colors = config.get('colors', {})
-        content += f"""
+        yield f"""
 ## Branding & Theme
 
 ### Color Scheme (2024 Rebrand)
@@ -332,14 +501,16 @@ icon: "icon-name"          # Optional
 This project serves as the primary developer resource for Rhombus API integration, providing comprehensive documentation, interactive examples, and automated maintenance of API specifications.
 """
 
-        return content
+    def generate_llms_txt(self) -> str:
+        """Generate concise llms.txt content."""
+        return "".join(self.iter_llms_txt())
 
-    def generate_llms_full_txt(self) -> str:
-        """Generate comprehensive llms-full.txt content."""
+    def iter_llms_full_txt(self) -> Iterator[str]:
+        """Yield the comprehensive llms-full.txt content chunk by chunk."""
         config = self.analyze_docs_json()
         categories = self.get_api_categories()
 
-        content = f"""# Rhombus Developer Documentation - Complete Reference
+        yield f"""# Rhombus Developer Documentation - Complete Reference
 
 This is the comprehensive reference for the Rhombus Developer Documentation project, a Mintlify-based documentation site providing complete API documentation for the Rhombus security platform.
 
@@ -379,9 +550,9 @@ docs/
         # Add detailed category breakdown
         for name, count in sorted(categories, key=lambda x: x[1], reverse=True):
             slug = name.lower().replace(" ", "-")
-            content += f"│   │   ├── {slug}/{'':20} # {name} endpoints ({count})\n"
+            yield f"│   │   ├── {slug}/{'':20} # {name} endpoints ({count})\n"
 
-        content += f"""│   ├── openapi-split/                 # Split OpenAPI spec files
+        yield f"""│   ├── openapi-split/                 # Split OpenAPI spec files
 │   │   ├── schemas/                   # API schema definitions
 │   │   ├── _base.json                 # Base OpenAPI configuration
 │   │   └── _index.json                # Category index
@@ -428,13 +599,13 @@ docs/
 """
 
         for tab in config['navigation_tabs']:
-            content += f"""      {{
+            yield f"""      {{
         "tab": "{tab['name']}",
         "groups": {json.dumps(tab.get('groups', []))}
       }},
 """
 
-        content += """    ]
+        yield """    ]
   }
 }
 ```
@@ -462,26 +633,26 @@ docs/
                 core_services.append((name, count))
 
         if core_services:
-            content += "\n### Core Services\n"
+            yield "\n### Core Services\n"
             for name, count in sorted(core_services, key=lambda x: x[1], reverse=True):
-                content += f"- **{name}**: {count} endpoints\n"
+                yield f"- **{name}**: {count} endpoints\n"
 
         if events_monitoring:
-            content += "\n### Events & Monitoring\n"
+            yield "\n### Events & Monitoring\n"
             for name, count in sorted(events_monitoring, key=lambda x: x[1], reverse=True):
-                content += f"- **{name}**: {count} endpoints\n"
+                yield f"- **{name}**: {count} endpoints\n"
 
         if integrations:
-            content += "\n### Integrations\n"
+            yield "\n### Integrations\n"
             for name, count in sorted(integrations, key=lambda x: x[1], reverse=True):
-                content += f"- **{name}**: {count} endpoints\n"
+                yield f"- **{name}**: {count} endpoints\n"
 
         if devices:
-            content += "\n### Device Management\n"
+            yield "\n### Device Management\n"
             for name, count in sorted(devices, key=lambda x: x[1], reverse=True):
-                content += f"- **{name}**: {count} endpoints\n"
+                yield f"- **{name}**: {count} endpoints\n"
 
-        content += f"""
+        yield f"""
 ## Development Workflow
 
 ### Local Development Setup
@@ -860,27 +1031,172 @@ def sync_user_access():
 This comprehensive documentation serves as the authoritative resource for developers building on the Rhombus security platform, providing everything needed for successful API integration and application development.
 """
 
-        return content
+    def generate_llms_full_txt(self) -> str:
+        """Generate comprehensive llms-full.txt content."""
+        return "".join(self.iter_llms_full_txt())
+
+    def nav_categories(self) -> Dict[str, Dict]:
+        """Endpoint pages per navigation category, keyed by shard slug.
+
+        Categories are the groups ``count_endpoints_in_nav`` walks, except that the
+        action accordions (Create & Add, Get & Find, ...) are folded into the
+        nearest enclosing group. Each page is kept with its accordion name.
+        """
+        categories: Dict[str, Dict] = {}
+
+        def traverse(obj, category=None, action=""):
+            if isinstance(obj, dict):
+                group = obj.get("group")
+                if group in ACTION_GROUP_NAMES:
+                    action = group
+                elif group:
+                    category, action = group, ""
+
+                for page in obj.get("pages", []) if isinstance(obj.get("pages"), list) else []:
+                    if isinstance(page, str) and category and page.startswith(ENDPOINT_PAGE_ROOT + "/"):
+                        shard = categories.setdefault(category_slug(category), {"name": category, "pages": []})
+                        shard["pages"].append((action, page))
+
+                for value in obj.values():
+                    traverse(value, category, action)
+
+            elif isinstance(obj, list):
+                for item in obj:
+                    traverse(item, category, action)
+
+        traverse((self.snapshot.config or {}).get("navigation", {}))
+        return categories
+
+    def shard_source(self, pages: List[Tuple[str, str]]) -> str:
+        """Hash of a category's page list and each page's size and mtime."""
+        source = hashlib.sha256(f"{SHARD_VERSION}".encode())
+        for action, page in pages:
+            try:
+                stat = os.stat(self.base_dir / f"{page}.mdx")
+                stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                stamp = "missing"
+            source.update(f"\n{action}\t{page}\t{stamp}".encode())
+        return source.hexdigest()
+
+    def render_shard(self, name: str, pages: List[Tuple[str, str]]) -> str:
+        """llms.txt-style listing of one category's endpoints, grouped by action."""
+        lines = [
+            f"# {name} API Reference",
+            "",
+            f"> {len(pages)} endpoint(s) of the Rhombus API in the {name} category. "
+            "See /llms.txt for the project overview and /llms/manifest.json for the other categories.",
+        ]
+        current = None
+        for action, page in pages:
+            if action != current:
+                current = action
+                lines += ["", f"## {action or 'Endpoints'}", ""]
+            fields = self.read_frontmatter(self.base_dir / f"{page}.mdx")
+            entry = f"- [{fields.get('title') or page.rsplit('/', 1)[-1]}](/{page})"
+            if fields.get('openapi'):
+                entry += f": `{' '.join(fields['openapi'].split()[-2:])}`"
+            if fields.get('deprecated', '').lower() == 'true':
+                entry += " (deprecated)"
+            if fields.get('description'):
+                entry += f" - {fields['description']}"
+            lines.append(entry)
+        return "\n".join(lines) + "\n"
+
+    def write_shards(self) -> Dict[str, Dict]:
+        """Write llms/<category>.txt for every endpoint category, plus llms/manifest.json.
+
+        A shard is only re-rendered when its category's pages changed since the
+        last run (see SHARD_CACHE); shards of categories that disappeared are removed.
+        """
+        shard_dir = self.base_dir / SHARD_DIR
+        manifest_path = shard_dir / SHARD_MANIFEST
+        cache_path = self.base_dir / SHARD_CACHE
+        try:
+            manifest = PROFILER.load_json(manifest_path)
+            previous = manifest.get("shards", {}) if manifest.get("version") == SHARD_VERSION else {}
+            sources = PROFILER.load_json(cache_path) if previous else {}
+        except (OSError, ValueError):
+            previous, sources = {}, {}
+
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        shards: Dict[str, Dict] = {}
+        signatures: Dict[str, str] = {}
+        rendered = 0
+        for slug, category in self.nav_categories().items():
+            path = shard_dir / f"{slug}.txt"
+            signatures[slug] = self.shard_source(category["pages"])
+            if slug in previous and sources.get(slug) == signatures[slug] and path.exists():
+                shards[slug] = previous[slug]
+                continue
+
+            text = self.render_shard(category["name"], category["pages"])
+            data = text.encode('utf-8')
+            write_if_changed(path, data)
+            rendered += 1
+            shards[slug] = {
+                "name": category["name"],
+                "file": f"{SHARD_DIR}/{slug}.txt",
+                "endpoints": len(category["pages"]),
+                "bytes": len(data),
+                "tokens": estimate_tokens(text),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
 
-    def write_files(self):
-        """Generate and write both llms.txt files."""
+        for slug in previous.keys() - shards.keys():
+            stale = shard_dir / f"{slug}.txt"
+            if stale.exists():
+                stale.unlink()
+                print(f"   🗑️  Removed stale shard {stale}")
+
+        write_json_if_changed(manifest_path, {"version": SHARD_VERSION, "shards": shards}, indent=2)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_if_changed(cache_path, signatures, separators=(',', ':'))
+        print(f"✅ Shards: {len(shards)} categories in {shard_dir}/, "
+              f"{rendered} re-rendered, {len(shards) - rendered} reused "
+              f"(~{sum(shard['tokens'] for shard in shards.values())} tokens total)")
+        return shards
+
+    def write_file(self, name: str, chunks: Iterable[str], max_bytes: Optional[int] = None,
+                   max_tokens: Optional[int] = None) -> SectionBudget:
+        """Stream ``chunks`` into ``name`` under the docs dir, within the given budget."""
+        path = self.base_dir / name
+        with StreamingOutput(path, normalize=without_timestamp) as out:
+            budget = SectionBudget(out, max_bytes, max_tokens)
+            budget.feed(chunks)
+        print(f"✅ {'Written' if out.written else 'Unchanged'}: {path} "
+              f"({budget.chars} chars, ~{budget.tokens} tokens)")
+        if budget.truncated:
+            print(f"   ✂️  Budget reached; shortened {len(budget.truncated)} section(s): "
+                  + ", ".join(budget.truncated))
+        return budget
+
+    def write_files(self, max_bytes: Optional[int] = None, max_tokens: Optional[int] = None):
+        """Generate and write both llms.txt files.
+
+        The budget applies to llms-full.txt; llms.txt is always written in full.
+        """
         print("🔄 Generating LLMs context files...")
+        self.refresh()
+        with PROFILER.stage("snapshot"):
+            self.ensure_snapshot()
 
         # Generate llms.txt
         print("📝 Generating llms.txt (concise version)...")
-        llms_content = self.generate_llms_txt()
-        llms_path = self.base_dir / "llms.txt"
-        with open(llms_path, 'w') as f:
-            f.write(llms_content)
-        print(f"✅ Written: {llms_path} ({len(llms_content)} chars)")
+        with PROFILER.stage("llms.txt"):
+            self.write_file("llms.txt", self.iter_llms_txt())
 
         # Generate llms-full.txt
         print("📝 Generating llms-full.txt (comprehensive version)...")
-        llms_full_content = self.generate_llms_full_txt()
-        llms_full_path = self.base_dir / "llms-full.txt"
-        with open(llms_full_path, 'w') as f:
-            f.write(llms_full_content)
-        print(f"✅ Written: {llms_full_path} ({len(llms_full_content)} chars)")
+        with PROFILER.stage("llms-full.txt"):
+            self.write_file("llms-full.txt", self.iter_llms_full_txt(), max_bytes, max_tokens)
+
+        # Per-category shards of the endpoint reference
+        print("📝 Generating per-category shards...")
+        with PROFILER.stage("shards"):
+            self.write_shards()
+
+        self.frontmatter.save()
 
         print("\n🎉 LLMs context files updated successfully!")
         return True
@@ -888,23 +1204,27 @@ This comprehensive documentation serves as the authoritative resource for develo
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-bytes', type=int, metavar='N',
+                        help='Shorten llms-full.txt sections once N bytes of content are written')
+    parser.add_argument('--max-tokens', type=int, metavar='N',
+                        help='Same, for about N tokens (4 chars per token)')
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    PROFILER.configure(args, "update-llms-files")
+
     print("=" * 60)
     print("Rhombus Developer Documentation - LLMs File Generator")
     print("=" * 60)
     print()
 
-    # Determine the docs directory
-    if Path("docs").exists():
-        docs_dir = "docs"
-    else:
-        docs_dir = "."
-
-    print(f"📂 Working directory: {Path(docs_dir).absolute()}")
+    print(f"📂 Working directory: {DOCS_DIR.absolute()}")
     print()
 
     # Generate files
-    generator = LLMSFileGenerator(docs_dir)
-    success = generator.write_files()
+    generator = LLMSFileGenerator(DOCS_DIR)
+    success = generator.write_files(args.max_bytes, args.max_tokens)
+    PROFILER.finish()
 
     if success:
         print("\n✨ All done! Files are ready for commit.")
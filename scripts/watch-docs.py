@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Watch the docs sources and rerun only the pipeline stages a change affects.
+Tracks every input of the selected stages in pipeline_stages.py (the spec, openapi-split/,
+docs.json, the guides and the generated endpoint tree) by stat, waking on inotify events
+where the platform has them and polling otherwise. A burst of changes is debounced into
+one rebuild; after each stage only the outputs it actually changed mark later stages dirty.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from docs_paths import DOCS_DIR
+from pipeline_stages import STAGE_NAMES, Stage, has_wildcard, path_matches, run_stage, select_stages
+
+# Configuration
+DEFAULT_STAGES = ["split", "generate", "navigation", "llms"]
+SKIP_DIRS = {".git", "node_modules", "__pycache__"}
+# A steady stream of changes still rebuilds after this many debounce windows
+MAX_DEBOUNCE_WINDOWS = 10
+FAILURE_TAIL_LINES = 20
+
+# inotify(7) flags
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT = struct.Struct("iIII")
+
+Stamp = Tuple[int, int]
+
+
+class TreeSnapshot:
+    """``(mtime_ns, size)`` of every file under a set of docs-relative patterns."""
+
+    def __init__(self, root: Path, patterns: Iterable[str]):
+        self.root = root
+        self.patterns = sorted(set(patterns))
+        self.files: Dict[str, Dict[str, Stamp]] = {pattern: {} for pattern in self.patterns}
+
+    def _stat_tree(self, relative: str, found: Dict[str, Stamp]):
+        pending = [relative]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(self.root / current) as entries:
+                    for entry in entries:
+                        # Hidden entries are scratch space: split-openapi's .staging, atomic-write temp files
+                        if entry.name.startswith('.'):
+                            continue
+                        path = f"{current}/{entry.name}"
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in SKIP_DIRS:
+                                    pending.append(path)
+                                continue
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        found[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+
+    def _stat_pattern(self, pattern: str) -> Dict[str, Stamp]:
+        found: Dict[str, Stamp] = {}
+        if has_wildcard(pattern):
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if path_matches(entry.name, pattern) and entry.is_file():
+                        stat = entry.stat()
+                        found[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            return found
+        pattern = pattern.rstrip('/')
+        try:
+            stat = os.stat(self.root / pattern)
+        except OSError:
+            return found
+        if os.path.isdir(self.root / pattern):
+            self._stat_tree(pattern, found)
+        else:
+            found[pattern] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def scan(self, patterns: Optional[Iterable[str]] = None) -> Set[str]:
+        """Re-stat ``patterns`` (default: all) and return the paths that changed since the last scan."""
+        changed: Set[str] = set()
+        for pattern in self.patterns if patterns is None else patterns:
+            if pattern not in self.files:
+                continue
+            previous = self.files[pattern]
+            current = self._stat_pattern(pattern)
+            changed.update(path for path in previous.keys() | current.keys()
+                           if previous.get(path) != current.get(path))
+            self.files[pattern] = current
+        return changed
+
+    def patterns_for(self, path: str) -> Set[str]:
+        """Patterns whose files a change at ``path`` may affect."""
+        return {pattern for pattern in self.patterns if path_matches(path, pattern)
+                or (not has_wildcard(pattern) and pattern.startswith(path + '/'))}
+
+    def file_count(self) -> int:
+        return len({path for files in self.files.values() for path in files})
+
+
+class InotifyWatcher:
+    """Directory watches over the snapshot's patterns, via inotify(7) through ctypes."""
+
+    def __init__(self, snapshot: TreeSnapshot):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.snapshot = snapshot
+        self.directories: Dict[int, str] = {}
+
+        self.add("")
+        for pattern in snapshot.patterns:
+            if has_wildcard(pattern):
+                continue
+            # Every existing ancestor, so creating a missing directory is noticed
+            parts = pattern.rstrip('/').split('/')
+            for depth in range(1, len(parts)):
+                self.add("/".join(parts[:depth]))
+            if (snapshot.root / pattern).is_dir():
+                self.add_tree(pattern.rstrip('/'))
+
+    @staticmethod
+    def supported() -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            return hasattr(ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6"), "inotify_init1")
+        except OSError:
+            return False
+
+    def add(self, relative: str) -> bool:
+        path = self.snapshot.root / relative if relative else self.snapshot.root
+        if not path.is_dir():
+            return False
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.directories[wd] = relative
+        return True
+
+    def add_tree(self, relative: str):
+        pending = [relative]
+        while pending:
+            current = pending.pop()
+            if not self.add(current):
+                continue
+            try:
+                with os.scandir(self.snapshot.root / current) as entries:
+                    pending.extend(f"{current}/{entry.name}" for entry in entries
+                                   if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS
+                                   and not entry.name.startswith('.'))
+            except OSError:
+                continue
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """Paths touched within ``timeout`` seconds; None when events were lost and everything must be rescanned."""
+        ready, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not ready:
+            return set()
+        paths: Set[str] = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 1 << 16)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT.unpack_from(data, offset)
+                name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0').decode('utf-8', 'replace')
+                offset += EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                directory = self.directories.get(wd)
+                if directory is None:
+                    continue
+                path = f"{directory}/{name}" if directory and name else (name or directory)
+                paths.add(path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and self.snapshot.patterns_for(path):
+                    self.add_tree(path)
+        return None if overflow else paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ChangeSource:
+    """Blocks until watched files change, by inotify when available and stat polling otherwise."""
+
+    def __init__(self, snapshot: TreeSnapshot, interval: float, poll: bool):
+        self.snapshot = snapshot
+        self.interval = interval
+        self.notifier = None
+        if not poll and InotifyWatcher.supported():
+            try:
+                self.notifier = InotifyWatcher(snapshot)
+            except OSError as e:
+                print(f"⚠️  inotify unavailable ({e}), falling back to stat polling")
+
+    @property
+    def mode(self) -> str:
+        return f"inotify ({len(self.notifier.directories)} directories)" if self.notifier \
+            else f"stat polling every {self.interval:g}s"
+
+    def changes(self, timeout: float) -> Set[str]:
+        """Changed paths seen within ``timeout`` seconds (possibly none)."""
+        if self.notifier is None:
+            time.sleep(max(0.0, min(timeout, self.interval)))
+            return self.snapshot.scan()
+        touched = self.notifier.wait(timeout)
+        if touched is None:
+            return self.snapshot.scan()
+        patterns = {pattern for path in touched for pattern in self.snapshot.patterns_for(path)}
+        return self.snapshot.scan(patterns) if patterns else set()
+
+    def next_batch(self, debounce: float) -> Tuple[Set[str], float]:
+        """The next debounced burst of changes and when its first change was seen."""
+        changed: Set[str] = set()
+        while not changed:
+            changed = self.changes(self.interval)
+        first = time.perf_counter()
+        quiet_until = first + debounce
+        deadline = first + debounce * MAX_DEBOUNCE_WINDOWS
+        while True:
+            remaining = min(quiet_until, deadline) - time.perf_counter()
+            if remaining <= 0:
+                return changed, first
+            more = self.changes(remaining)
+            if more:
+                changed |= more
+                quiet_until = time.perf_counter() + debounce
+
+
+def describe(paths: Set[str], limit: int = 3) -> str:
+    shown = sorted(paths)[:limit]
+    return ", ".join(shown) + (f" and {len(paths) - limit} more" if len(paths) > limit else "")
+
+
+def rebuild(stages: List[Stage], changed: Set[str], snapshot: TreeSnapshot, verbose: bool,
+            everything: bool = False) -> bool:
+    """Run the stages ``changed`` affects, and the later stages their outputs affect, in order."""
+    dirty = {stage.name for stage in stages if everything or any(stage.reads(path) for path in changed)}
+    for index, stage in enumerate(stages):
+        if stage.name not in dirty:
+            continue
+        print(f"   ▶ {stage.name:<11}", end="", flush=True)
+        ok, seconds, output = run_stage(stage, quiet=not verbose)
+        written = snapshot.scan(stage.outputs)
+        if not ok:
+            print(f" ❌ failed after {seconds:.2f}s")
+            for line in output.rstrip().splitlines()[-FAILURE_TAIL_LINES:]:
+                print(f"     {line}")
+            return False
+        print(f" ✅ {seconds:.2f}s, {len(written)} file(s) changed")
+        for later in stages[index + 1:]:
+            if later.name not in dirty and any(later.reads(path) for path in written):
+                dirty.add(later.name)
+    return True
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stages', nargs='+', choices=STAGE_NAMES, default=DEFAULT_STAGES,
+                        help='Pipeline stages to keep up to date')
+    parser.add_argument('--interval', type=float, default=0.5, help='Seconds between stat scans when polling')
+    parser.add_argument('--debounce', type=float, default=0.2,
+                        help='Quiet period that ends a burst of changes before rebuilding')
+    parser.add_argument('--poll', action='store_true', help='Use stat polling even where inotify is available')
+    parser.add_argument('--initial-build', action='store_true', help='Run every selected stage once at startup')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show the output of every stage')
+    args = parser.parse_args()
+
+    stages = select_stages(args.stages)
+    snapshot = TreeSnapshot(DOCS_DIR, [p for stage in stages for p in stage.inputs + stage.outputs])
+    started = time.perf_counter()
+    snapshot.scan()
+    print(f"👀 Watching {snapshot.file_count()} files for {', '.join(s.name for s in stages)} "
+          f"(indexed in {time.perf_counter() - started:.2f}s)")
+
+    if args.initial_build:
+        print("\n🔨 Initial build")
+        started = time.perf_counter()
+        rebuild(stages, set(), snapshot, args.verbose, everything=True)
+        print(f"⏱️  Built in {time.perf_counter() - started:.2f}s")
+
+    source = ChangeSource(snapshot, args.interval, args.poll)
+    print(f"   Using {source.mode}, debounce {args.debounce:g}s; press Ctrl+C to stop\n")
+    try:
+        while True:
+            changed, first_seen = source.next_batch(args.debounce)
+            print(f"🔄 {len(changed)} change(s): {describe(changed)}")
+            if not any(stage.reads(path) for stage in stages for path in changed):
+                print("   No stage reads these files\n")
+                continue
+            ok = rebuild(stages, changed, snapshot, args.verbose)
+            print(f"⏱️  {'Rebuilt' if ok else 'Stopped'} in {time.perf_counter() - first_seen:.2f}s "
+                  f"since the first change\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        if source.notifier:
+            source.notifier.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())